@@ -4,7 +4,7 @@ from pathlib import Path
 from dataclasses import dataclass
 
 # Supported file formats
-SUPPORTED_FORMATS = [".pdb", ".cif"]
+SUPPORTED_FORMATS = [".pdb", ".cif", ".bcif"]
 
 # Default window dimensions
 DEFAULT_WINDOW_WIDTH = 1200
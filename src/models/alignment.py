@@ -1,6 +1,7 @@
 """Structure alignment using biotite superimposition."""
 
 import logging
+from typing import Optional
 
 import biotite.structure as struc
 import numpy as np
@@ -12,6 +13,8 @@ def align_on_target_chain(
     fixed: struc.AtomArray,
     mobile: struc.AtomArray,
     chain_id: str,
+    fixed_ca_mask: Optional[np.ndarray] = None,
+    mobile_ca_mask: Optional[np.ndarray] = None,
 ) -> tuple[struc.AtomArray, float]:
     """Align a mobile structure onto a fixed structure using a shared chain.
 
@@ -23,6 +26,8 @@ def align_on_target_chain(
         fixed: Reference structure (stays in place).
         mobile: Structure to be aligned (transformed).
         chain_id: Chain ID present in both structures to align on.
+        fixed_ca_mask: Precomputed CA atom mask of the fixed structure.
+        mobile_ca_mask: Precomputed CA atom mask of the mobile structure.
 
     Returns:
         Tuple of (aligned mobile structure, RMSD on alignment chain CAs).
@@ -30,13 +35,14 @@ def align_on_target_chain(
     Raises:
         ValueError: If chain is missing from either structure or CA counts differ.
     """
+    if fixed_ca_mask is None:
+        fixed_ca_mask = fixed.atom_name == "CA"
+    if mobile_ca_mask is None:
+        mobile_ca_mask = mobile.atom_name == "CA"
+
     # Extract CA atoms for the alignment chain
-    fixed_chain_ca = fixed[
-        (fixed.chain_id == chain_id) & (fixed.atom_name == "CA")
-    ]
-    mobile_chain_ca = mobile[
-        (mobile.chain_id == chain_id) & (mobile.atom_name == "CA")
-    ]
+    fixed_chain_ca = fixed[(fixed.chain_id == chain_id) & fixed_ca_mask]
+    mobile_chain_ca = mobile[(mobile.chain_id == chain_id) & mobile_ca_mask]
 
     if len(fixed_chain_ca) == 0:
         raise ValueError(f"Chain '{chain_id}' not found in reference structure")
@@ -62,3 +68,121 @@ def align_on_target_chain(
     )
 
     return aligned_mobile, float(rmsd)
+
+
+def align_many_on_target_chain(
+    fixed: struc.AtomArray,
+    mobiles: list[struc.AtomArray],
+    chain_id: str,
+    fixed_ca_mask: Optional[np.ndarray] = None,
+    mobile_ca_masks: Optional[list[Optional[np.ndarray]]] = None,
+    rmsd_cutoff: Optional[float] = None,
+) -> tuple[list[Optional[struc.AtomArray]], np.ndarray, list[Optional[str]]]:
+    """Align several mobile structures onto one fixed structure at once.
+
+    Same superposition as align_on_target_chain, but the CA coordinates of
+    all alignable structures are stacked into one (K, N, 3) array so the
+    centering, covariance, SVD and RMSD run as batched NumPy operations
+    rather than once per structure.
+
+    Args:
+        fixed: Reference structure (stays in place).
+        mobiles: Structures to be aligned (transformed).
+        chain_id: Chain ID present in all structures to align on.
+        fixed_ca_mask: Precomputed CA atom mask of the fixed structure.
+        mobile_ca_masks: Precomputed CA atom masks of the mobile structures,
+            None entries being computed here.
+        rmsd_cutoff: If given, structures whose RMSD provably exceeds it are
+            not superimposed. The bound used is the difference of the radii
+            of gyration of the two CA sets, which no rotation can reduce.
+
+    Returns:
+        Tuple of (aligned structures, RMSDs, error messages), each with one
+        entry per mobile structure. Structures that cannot be aligned have
+        None, NaN and the reason, respectively. Structures skipped by
+        rmsd_cutoff have None, their RMSD lower bound and None.
+
+    Raises:
+        ValueError: If the chain is missing from the fixed structure.
+    """
+    if fixed_ca_mask is None:
+        fixed_ca_mask = fixed.atom_name == "CA"
+    fixed_coord = fixed.coord[(fixed.chain_id == chain_id) & fixed_ca_mask]
+    if len(fixed_coord) == 0:
+        raise ValueError(f"Chain '{chain_id}' not found in reference structure")
+
+    aligned: list[Optional[struc.AtomArray]] = [None] * len(mobiles)
+    rmsds = np.full(len(mobiles), np.nan)
+    errors: list[Optional[str]] = [None] * len(mobiles)
+
+    # Collect the alignment CAs of every structure that matches the reference
+    valid: list[int] = []
+    mobile_coords: list[np.ndarray] = []
+    for i, mobile in enumerate(mobiles):
+        mask = mobile_ca_masks[i] if mobile_ca_masks is not None else None
+        if mask is None:
+            mask = mobile.atom_name == "CA"
+        coord = mobile.coord[(mobile.chain_id == chain_id) & mask]
+        if len(coord) == 0:
+            errors[i] = f"Chain '{chain_id}' not found in mobile structure"
+        elif len(coord) != len(fixed_coord):
+            errors[i] = (
+                f"CA atom count mismatch on chain '{chain_id}': "
+                f"reference has {len(fixed_coord)}, mobile has {len(coord)}"
+            )
+        else:
+            valid.append(i)
+            mobile_coords.append(coord)
+
+    if not valid:
+        return aligned, rmsds, errors
+
+    # Kabsch on the whole stack: rotations R (K, 3, 3) such that
+    # (mobile - mobile_center) @ R + fixed_center fits the reference
+    fixed_center = fixed_coord.mean(axis=0, dtype=np.float64)
+    fixed_centered = fixed_coord - fixed_center
+    stack = np.stack(mobile_coords).astype(np.float64)
+    mobile_centers = stack.mean(axis=1)
+    stack -= mobile_centers[:, None, :]
+
+    if rmsd_cutoff is not None:
+        # |Rg(mobile) - Rg(fixed)| <= RMSD for any superposition, so the
+        # structures above the cutoff by this bound skip the SVD entirely
+        fixed_rg = np.sqrt((fixed_centered ** 2).sum(axis=-1).mean())
+        mobile_rg = np.sqrt((stack ** 2).sum(axis=-1).mean(axis=-1))
+        lower_bounds = np.abs(mobile_rg - fixed_rg)
+        rejected = lower_bounds > rmsd_cutoff
+        if rejected.any():
+            rmsds[np.asarray(valid)[rejected]] = lower_bounds[rejected]
+            keep = ~rejected
+            valid = [i for i, k in zip(valid, keep) if k]
+            stack = stack[keep]
+            mobile_centers = mobile_centers[keep]
+            if not valid:
+                return aligned, rmsds, errors
+
+    covariance = np.einsum("kni,nj->kij", stack, fixed_centered)
+    u, _, vt = np.linalg.svd(covariance)
+    # Flip the last axis where needed so every R is a proper rotation
+    sign = np.sign(np.linalg.det(u @ vt))
+    u[:, :, -1] *= sign[:, None]
+    rotations = u @ vt
+
+    fitted = stack @ rotations
+    rmsds[valid] = np.sqrt(
+        ((fitted - fixed_centered) ** 2).sum(axis=-1).mean(axis=-1)
+    )
+
+    for k, i in enumerate(valid):
+        aligned_mobile = mobiles[i].copy()
+        aligned_mobile.coord = (
+            (mobiles[i].coord - mobile_centers[k]) @ rotations[k] + fixed_center
+        ).astype(mobiles[i].coord.dtype)
+        aligned[i] = aligned_mobile
+
+    logger.debug(
+        f"Aligned {len(valid)} of {len(mobiles)} structures on chain {chain_id}: "
+        f"{len(fixed_coord)} CA atoms each"
+    )
+
+    return aligned, rmsds, errors
@@ -124,15 +124,11 @@ class TargetDesignation:
         if not self.target_chains:
             return None
 
-        sequence = protein.get_sequence()
+        chain_seqs = protein.get_chain_sequences()
         target_seqs = []
 
         for chain in sorted(self.target_chains):
-            chain_seq = "".join(
-                r["one_letter"]
-                for r in sequence
-                if r["chain"] == chain
-            )
+            chain_seq = chain_seqs.get(chain, "")
             if chain_seq:
                 target_seqs.append(f"{chain}:{chain_seq}")
 
@@ -366,10 +362,7 @@ class GroupingManager:
         Returns:
             Hash of the chain sequence.
         """
-        sequence = protein.get_sequence()
-        chain_seq = "".join(
-            r["one_letter"] for r in sequence if r["chain"] == chain_id
-        )
+        chain_seq = protein.get_chain_sequences().get(chain_id, "")
         chain_hash = hashlib.md5(f"{chain_id}:{chain_seq}".encode()).hexdigest()[:12]
 
         # Add to chain index
@@ -396,10 +389,7 @@ class GroupingManager:
             List of file paths with matching chain sequence.
         """
         # Get reference chain sequence
-        sequence = reference_protein.get_sequence()
-        chain_seq = "".join(
-            r["one_letter"] for r in sequence if r["chain"] == chain_id
-        )
+        chain_seq = reference_protein.get_chain_sequences().get(chain_id, "")
         if not chain_seq:
             return []
 
@@ -421,12 +411,8 @@ class GroupingManager:
             if protein is None:
                 continue
 
-            seq = protein.get_sequence()
-            for test_chain in protein.get_chains():
-                test_seq = "".join(r["one_letter"] for r in seq if r["chain"] == test_chain)
-                if test_seq == chain_seq:
-                    matches.append(file_path)
-                    break
+            if chain_seq in protein.get_chain_sequences().values():
+                matches.append(file_path)
 
         return matches
 
@@ -439,21 +425,12 @@ class GroupingManager:
         Returns:
             Hash string representing the protein's chain sequences.
         """
-        sequence = protein.get_sequence()
-
-        # Group residues by chain
-        chains: dict[str, list[str]] = {}
-        for res in sequence:
-            chain = res["chain"]
-            if chain not in chains:
-                chains[chain] = []
-            chains[chain].append(res["one_letter"])
+        chains = protein.get_chain_sequences()
 
         # Create sorted key from (chain_id, sequence) pairs
         chain_seqs = []
         for chain_id in sorted(chains.keys()):
-            seq = "".join(chains[chain_id])
-            chain_seqs.append(f"{chain_id}:{seq}")
+            chain_seqs.append(f"{chain_id}:{chains[chain_id]}")
 
         combined = "|".join(chain_seqs)
         return hashlib.md5(combined.encode()).hexdigest()[:12]
@@ -468,9 +445,9 @@ class GroupingManager:
         Returns:
             Truncated sequence string.
         """
-        sequence = protein.get_sequence()
-        seq_str = "".join(r["one_letter"] for r in sequence[:max_len])
-        if len(sequence) > max_len:
+        one_letters = protein.get_sequence_array().one_letter
+        seq_str = "".join(one_letters[:max_len].tolist())
+        if len(one_letters) > max_len:
             seq_str += "..."
         return seq_str
 
@@ -818,12 +795,10 @@ class GroupingManager:
                 continue
 
             # Hash the binder chain sequences
-            sequence = protein.get_sequence()
+            chain_seqs = protein.get_chain_sequences()
             binder_seqs = []
             for chain in sorted(designation.binder_chains):
-                chain_seq = "".join(
-                    r["one_letter"] for r in sequence if r["chain"] == chain
-                )
+                chain_seq = chain_seqs.get(chain, "")
                 if chain_seq:
                     binder_seqs.append(f"{chain}:{chain_seq}")
 
@@ -1025,13 +1000,11 @@ class GroupingManager:
         structure_chains: dict[str, dict[str, str]] = {}  # file_path -> {chain_id -> seq_hash}
 
         for file_path, protein in protein_items:
-            sequence = protein.get_sequence()
+            chain_seqs = protein.get_chain_sequences()
             chains_map: dict[str, str] = {}
 
             for chain_id in protein.get_chains():
-                chain_seq = "".join(
-                    r["one_letter"] for r in sequence if r["chain"] == chain_id
-                )
+                chain_seq = chain_seqs.get(chain_id, "")
                 if not chain_seq:
                     continue
                 seq_hash = hashlib.md5(chain_seq.encode()).hexdigest()[:12]
@@ -1116,10 +1089,7 @@ class GroupingManager:
             return None
 
         # Get chain sequence info for metadata
-        sequence = reference_protein.get_sequence()
-        chain_seq = "".join(
-            r["one_letter"] for r in sequence if r["chain"] == chain_id
-        )
+        chain_seq = reference_protein.get_chain_sequences().get(chain_id, "")
 
         metadata = {
             "source_chain": chain_id,
@@ -20,12 +20,91 @@ THREE_TO_ONE = {
     "PYL": "O",  # Pyrrolysine
 }
 
+# THREE_TO_ONE as sorted lookup arrays for mapping whole name arrays at once
+_RES_NAMES = np.array(sorted(THREE_TO_ONE))
+_ONE_LETTERS = np.array([THREE_TO_ONE[name] for name in _RES_NAMES])
+
+
+def to_one_letter(res_names: np.ndarray) -> np.ndarray:
+    """Map an array of three-letter residue names to one-letter codes.
+
+    Args:
+        res_names: Array of three-letter residue names.
+
+    Returns:
+        Array of one-letter codes, 'X' for names not in THREE_TO_ONE.
+    """
+    res_names = np.asarray(res_names)
+    idx = np.searchsorted(_RES_NAMES, res_names)
+    np.minimum(idx, len(_RES_NAMES) - 1, out=idx)
+    return np.where(_RES_NAMES[idx] == res_names, _ONE_LETTERS[idx], "X")
+
+
+def _binder_residue_contacts(
+    structure: AtomArray,
+    binder_chain: str,
+    target_chains: list[str] | None,
+    distance_cutoff: float,
+    aa_mask: np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Count target atoms near each binder residue.
+
+    Only the target atoms go into a KD-tree; each binder atom is then
+    queried for the number of target atoms within the cutoff, so no
+    per-pair index lists are built.
+
+    Args:
+        structure: Biotite AtomArray containing the protein complex.
+        binder_chain: Chain identifier for the binder protein.
+        target_chains: Chain identifiers for the target proteins.
+            Defaults to ['A'].
+        distance_cutoff: Maximum distance (Å) for interface contacts.
+        aa_mask: Precomputed filter_amino_acids(structure) mask, or None.
+
+    Returns:
+        Tuple of (residue IDs, residue names, contact counts) for binder
+        residues with at least one contact, in binder atom order; or None
+        if the binder or the target has no amino acid atoms.
+    """
+    if target_chains is None:
+        target_chains = ["A"]
+
+    # Filter to amino acids only
+    if aa_mask is None:
+        aa_mask = filter_amino_acids(structure)
+    aa_structure = structure[aa_mask]
+
+    binder_atoms = aa_structure[aa_structure.chain_id == binder_chain]
+    if len(binder_atoms) == 0:
+        return None
+
+    target_atoms = aa_structure[np.isin(aa_structure.chain_id, target_chains)]
+    if len(target_atoms) == 0:
+        return None
+
+    target_tree = cKDTree(target_atoms.coord)
+    atom_counts = target_tree.query_ball_point(
+        binder_atoms.coord, distance_cutoff, return_length=True
+    )
+
+    # Sum atom contacts per residue, keeping residues in first-contact order
+    in_contact = atom_counts > 0
+    res_ids = binder_atoms.res_id[in_contact]
+    unique_ids, first, inverse = np.unique(
+        res_ids, return_index=True, return_inverse=True
+    )
+    counts = np.bincount(inverse, weights=atom_counts[in_contact]).astype(np.int64)
+    order = np.argsort(first, kind="stable")
+    res_names = binder_atoms.res_name[in_contact][first[order]]
+    return unique_ids[order], res_names, counts[order]
+
 
 def get_interface_residues(
     structure: AtomArray,
     binder_chain: str = "B",
     target_chains: list[str] | None = None,
     distance_cutoff: float = 4.0,
+    aa_mask: np.ndarray | None = None,
 ) -> dict[int, str]:
     """Identify interface residues between binder and target chains.
 
@@ -38,57 +117,62 @@ def get_interface_residues(
         binder_chain: Chain identifier for the binder protein. Defaults to 'B'.
         target_chains: Chain identifiers for the target proteins. Defaults to ['A'].
         distance_cutoff: Maximum distance (Å) for interface contacts. Defaults to 4.0.
+        aa_mask: Precomputed filter_amino_acids(structure) mask, for callers
+            that query the same structure repeatedly.
 
     Returns:
         Dictionary mapping binder residue numbers (int) to single-letter amino
         acid codes (str) for all residues with atoms within the distance cutoff
         of the target.
     """
-    if target_chains is None:
-        target_chains = ["A"]
-
-    # Filter to amino acids only
-    aa_mask = filter_amino_acids(structure)
-    aa_structure = structure[aa_mask]
-
-    # Get atoms for binder chain
-    binder_mask = aa_structure.chain_id == binder_chain
-    binder_atoms = aa_structure[binder_mask]
-
-    if len(binder_atoms) == 0:
-        return {}
-
-    binder_coords = binder_atoms.coord
-
-    # Get atoms for target chains
-    target_mask = np.isin(aa_structure.chain_id, target_chains)
-    target_atoms = aa_structure[target_mask]
-
-    if len(target_atoms) == 0:
+    contacts = _binder_residue_contacts(
+        structure, binder_chain, target_chains, distance_cutoff, aa_mask
+    )
+    if contacts is None:
         return {}
 
-    target_coords = target_atoms.coord
+    res_ids, res_names, _ = contacts
+    return {
+        res_id: THREE_TO_ONE.get(res_name, "X")
+        for res_id, res_name in zip(res_ids.tolist(), res_names.tolist())
+    }
 
-    # Build KD trees for efficient spatial queries
-    binder_tree = cKDTree(binder_coords)
-    target_tree = cKDTree(target_coords)
 
-    # Query for pairs of atoms within the distance cutoff
-    pairs = binder_tree.query_ball_tree(target_tree, distance_cutoff)
+def get_interface_residues_and_contacts(
+    structure: AtomArray,
+    binder_chain: str = "B",
+    target_chains: list[str] | None = None,
+    distance_cutoff: float = 4.0,
+    aa_mask: np.ndarray | None = None,
+) -> tuple[dict[int, str], dict[int, int]]:
+    """Get interface residues and their contact counts from one search.
 
-    # Collect interface residues
-    interface_residues: dict[int, str] = {}
+    Equivalent to calling get_interface_residues and count_interface_contacts
+    with the same arguments, at the cost of one neighbor search.
 
-    for binder_idx, close_indices in enumerate(pairs):
-        if close_indices:  # Has contacts with target
-            res_id = int(binder_atoms[binder_idx].res_id)
-            res_name = binder_atoms[binder_idx].res_name
+    Args:
+        structure: Biotite AtomArray containing the protein complex.
+        binder_chain: Chain identifier for the binder protein.
+        target_chains: Chain identifiers for the target proteins.
+        distance_cutoff: Maximum distance (Å) for interface contacts.
+        aa_mask: Precomputed filter_amino_acids(structure) mask.
 
-            # Convert to single-letter code
-            aa_code = THREE_TO_ONE.get(res_name, "X")
-            interface_residues[res_id] = aa_code
+    Returns:
+        Tuple of (residue ID -> single-letter code, residue ID -> contact count).
+    """
+    contacts = _binder_residue_contacts(
+        structure, binder_chain, target_chains, distance_cutoff, aa_mask
+    )
+    if contacts is None:
+        return {}, {}
 
-    return interface_residues
+    res_ids, res_names, counts = contacts
+    res_ids = res_ids.tolist()
+    residues = {
+        res_id: THREE_TO_ONE.get(res_name, "X")
+        for res_id, res_name in zip(res_ids, res_names.tolist())
+    }
+    return residues, dict(zip(res_ids, counts.tolist()))
 
 
 def get_bidirectional_interface(
@@ -170,6 +254,7 @@ def count_interface_contacts(
     binder_chain: str = "B",
     target_chains: list[str] | None = None,
     distance_cutoff: float = 4.0,
+    aa_mask: np.ndarray | None = None,
 ) -> dict[int, int]:
     """Count the number of atomic contacts for each interface residue.
 
@@ -178,44 +263,16 @@ def count_interface_contacts(
         binder_chain: Chain identifier for the binder protein.
         target_chains: Chain identifiers for the target proteins.
         distance_cutoff: Maximum distance (Å) for interface contacts.
+        aa_mask: Precomputed filter_amino_acids(structure) mask.
 
     Returns:
         Dictionary mapping residue IDs to contact counts.
     """
-    if target_chains is None:
-        target_chains = ["A"]
-
-    # Filter to amino acids only
-    aa_mask = filter_amino_acids(structure)
-    aa_structure = structure[aa_mask]
-
-    # Get atoms for binder chain
-    binder_mask = aa_structure.chain_id == binder_chain
-    binder_atoms = aa_structure[binder_mask]
-
-    if len(binder_atoms) == 0:
-        return {}
-
-    # Get atoms for target chains
-    target_mask = np.isin(aa_structure.chain_id, target_chains)
-    target_atoms = aa_structure[target_mask]
-
-    if len(target_atoms) == 0:
+    contacts = _binder_residue_contacts(
+        structure, binder_chain, target_chains, distance_cutoff, aa_mask
+    )
+    if contacts is None:
         return {}
 
-    # Build KD trees
-    binder_tree = cKDTree(binder_atoms.coord)
-    target_tree = cKDTree(target_atoms.coord)
-
-    # Query for pairs
-    pairs = binder_tree.query_ball_tree(target_tree, distance_cutoff)
-
-    # Count contacts per residue
-    contact_counts: dict[int, int] = {}
-
-    for binder_idx, close_indices in enumerate(pairs):
-        if close_indices:
-            res_id = int(binder_atoms[binder_idx].res_id)
-            contact_counts[res_id] = contact_counts.get(res_id, 0) + len(close_indices)
-
-    return contact_counts
+    res_ids, _, counts = contacts
+    return dict(zip(res_ids.tolist(), counts.tolist()))
@@ -4,7 +4,13 @@ from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
-from biotite.structure import AtomArray, sasa, filter_amino_acids, get_residues
+from biotite.structure import (
+    AtomArray,
+    sasa,
+    filter_amino_acids,
+    get_residues,
+    get_residue_starts,
+)
 
 
 # Maximum accessible surface area for each amino acid (Å²)
@@ -148,13 +154,12 @@ def extract_plddt(structure: AtomArray) -> MetricResult:
         )
 
     # Get CA atoms for per-residue pLDDT
-    # Use int() to convert numpy.int64 to Python int for JSON serialization
+    # tolist() yields Python ints/floats for JSON serialization
     ca_mask = aa_structure.atom_name == "CA"
-    ca_atoms = aa_structure[ca_mask]
-
-    plddt_values: dict[int, float] = {}
-    for res_id, b_factor in zip(ca_atoms.res_id, ca_atoms.b_factor):
-        plddt_values[int(res_id)] = float(b_factor)
+    plddt_values: dict[int, float] = dict(zip(
+        aa_structure.res_id[ca_mask].tolist(),
+        aa_structure.b_factor[ca_mask].tolist(),
+    ))
 
     values_list = list(plddt_values.values())
     return MetricResult(
@@ -203,18 +208,17 @@ def extract_bfactor(structure: AtomArray) -> MetricResult:
             unit="Ų",
         )
 
-    # Average B-factor per residue
-    # Use int() to convert numpy.int64 to Python int for JSON serialization
-    residue_bfactors: dict[int, list[float]] = {}
-    for res_id, b_factor in zip(aa_structure.res_id, aa_structure.b_factor):
-        res_id_int = int(res_id)
-        if res_id_int not in residue_bfactors:
-            residue_bfactors[res_id_int] = []
-        residue_bfactors[res_id_int].append(float(b_factor))
-
-    bfactor_values: dict[int, float] = {
-        res_id: float(np.mean(bfs)) for res_id, bfs in residue_bfactors.items()
-    }
+    # Average B-factor per residue id; residues keep their order of first
+    # appearance
+    res_ids, first, inverse = np.unique(
+        aa_structure.res_id, return_index=True, return_inverse=True
+    )
+    means = np.bincount(inverse, weights=aa_structure.b_factor) / np.bincount(inverse)
+    order = np.argsort(first)
+    # tolist() yields Python ints/floats for JSON serialization
+    bfactor_values: dict[int, float] = dict(
+        zip(res_ids[order].tolist(), means[order].tolist())
+    )
 
     values_list = list(bfactor_values.values())
     return MetricResult(
@@ -278,40 +282,57 @@ def calculate_secondary_structure(structure: AtomArray) -> dict[int, str]:
     return ss_map
 
 
-def get_residue_info(structure: AtomArray) -> list[dict[str, Any]]:
-    """Get basic information for all residues.
+def get_residue_arrays(
+    structure: AtomArray, aa_mask: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the id, name and chain of every amino acid residue as arrays.
+
+    Residues that share an id and chain with an earlier residue (e.g.
+    insertion codes) are collapsed into the first one.
 
     Args:
         structure: Biotite AtomArray structure.
+        aa_mask: Precomputed filter_amino_acids(structure) mask.
 
     Returns:
-        List of dicts with residue information (id, name, chain).
+        Tuple of (residue ids, residue names, chain ids) in structure order.
     """
-    aa_mask = filter_amino_acids(structure)
+    if aa_mask is None:
+        aa_mask = filter_amino_acids(structure)
     aa_structure = structure[aa_mask]
 
-    if len(aa_structure) == 0:
-        return []
-
-    # Get unique residues
-    seen = set()
-    residues = []
-
-    for res_id, res_name, chain_id in zip(
-        aa_structure.res_id,
-        aa_structure.res_name,
-        aa_structure.chain_id
-    ):
-        key = (int(res_id), chain_id)
-        if key not in seen:
-            seen.add(key)
-            residues.append({
-                "id": int(res_id),
-                "name": res_name,
-                "chain": chain_id,
-            })
-
-    return residues
+    # One atom per residue (the residue starts) instead of every atom
+    starts = get_residue_starts(aa_structure)
+    res_ids = aa_structure.res_id[starts]
+    res_names = aa_structure.res_name[starts]
+    chain_ids = aa_structure.chain_id[starts]
+
+    # First occurrence of each (chain, id) pair, kept in structure order
+    keys = np.rec.fromarrays([chain_ids, res_ids], names="chain,id")
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    return res_ids[first], res_names[first], chain_ids[first]
+
+
+def get_residue_info(
+    structure: AtomArray, aa_mask: np.ndarray | None = None
+) -> list[dict[str, Any]]:
+    """Get basic information for all residues.
+
+    Args:
+        structure: Biotite AtomArray structure.
+        aa_mask: Precomputed filter_amino_acids(structure) mask.
+
+    Returns:
+        List of dicts with residue information (id, name, chain).
+    """
+    res_ids, res_names, chain_ids = get_residue_arrays(structure, aa_mask)
+    return [
+        {"id": res_id, "name": res_name, "chain": chain_id}
+        for res_id, res_name, chain_id in zip(
+            res_ids.tolist(), res_names.tolist(), chain_ids.tolist()
+        )
+    ]
 
 
 # Registry of available metrics
@@ -1,16 +1,227 @@
 """Data models for protein metrics storage and loading."""
 
+import bisect
 import csv
+import io
+import itertools
 import json
 import logging
+import math
+import mmap
+import os
+import re
+import sys
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing and serialization
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Byte-level checks run before parsing a candidate single-protein JSON file:
+# the root must be an object, and a file with no digit cannot hold a metric
+_JSON_OBJECT_START = re.compile(rb"(?:\xef\xbb\xbf)?[ \t\r\n]*\{")
+_ANY_DIGIT = re.compile(rb"[0-9]")
+
+# Decimal/scientific numbers plus the inf/nan spellings float() accepts
+_NUMBER = re.compile(
+    r"[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan)",
+    re.IGNORECASE,
+)
+
+# Exact JSON scalar types accepted as numbers (bool is deliberately absent)
+_NUMERIC_TYPES = frozenset({int, float})
+
+# JSON object keys that never hold metrics, skipped at every nesting level
+_SKIP_METRIC_KEYS = frozenset({"name", "sequence_name", "job_id", "file_path", "version", "date"})
+
+# Keys that label entries in a list of dicts rather than hold metrics
+_LABEL_KEYS = frozenset({
+    "chain1", "chain2", "chain_1", "chain_2", "chain", "name", "label", "id", "type",
+})
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed.
+
+    orjson rejects the NaN/Infinity tokens that json.dump writes by default,
+    so documents it cannot parse are retried with the json module.
+
+    Args:
+        data: Raw UTF-8 encoded JSON document.
+
+    Returns:
+        Parsed JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Check whether a JSON-serializable value contains a NaN or infinity.
+
+    Args:
+        obj: Value to check.
+
+    Returns:
+        True if any float in the value is not finite.
+    """
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    if isinstance(obj, (float, np.floating)):
+        return not math.isfinite(obj)
+    return False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a value to indented UTF-8 JSON, using orjson when installed.
+
+    orjson writes NaN and infinity as null, so values containing them are
+    serialized by the json module, which keeps them as NaN/Infinity tokens
+    that load back unchanged.
+
+    Args:
+        obj: Value to serialize.
+
+    Returns:
+        JSON document as bytes.
+    """
+    if orjson is not None and not _has_non_finite(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _as_float(value: Any) -> float | None:
+    """Convert a JSON scalar to float if it is a plain int or float.
+
+    Uses exact type checks rather than isinstance, which is cheaper on the
+    per-field hot path and naturally rejects bools (a subclass of int).
+
+    Args:
+        value: Parsed JSON value.
+
+    Returns:
+        The value as a float, or None if it is not numeric.
+    """
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return float(value)
+    return None
+
+
+def _parse_float_column(cells: list[str] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a column of CSV cells to floats.
 
-@dataclass
+    The whole column is converted by NumPy in one call. Columns that contain
+    non-numeric text are first narrowed to the cells that look like numbers,
+    so placeholders such as "NA" never reach float() and raise.
+
+    Args:
+        cells: Raw cell strings for one column.
+
+    Returns:
+        Tuple of (float values, validity mask). The mask marks the cells that
+        held a number, so a literal "nan" cell is kept apart from an empty or
+        non-numeric one; both are NaN in the values.
+    """
+    values = np.full(len(cells), np.nan)
+    if len(cells) == 0:
+        return values, np.zeros(0, dtype=bool)
+    stripped = np.char.strip(np.array(cells, dtype=np.str_))
+    valid = stripped != ""
+    try:
+        values[valid] = stripped[valid].astype(np.float64)
+    except ValueError:
+        valid = np.fromiter(
+            (_NUMBER.fullmatch(cell) is not None for cell in stripped.tolist()),
+            dtype=bool,
+            count=len(stripped),
+        )
+        values[valid] = stripped[valid].astype(np.float64)
+    return values, valid
+
+
+def _summarize_numeric_list(values: list) -> tuple[float, float, float] | None:
+    """Compute mean, min and max of a JSON list if every item is a number.
+
+    The item types are collected with map(type, ...), which runs in C, and
+    compared against int/float exactly (rejecting bools and numeric strings,
+    which np.fromiter would silently coerce). The reductions then run on one
+    float array instead of three Python loops over boxed floats.
+
+    Args:
+        values: Non-empty parsed JSON list.
+
+    Returns:
+        Tuple of (mean, min, max), or None if any item is not an int/float.
+    """
+    if not set(map(type, values)) <= _NUMERIC_TYPES:
+        return None
+    array = np.fromiter(values, dtype=np.float64, count=len(values))
+    return float(array.mean()), float(array.min()), float(array.max())
+
+
+def _and_in_range(
+    mask: np.ndarray,
+    column: np.ndarray,
+    min_val: float | None,
+    max_val: float | None,
+    scratch: np.ndarray | None = None,
+) -> None:
+    """Narrow a row mask in place to rows whose value lies within bounds.
+
+    Only the bounds that are set are compared, and each comparison writes
+    into a reused scratch buffer instead of allocating a temporary array.
+
+    Args:
+        mask: Boolean row mask, updated in place.
+        column: Metric values for the same rows.
+        min_val: Minimum value (inclusive), or None for no minimum.
+        max_val: Maximum value (inclusive), or None for no maximum.
+        scratch: Optional boolean buffer shaped like mask.
+    """
+    if min_val is None and max_val is None:
+        return
+    if scratch is None:
+        scratch = np.empty_like(mask)
+    if min_val is not None:
+        np.greater_equal(column, min_val, out=scratch)
+        mask &= scratch
+    if max_val is not None:
+        np.less_equal(column, max_val, out=scratch)
+        mask &= scratch
+
+
+def _remove_sorted(items: list[str], item: str) -> None:
+    """Remove an item from a sorted list using binary search.
+
+    Args:
+        items: Sorted list, modified in place.
+        item: Item to remove; must be present.
+    """
+    del items[bisect.bisect_left(items, item)]
+
+
+@dataclass(slots=True)
 class ProteinMetrics:
     """Metrics data for a single protein.
 
@@ -23,6 +234,10 @@ class ProteinMetrics:
     name: str
     file_path: str | None = None
     metrics: dict[str, float] = field(default_factory=dict)
+    # Store this protein currently belongs to, kept in sync by set_metric
+    _store: "MetricsStore | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_metric(self, name: str, default: float | None = None) -> float | None:
         """Get a metric value by name.
@@ -44,6 +259,8 @@ class ProteinMetrics:
             value: Metric value.
         """
         self.metrics[name] = value
+        if self._store is not None:
+            self._store._set_value(self, name, value)
 
     def has_metric(self, name: str) -> bool:
         """Check if a metric exists.
@@ -88,13 +305,66 @@ class ProteinMetrics:
 class MetricsStore:
     """Storage for metrics of multiple proteins.
 
-    Provides loading from CSV/JSON and filtering/sorting capabilities.
+    Provides loading from CSV/JSON/NPZ and filtering/sorting capabilities.
+
+    Besides the ProteinMetrics objects, the store keeps a columnar copy of
+    all metric values: one contiguous float array per metric, indexed by a
+    row number per protein, with NaN marking a missing value. A boolean
+    presence mask per metric records which rows actually carry the metric.
+    Filtering, sorting and statistics scan these columns instead of
+    per-protein dicts.
+
+    The columns default to float64. A store created with a narrower float
+    dtype (e.g. float32) moves half the bytes per scan; values read back
+    through ProteinMetrics are unaffected, but range filters, sort order and
+    statistics then see the values rounded to that precision.
     """
 
-    def __init__(self):
-        """Initialize empty metrics store."""
+    # Row capacity of the first column allocation; grows by doubling
+    _INITIAL_CAPACITY = 64
+
+    # Candidate rows sampled to estimate how selective each range filter is
+    _SELECTIVITY_SAMPLE = 256
+
+    # Minimum number of parsed single-protein JSON files remembered for
+    # re-loads; grows to the largest batch passed to parse_single_protein_jsons
+    _JSON_CACHE_SIZE = 4096
+
+    def __init__(self, dtype: DTypeLike = np.float64):
+        """Initialize empty metrics store.
+
+        Args:
+            dtype: Floating point dtype of the metric columns.
+
+        Raises:
+            ValueError: If dtype is not a floating point type.
+        """
+        self._dtype = np.dtype(dtype)
+        if self._dtype.kind != "f":
+            # Missing values are stored as NaN, which needs a float type
+            raise ValueError(f"Metric columns need a float dtype, got {self._dtype}")
         self._proteins: dict[str, ProteinMetrics] = {}
-        self._metric_names: set[str] = set()
+        # Number of proteins carrying each metric; names are dropped at zero
+        self._metric_counts: Counter[str] = Counter()
+        # Kept sorted on insert/remove so the name properties never re-sort
+        self._sorted_names: list[str] = []
+        self._sorted_metric_names: list[str] = []
+
+        # Columnar storage: row index per protein, one array per metric
+        self._rows: dict[str, int] = {}
+        self._row_proteins: list[ProteinMetrics] = []
+        self._names_lower: list[str] = []
+        self._columns: dict[str, np.ndarray] = {}
+        self._present: dict[str, np.ndarray] = {}
+        self._capacity = 0
+
+        # Single-protein JSON parse results by path, with the file version
+        # and arguments they were parsed with; survives clear() because it
+        # describes files, not stored proteins. Kept in least recently used
+        # order and shared by the parsing threads, hence the lock
+        self._parsed_json: OrderedDict[str, tuple[tuple, ProteinMetrics | None]] = OrderedDict()
+        self._parsed_json_capacity = self._JSON_CACHE_SIZE
+        self._parsed_json_lock = threading.Lock()
 
     def add_protein(self, protein: ProteinMetrics) -> None:
         """Add or update a protein's metrics.
@@ -103,7 +373,64 @@ class MetricsStore:
             protein: ProteinMetrics instance.
         """
         self._proteins[protein.name] = protein
-        self._metric_names.update(protein.metrics.keys())
+        self._store_row(protein)
+
+    def extend(self, proteins: Iterable[ProteinMetrics]) -> int:
+        """Add or update many proteins at once.
+
+        Equivalent to calling add_protein for each item, but rows for new
+        proteins are reserved in one step and each metric column is filled
+        with a single scatter instead of one write per value.
+
+        Args:
+            proteins: Iterable of ProteinMetrics instances.
+
+        Returns:
+            Number of proteins added.
+        """
+        added = 0
+        new_proteins: dict[str, ProteinMetrics] = {}
+        for protein in proteins:
+            added += 1
+            if protein.name in self._rows:
+                # Replacing a stored protein reuses its row
+                self._proteins[protein.name] = protein
+                self._store_row(protein)
+            else:
+                new_proteins[protein.name] = protein
+        if not new_proteins:
+            return added
+
+        first_row = len(self._row_proteins)
+        self._reserve(first_row + len(new_proteins))
+        metric_rows: dict[str, list[int]] = {}
+        metric_values: dict[str, list[float]] = {}
+        for row, (name, protein) in enumerate(new_proteins.items(), first_row):
+            self._proteins[name] = protein
+            self._rows[name] = row
+            self._row_proteins.append(protein)
+            self._names_lower.append(name.lower())
+            protein._store = self
+            for metric_name, value in protein.metrics.items():
+                if metric_name in metric_rows:
+                    metric_rows[metric_name].append(row)
+                    metric_values[metric_name].append(value)
+                else:
+                    metric_rows[metric_name] = [row]
+                    metric_values[metric_name] = [value]
+
+        # One sort of the merged list is cheaper than an insort per name
+        self._sorted_names.extend(new_proteins)
+        self._sorted_names.sort()
+
+        for metric_name, rows in metric_rows.items():
+            column, present = self._ensure_column(metric_name)
+            column[rows] = metric_values[metric_name]
+            present[rows] = True
+            if metric_name not in self._metric_counts:
+                bisect.insort(self._sorted_metric_names, metric_name)
+            self._metric_counts[metric_name] += len(rows)
+        return added
 
     def get_protein(self, name: str) -> ProteinMetrics | None:
         """Get a protein by name.
@@ -127,30 +454,211 @@ class MetricsStore:
         """
         if name in self._proteins:
             del self._proteins[name]
-            self._refresh_metric_names()
+            _remove_sorted(self._sorted_names, name)
+            self._remove_row(name)
             return True
         return False
 
     def clear(self) -> None:
         """Clear all proteins from the store."""
+        for protein in self._row_proteins:
+            protein._store = None
         self._proteins.clear()
-        self._metric_names.clear()
+        self._metric_counts.clear()
+        self._sorted_names.clear()
+        self._sorted_metric_names.clear()
+        self._rows.clear()
+        self._row_proteins.clear()
+        self._names_lower.clear()
+        self._columns.clear()
+        self._present.clear()
+        self._capacity = 0
+
+    # Columnar storage helpers
+
+    def _reserve(self, num_rows: int) -> None:
+        """Grow every column so it can hold at least num_rows rows.
 
-    def _refresh_metric_names(self) -> None:
-        """Refresh the set of metric names from all proteins."""
-        self._metric_names.clear()
-        for protein in self._proteins.values():
-            self._metric_names.update(protein.metrics.keys())
+        Args:
+            num_rows: Required row capacity.
+        """
+        if num_rows <= self._capacity:
+            return
+        capacity = max(num_rows, self._capacity * 2, self._INITIAL_CAPACITY)
+        used = len(self._row_proteins)
+        for metric_name, column in self._columns.items():
+            grown = np.full(capacity, np.nan, dtype=self._dtype)
+            grown[:used] = column[:used]
+            self._columns[metric_name] = grown
+        for metric_name, present in self._present.items():
+            grown = np.zeros(capacity, dtype=bool)
+            grown[:used] = present[:used]
+            self._present[metric_name] = grown
+        self._capacity = capacity
+
+    def _ensure_column(self, metric_name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Get the full-capacity column and presence mask, creating them if needed.
+
+        Args:
+            metric_name: Metric name.
+
+        Returns:
+            Tuple of (value column, presence mask), both of the current capacity.
+        """
+        column = self._columns.get(metric_name)
+        if column is None:
+            column = np.full(self._capacity, np.nan, dtype=self._dtype)
+            self._columns[metric_name] = column
+            self._present[metric_name] = np.zeros(self._capacity, dtype=bool)
+        return column, self._present[metric_name]
+
+    def _write_value(self, metric_name: str, row: int, value: float) -> None:
+        """Write one value into a metric column, creating it if needed.
+
+        Args:
+            metric_name: Metric name.
+            row: Row index of the protein.
+            value: Metric value.
+        """
+        column, present = self._ensure_column(metric_name)
+        column[row] = value
+        if not present[row]:
+            present[row] = True
+            if metric_name not in self._metric_counts:
+                bisect.insort(self._sorted_metric_names, metric_name)
+            self._metric_counts[metric_name] += 1
+
+    def _clear_row(self, row: int) -> None:
+        """Drop every metric value of a row and release its metric counts.
+
+        A metric whose count reaches zero loses its column and presence
+        mask too, so later removals and growth no longer touch it.
+
+        Args:
+            row: Row index.
+        """
+        unused: list[str] = []
+        for metric_name, present in self._present.items():
+            if present[row]:
+                present[row] = False
+                self._columns[metric_name][row] = np.nan
+                self._metric_counts[metric_name] -= 1
+                if not self._metric_counts[metric_name]:
+                    unused.append(metric_name)
+
+        for metric_name in unused:
+            del self._metric_counts[metric_name]
+            del self._columns[metric_name]
+            del self._present[metric_name]
+            _remove_sorted(self._sorted_metric_names, metric_name)
+
+    def _metric_column(self, metric_name: str) -> np.ndarray | None:
+        """Get the values of a metric for all rows.
+
+        Args:
+            metric_name: Metric name.
+
+        Returns:
+            View of the column trimmed to the used rows (NaN where missing),
+            or None if no protein has this metric.
+        """
+        column = self._columns.get(metric_name)
+        if column is None:
+            return None
+        return column[:len(self._row_proteins)]
+
+    def _presence_mask(self, metric_name: str) -> np.ndarray | None:
+        """Get which rows carry a metric.
+
+        Args:
+            metric_name: Metric name.
+
+        Returns:
+            View of the presence mask trimmed to the used rows, or None if
+            no protein has this metric.
+        """
+        present = self._present.get(metric_name)
+        if present is None:
+            return None
+        return present[:len(self._row_proteins)]
+
+    def _store_row(self, protein: ProteinMetrics) -> None:
+        """Write a protein's metrics into the columnar storage.
+
+        Args:
+            protein: Protein being added or replaced.
+        """
+        row = self._rows.get(protein.name)
+        if row is None:
+            row = len(self._row_proteins)
+            self._reserve(row + 1)
+            self._rows[protein.name] = row
+            self._row_proteins.append(protein)
+            self._names_lower.append(protein.name.lower())
+            bisect.insort(self._sorted_names, protein.name)
+        else:
+            previous = self._row_proteins[row]
+            if previous is not protein:
+                previous._store = None
+            self._row_proteins[row] = protein
+            self._clear_row(row)
+
+        for metric_name, value in protein.metrics.items():
+            self._write_value(metric_name, row, value)
+        protein._store = self
+
+    def _remove_row(self, name: str) -> None:
+        """Remove a protein's row, shifting the rows after it up by one.
+
+        Rows stay in insertion order, which is the order of iteration and
+        the tie order of sorting and filtering.
+
+        Args:
+            name: Protein name.
+        """
+        row = self._rows.pop(name)
+        last = len(self._row_proteins) - 1
+        self._clear_row(row)
+        for column in self._columns.values():
+            column[row:last] = column[row + 1:last + 1]
+            column[last] = np.nan
+        for present in self._present.values():
+            present[row:last] = present[row + 1:last + 1]
+            present[last] = False
+
+        self._row_proteins[row]._store = None
+        del self._row_proteins[row]
+        del self._names_lower[row]
+        for moved_row in range(row, last):
+            self._rows[self._row_proteins[moved_row].name] = moved_row
+
+    def _set_value(self, protein: ProteinMetrics, metric_name: str, value: float) -> None:
+        """Mirror a ProteinMetrics.set_metric call into the columns.
+
+        Args:
+            protein: Protein whose metric changed.
+            metric_name: Metric name.
+            value: New value.
+        """
+        row = self._rows.get(protein.name)
+        if row is None or self._row_proteins[row] is not protein:
+            return
+        self._write_value(metric_name, row, value)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Get the dtype of the metric columns."""
+        return self._dtype
 
     @property
     def protein_names(self) -> list[str]:
         """Get sorted list of protein names."""
-        return sorted(self._proteins.keys())
+        return list(self._sorted_names)
 
     @property
     def metric_names(self) -> list[str]:
         """Get sorted list of all metric names."""
-        return sorted(self._metric_names)
+        return list(self._sorted_metric_names)
 
     @property
     def count(self) -> int:
@@ -178,10 +686,12 @@ class MetricsStore:
             List of matching proteins.
         """
         pattern_lower = pattern.lower()
-        return [
-            p for p in self._proteins.values()
-            if pattern_lower in p.name.lower()
-        ]
+        if not pattern_lower:
+            return list(self._row_proteins)
+        return self._proteins_at([
+            row for row, name_lower in enumerate(self._names_lower)
+            if pattern_lower in name_lower
+        ])
 
     def filter_by_metric_range(
         self,
@@ -199,17 +709,12 @@ class MetricsStore:
         Returns:
             List of proteins within the range.
         """
-        results = []
-        for protein in self._proteins.values():
-            value = protein.get_metric(metric_name)
-            if value is None:
-                continue
-            if min_val is not None and value < min_val:
-                continue
-            if max_val is not None and value > max_val:
-                continue
-            results.append(protein)
-        return results
+        column = self._metric_column(metric_name)
+        if column is None:
+            return []
+        mask = self._presence_mask(metric_name).copy()
+        _and_in_range(mask, column, min_val, max_val)
+        return self._proteins_where(mask)
 
     def filter_by_metrics(
         self,
@@ -223,28 +728,86 @@ class MetricsStore:
         Returns:
             List of proteins matching all filters.
         """
-        results = list(self._proteins.values())
-        for metric_name, (min_val, max_val) in filters.items():
-            results = [
-                p for p in results
-                if self._matches_range(p.get_metric(metric_name), min_val, max_val)
-            ]
-        return results
-
-    def _matches_range(
+        # Intersect the presence masks first so that range comparisons are
+        # skipped entirely once no row carries every filtered metric
+        mask = np.ones(len(self._row_proteins), dtype=bool)
+        for metric_name in filters:
+            present = self._presence_mask(metric_name)
+            if present is None:
+                return []
+            mask &= present
+        rows = np.flatnonzero(mask)
+        bounded = [
+            (metric_name, min_val, max_val)
+            for metric_name, (min_val, max_val) in filters.items()
+            if min_val is not None or max_val is not None
+        ]
+        if len(bounded) > 1 and rows.size > self._SELECTIVITY_SAMPLE:
+            bounded = self._order_by_selectivity(bounded, rows)
+
+        # Each filter only gathers and compares the rows that survived the
+        # previous ones, so later filters get cheaper as the set shrinks
+        in_range = np.empty(rows.size, dtype=bool)
+        scratch = np.empty(rows.size, dtype=bool)
+        for metric_name, min_val, max_val in bounded:
+            if rows.size == 0:
+                return []
+            keep = in_range[:rows.size]
+            keep.fill(True)
+            values = self._metric_column(metric_name)[rows]
+            _and_in_range(keep, values, min_val, max_val, scratch[:rows.size])
+            rows = rows[keep]
+        return self._proteins_at(rows.tolist())
+
+    def _order_by_selectivity(
         self,
-        value: float | None,
-        min_val: float | None,
-        max_val: float | None,
-    ) -> bool:
-        """Check if a value matches a range."""
-        if value is None:
-            return False
-        if min_val is not None and value < min_val:
-            return False
-        if max_val is not None and value > max_val:
-            return False
-        return True
+        bounded: list[tuple[str, float | None, float | None]],
+        rows: np.ndarray,
+    ) -> list[tuple[str, float | None, float | None]]:
+        """Order range filters so the most selective one runs first.
+
+        Survivors are estimated on an evenly strided sample of the candidate
+        rows; the result set is the same in any order, only the work differs.
+
+        Args:
+            bounded: (metric_name, min_val, max_val) filters with a bound set.
+            rows: Candidate row indices.
+
+        Returns:
+            The filters sorted by ascending estimated survivor count.
+        """
+        sample = rows[::rows.size // self._SELECTIVITY_SAMPLE]
+        survivors = []
+        for metric_name, min_val, max_val in bounded:
+            keep = np.ones(sample.size, dtype=bool)
+            values = self._metric_column(metric_name)[sample]
+            _and_in_range(keep, values, min_val, max_val)
+            survivors.append(int(keep.sum()))
+        order = sorted(range(len(bounded)), key=survivors.__getitem__)
+        return [bounded[i] for i in order]
+
+    def _proteins_where(self, mask: np.ndarray) -> list[ProteinMetrics]:
+        """Get the proteins whose rows are set in a boolean mask.
+
+        Args:
+            mask: Boolean array with one entry per row.
+
+        Returns:
+            List of proteins in row order.
+        """
+        return self._proteins_at(np.flatnonzero(mask).tolist())
+
+    def _proteins_at(self, rows: Iterable[int]) -> list[ProteinMetrics]:
+        """Get the proteins stored at the given rows.
+
+        Args:
+            rows: Row indices.
+
+        Returns:
+            List of proteins in the order of rows.
+        """
+        row_proteins = self._row_proteins
+        return [row_proteins[row] for row in rows]
 
     # Sorting methods
 
@@ -262,21 +825,37 @@ class MetricsStore:
         Returns:
             Sorted list of proteins.
         """
-        proteins = list(self._proteins.values())
-
         if sort_by == "name":
-            proteins.sort(key=lambda p: p.name.lower(), reverse=not ascending)
-        else:
-            # Sort by metric value, None values go to end
-            def sort_key(p: ProteinMetrics):
-                val = p.get_metric(sort_by)
-                if val is None:
-                    return (1, 0)  # None values sort after real values
-                return (0, val)
+            return self._proteins_at(self._name_order(ascending))
+
+        column = self._metric_column(sort_by)
+        if column is None:
+            return list(self._row_proteins)
+
+        # Negate for descending so a single stable argsort keeps ties in
+        # row order; rows without the metric become +inf and sort last
+        keys = np.where(
+            self._presence_mask(sort_by),
+            column if ascending else -column,
+            np.inf,
+        )
+        order = np.argsort(keys, kind="stable")
+        return self._proteins_at(order.tolist())
 
-            proteins.sort(key=sort_key, reverse=not ascending)
+    def _name_order(self, ascending: bool = True) -> list[int]:
+        """Get row indices ordered by case-insensitive protein name.
 
-        return proteins
+        Args:
+            ascending: Sort in ascending order.
+
+        Returns:
+            List of row indices.
+        """
+        return sorted(
+            range(len(self._row_proteins)),
+            key=self._names_lower.__getitem__,
+            reverse=not ascending,
+        )
 
     # I/O methods
 
@@ -299,38 +878,87 @@ class MetricsStore:
             ValueError: If CSV format is invalid.
         """
         file_path = Path(file_path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        count = 0
-        with open(file_path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            if not reader.fieldnames:
+        # Open directly rather than checking exists() first: one syscall
+        # fewer per file, and no window for the file to vanish in between
+        try:
+            f = open(file_path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+        # Map the file instead of reading it through a buffered text stream:
+        # the quote scan runs on the mapped bytes and the only copy made is
+        # the single decode to str
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
                 raise ValueError("CSV file has no headers")
-
-            # First column is protein name
-            name_col = reader.fieldnames[0]
-            metric_cols = reader.fieldnames[1:]
-
-            for row in reader:
-                name = row.get(name_col, "").strip()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                has_quotes = mm.find(b'"') != -1
+                with memoryview(mm) as view:
+                    text = str(view, "utf-8")
+
+        if not has_quotes:
+            # Fast path: without quoting, records and fields are plain
+            # newline/comma separated and str.split does the tokenizing in C
+            lines = [line for line in text.split("\n") if line.rstrip("\r")]
+            fieldnames = lines[0].rstrip("\r").split(",") if lines else None
+            rows = (line.rstrip("\r").split(",") for line in lines[1:])
+        else:
+            # Positional rows from csv.reader; blank records come back as []
+            reader = csv.reader(io.StringIO(text, newline=""))
+            rows = (row for row in reader if row)
+            fieldnames = next(rows, None)
+
+        if not fieldnames:
+            raise ValueError("CSV file has no headers")
+
+        # First column is protein name
+        metric_cols = fieldnames[1:]
+        num_cols = len(fieldnames)
+        records = list(rows)
+
+        if all(len(row) == num_cols for row in records):
+            # Rectangular table: slice the columns out of one 2D string
+            # array and drop unnamed rows with a boolean mask
+            name_cells = np.array([row[0] for row in records], dtype=np.str_)
+            name_cells = np.char.strip(name_cells)
+            keep = name_cells != ""
+            names = name_cells[keep].tolist()
+            table = np.array([row[1:] for row in records], dtype=np.str_)
+            table = table.reshape(len(records), len(metric_cols))
+            cells = [table[keep, col] for col in range(len(metric_cols))]
+        else:
+            names = []
+            cells = [[] for _ in metric_cols]
+            for row in records:
+                name = row[0].strip()
                 if not name:
                     continue
+                names.append(name)
+                if len(row) < num_cols:
+                    row = row + [""] * (num_cols - len(row))
+                for col_cells, val_str in zip(cells, row[1:]):
+                    col_cells.append(val_str)
+
+        # Convert whole columns at once, then regroup into per-protein dicts
+        parsed = [_parse_float_column(col_cells) for col_cells in cells]
+        value_lists = [values.tolist() for values, _ in parsed]
+        valid_lists = [valid.tolist() for _, valid in parsed]
+        value_rows = zip(*value_lists) if value_lists else itertools.repeat(())
+        valid_rows = zip(*valid_lists) if valid_lists else itertools.repeat(())
+        proteins = [
+            ProteinMetrics(
+                name=name,
+                # Empty or non-numeric cells are skipped; "nan" cells are kept
+                metrics={
+                    col: v
+                    for col, v, ok in zip(metric_cols, values, valid)
+                    if ok
+                },
+            )
+            for name, values, valid in zip(names, value_rows, valid_rows)
+        ]
 
-                metrics = {}
-                for col in metric_cols:
-                    val_str = row.get(col, "").strip()
-                    if val_str:
-                        try:
-                            metrics[col] = float(val_str)
-                        except ValueError:
-                            pass  # Skip non-numeric values
-
-                protein = ProteinMetrics(name=name, metrics=metrics)
-                self.add_protein(protein)
-                count += 1
-
+        count = self.extend(proteins)
         logger.info(f"Loaded {count} proteins from CSV: {file_path}")
         return count
 
@@ -361,11 +989,12 @@ class MetricsStore:
             ValueError: If JSON format is invalid.
         """
         file_path = Path(file_path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(raw)
 
         # Handle both formats
         if isinstance(data, dict):
@@ -375,7 +1004,7 @@ class MetricsStore:
         else:
             raise ValueError("Invalid JSON format: expected object or array")
 
-        count = 0
+        proteins: list[ProteinMetrics] = []
         for item in proteins_data:
             if not isinstance(item, dict):
                 continue
@@ -387,17 +1016,18 @@ class MetricsStore:
             metrics_data = item.get("metrics", {})
             if isinstance(metrics_data, dict):
                 for k, v in metrics_data.items():
-                    if isinstance(v, (int, float)):
-                        metrics[k] = float(v)
+                    fval = _as_float(v)
+                    if fval is not None:
+                        # Intern so every protein's dict shares one key string
+                        metrics[sys.intern(k)] = fval
 
-            protein = ProteinMetrics(
+            proteins.append(ProteinMetrics(
                 name=name,
                 file_path=item.get("file_path"),
                 metrics=metrics,
-            )
-            self.add_protein(protein)
-            count += 1
+            ))
 
+        count = self.extend(proteins)
         logger.info(f"Loaded {count} proteins from JSON: {file_path}")
         return count
 
@@ -422,19 +1052,161 @@ class MetricsStore:
         Returns:
             True if successfully loaded, False if not a valid metrics file.
         """
-        file_path = Path(file_path)
-        if not file_path.exists():
+        protein = self._parse_single_protein_json(file_path, pdb_file_path, num_residues)
+        if protein is None:
             return False
+        self.add_protein(protein)
+        return True
+
+    def load_single_protein_jsons(
+        self,
+        file_paths: Iterable[str | Path],
+        pdb_file_paths: dict[str, str] | None = None,
+        max_workers: int | None = None,
+    ) -> int:
+        """Load many single-protein JSON files in parallel.
+
+        Files are read and parsed on a thread pool; the parsed proteins are
+        then added on the calling thread in one extend, in input order.
+
+        Args:
+            file_paths: Paths to JSON files.
+            pdb_file_paths: Optional map of JSON file stem to the associated
+                structure file path (used for name, as in
+                load_single_protein_json).
+            max_workers: Thread pool size; defaults to the executor's default.
+
+        Returns:
+            Number of files loaded as proteins.
+        """
+        proteins = self.parse_single_protein_jsons(
+            file_paths, pdb_file_paths, max_workers
+        )
+        return self.extend(proteins)
+
+    def parse_single_protein_jsons(
+        self,
+        file_paths: Iterable[str | Path],
+        pdb_file_paths: dict[str, str] | None = None,
+        max_workers: int | None = None,
+    ) -> list[ProteinMetrics]:
+        """Parse many single-protein JSON files in parallel without storing them.
+
+        Does not read or modify the stored proteins, so it may run on a
+        worker thread while the store is in use; pass the result to extend
+        afterwards. Only the store's cache of parsed JSON files is updated,
+        which is guarded by its own lock.
+
+        Args:
+            file_paths: Paths to JSON files.
+            pdb_file_paths: Optional map of JSON file stem to the associated
+                structure file path (used for name).
+            max_workers: Thread pool size; defaults to the executor's default.
+
+        Returns:
+            Parsed proteins in input order, skipping files that are not
+            valid metrics files.
+        """
+        file_paths = [Path(p) for p in file_paths]
+        pdb_file_paths = pdb_file_paths or {}
+        pdb_paths = [pdb_file_paths.get(p.stem) for p in file_paths]
+
+        # Remember at least a whole folder, so re-opening it hits the cache
+        with self._parsed_json_lock:
+            self._parsed_json_capacity = max(self._parsed_json_capacity, len(file_paths))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = list(
+                executor.map(self._parse_single_protein_json, file_paths, pdb_paths)
+            )
+
+        return [protein for protein in parsed if protein is not None]
+
+    def _parse_single_protein_json(
+        self,
+        file_path: str | Path,
+        pdb_file_path: str | None = None,
+        num_residues: int | None = None,
+    ) -> ProteinMetrics | None:
+        """Parse a single-protein JSON file without touching the store.
+
+        Results are remembered per file, so loading an unchanged file again
+        (e.g. re-opening a folder) skips the read and the parse.
+
+        Args:
+            file_path: Path to JSON file.
+            pdb_file_path: Optional path to associated PDB file (used for name).
+            num_residues: Optional expected residue count for per-residue detection.
 
+        Returns:
+            ProteinMetrics, or None if the file is not a valid metrics file.
+        """
+        file_path = Path(file_path)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            f = open(file_path, "rb")
+        except FileNotFoundError:
+            return None
+
+        with f:
+            stat = os.fstat(f.fileno())
+            key = (stat.st_mtime_ns, stat.st_size, pdb_file_path, num_residues)
+            cache_key = str(file_path)
+            with self._parsed_json_lock:
+                cached = self._parsed_json.get(cache_key)
+                hit = cached is not None and cached[0] == key
+                if hit:
+                    self._parsed_json.move_to_end(cache_key)
+            if hit:
+                parsed = cached[1]
+            else:
+                parsed = self._scan_single_protein_json(
+                    f.read(), file_path, pdb_file_path, num_residues
+                )
+                with self._parsed_json_lock:
+                    self._parsed_json[cache_key] = (key, parsed)
+                    self._parsed_json.move_to_end(cache_key)
+                    while len(self._parsed_json) > self._parsed_json_capacity:
+                        self._parsed_json.popitem(last=False)
+
+        if parsed is None:
+            return None
+        # Hand out a fresh object: the cached one must not join a store
+        return ProteinMetrics(
+            name=parsed.name,
+            file_path=parsed.file_path,
+            metrics=dict(parsed.metrics),
+        )
+
+    def _scan_single_protein_json(
+        self,
+        raw: bytes,
+        file_path: Path,
+        pdb_file_path: str | None,
+        num_residues: int | None,
+    ) -> ProteinMetrics | None:
+        """Build a protein from the raw bytes of a single-protein JSON file.
+
+        Args:
+            raw: File contents.
+            file_path: Path the contents were read from.
+            pdb_file_path: Optional path to associated PDB file (used for name).
+            num_residues: Optional expected residue count for per-residue detection.
+
+        Returns:
+            ProteinMetrics, or None if the file is not a valid metrics file.
+        """
+        if not _JSON_OBJECT_START.match(raw) or not _ANY_DIGIT.search(raw):
+            logger.debug(f"Skipping {file_path}: not a JSON object with numbers")
+            return None
+
+        try:
+            data = _json_loads(raw)
         except (json.JSONDecodeError, UnicodeDecodeError):
-            return False
+            return None
 
         # Must be a dict at root level
         if not isinstance(data, dict):
-            return False
+            return None
 
         # Determine protein name from known keys or filename
         if pdb_file_path:
@@ -455,17 +1227,19 @@ class MetricsStore:
 
         if not metrics:
             logger.debug(f"No numeric metrics found in {file_path}")
-            return False
+            return None
+
+        # The scanner builds fresh key strings per file; intern them so all
+        # proteins loaded from a folder share one string per metric name
+        metrics = {sys.intern(k): v for k, v in metrics.items()}
 
         logger.info(f"Loaded {len(metrics)} metrics from {file_path.name}: {list(metrics.keys())}")
 
-        protein = ProteinMetrics(
+        return ProteinMetrics(
             name=name,
             file_path=pdb_file_path,
             metrics=metrics,
         )
-        self.add_protein(protein)
-        return True
 
     def _scan_json_for_metrics(
         self,
@@ -484,52 +1258,56 @@ class MetricsStore:
             num_residues: Expected residue count for per-residue detection.
             max_depth: Maximum nesting depth to prevent deep recursion.
         """
-        if max_depth <= 0:
-            return
-
-        # Skip known non-metric keys
-        _skip_keys = {"name", "sequence_name", "job_id", "file_path", "version", "date"}
+        # Iterative depth-first walk; children are pushed in reverse so they
+        # are visited (and metrics inserted) in document order
+        stack: list[tuple[Any, str, int]] = [(obj, prefix, max_depth)]
+        while stack:
+            obj, prefix, depth = stack.pop()
+            if depth <= 0:
+                continue
 
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key in _skip_keys:
-                    continue
-                # Build a readable metric name
-                metric_key = f"{prefix}.{key}" if prefix else key
-                self._scan_json_for_metrics(
-                    value, metric_key, metrics, num_residues, max_depth - 1
-                )
+            if isinstance(obj, dict):
+                children = [
+                    (value, f"{prefix}.{key}" if prefix else key, depth - 1)
+                    for key, value in obj.items()
+                    if key not in _SKIP_METRIC_KEYS
+                ]
+                children.reverse()
+                stack.extend(children)
+
+            elif isinstance(obj, list) and len(obj) > 0:
+                # Check if list is all numeric
+                summary = _summarize_numeric_list(obj)
+                if summary is not None:
+                    # Determine if per-residue or some other array
+                    is_per_residue = (
+                        num_residues is not None
+                        and len(obj) == num_residues
+                    )
+                    label = prefix
+                    if is_per_residue:
+                        label = f"{prefix}(per_res)"
+                    # Store summary statistics for numeric arrays
+                    mean, min_val, max_val = summary
+                    metrics[f"{label}_mean"] = mean
+                    metrics[f"{label}_min"] = min_val
+                    metrics[f"{label}_max"] = max_val
+
+                # Check if list is all dicts (e.g. complex_pae_scores chain-pair metrics)
+                elif all(isinstance(v, dict) for v in obj):
+                    self._scan_dict_list_for_metrics(
+                        obj, prefix, metrics, num_residues, depth - 1
+                    )
 
-        elif isinstance(obj, (int, float)) and not isinstance(obj, bool):
-            # Scalar numeric value -> global metric
-            metrics[prefix] = float(obj)
-
-        elif isinstance(obj, list) and len(obj) > 0:
-            # Check if list is all numeric
-            if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in obj):
-                float_vals = [float(v) for v in obj]
-                # Determine if per-residue or some other array
-                is_per_residue = (
-                    num_residues is not None
-                    and len(float_vals) == num_residues
-                )
-                label = prefix
-                if is_per_residue:
-                    label = f"{prefix}(per_res)"
-                # Store summary statistics for numeric arrays
-                metrics[f"{label}_mean"] = sum(float_vals) / len(float_vals)
-                metrics[f"{label}_min"] = min(float_vals)
-                metrics[f"{label}_max"] = max(float_vals)
-
-            # Check if list is all dicts (e.g. complex_pae_scores chain-pair metrics)
-            elif all(isinstance(v, dict) for v in obj):
-                self._scan_dict_list_for_metrics(
-                    obj, prefix, metrics, num_residues, max_depth - 1
-                )
+            else:
+                # Scalar numeric value -> global metric
+                fval = _as_float(obj)
+                if fval is not None:
+                    metrics[prefix] = fval
 
     # Known keys used to label entries in a list of dicts (chain pairs, etc.)
-    _LABEL_KEY_PAIRS = [("chain1", "chain2"), ("chain_1", "chain_2")]
-    _LABEL_SINGLE_KEYS = ["chain", "name", "label", "id", "type"]
+    _LABEL_KEY_PAIRS: tuple[tuple[str, str], ...] = (("chain1", "chain2"), ("chain_1", "chain_2"))
+    _LABEL_SINGLE_KEYS: tuple[str, ...] = ("chain", "name", "label", "id", "type")
 
     def _scan_dict_list_for_metrics(
         self,
@@ -565,14 +1343,13 @@ class MetricsStore:
 
             for key, value in item.items():
                 # Skip the label keys themselves
-                if key in ("chain1", "chain2", "chain_1", "chain_2",
-                           "chain", "name", "label", "id", "type"):
+                if key in _LABEL_KEYS:
                     continue
 
                 metric_key = f"{item_prefix}.{key}" if item_prefix else key
 
-                if isinstance(value, (int, float)) and not isinstance(value, bool):
-                    fval = float(value)
+                fval = _as_float(value)
+                if fval is not None:
                     metrics[metric_key] = fval
                     # Track for aggregation
                     field_values.setdefault(key, []).append(fval)
@@ -603,6 +1380,10 @@ class MetricsStore:
         Returns:
             Label string (e.g. "A_B", "chainA", or "0").
         """
+        # Entries without any label key (plain score dicts) skip both probes
+        if item.keys().isdisjoint(_LABEL_KEYS):
+            return str(index)
+
         # Check chain-pair keys
         for k1, k2 in self._LABEL_KEY_PAIRS:
             if k1 in item and k2 in item:
@@ -615,14 +1396,33 @@ class MetricsStore:
 
         return str(index)
 
-    def save_csv(self, file_path: str | Path) -> None:
+    def save_csv(
+        self,
+        file_path: str | Path,
+        names: Iterable[str] | None = None,
+    ) -> None:
         """Save metrics to a CSV file.
 
         Args:
             file_path: Path to output CSV file.
+            names: Optional protein names to export, written in the given
+                order; unknown names are skipped. Defaults to all proteins
+                sorted by name.
         """
         file_path = Path(file_path)
         metric_names = self.metric_names
+        if names is None:
+            order = self._name_order()
+        else:
+            order = [self._rows[name] for name in names if name in self._rows]
+
+        # Format each metric column in one call, blanking missing cells
+        text_columns = []
+        for metric in metric_names:
+            text = np.char.mod("%.4f", self._metric_column(metric)[order])
+            text[~self._presence_mask(metric)[order]] = ""
+            text_columns.append(text.tolist())
+        names = [self._row_proteins[row].name for row in order]
 
         with open(file_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
@@ -631,12 +1431,7 @@ class MetricsStore:
             writer.writerow(["name"] + metric_names)
 
             # Data rows
-            for protein in self.get_sorted("name"):
-                row = [protein.name]
-                for metric in metric_names:
-                    val = protein.get_metric(metric)
-                    row.append(f"{val:.4f}" if val is not None else "")
-                writer.writerow(row)
+            writer.writerows(zip(names, *text_columns))
 
     def save_json(self, file_path: str | Path) -> None:
         """Save metrics to a JSON file.
@@ -650,8 +1445,85 @@ class MetricsStore:
             "proteins": [p.to_dict() for p in self.get_sorted("name")]
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        file_path.write_bytes(_json_dumps(data))
+
+    def save_npz(self, file_path: str | Path) -> None:
+        """Save metrics to a compressed NumPy archive.
+
+        The columns are written as they are stored (one value array and one
+        presence mask per metric), so reopening the file skips text parsing
+        entirely. Rows keep the store's internal order.
+
+        Args:
+            file_path: Path to output .npz file.
+        """
+        file_path = Path(file_path)
+        used = len(self._row_proteins)
+        metric_names = self._sorted_metric_names
+
+        arrays: dict[str, np.ndarray] = {
+            "names": np.array([p.name for p in self._row_proteins], dtype=np.str_),
+            "file_paths": np.array(
+                [p.file_path or "" for p in self._row_proteins], dtype=np.str_
+            ),
+            "metric_names": np.array(metric_names, dtype=np.str_),
+        }
+        # Metric names may hold any character, so archive members are indexed
+        for i, metric_name in enumerate(metric_names):
+            arrays[f"values_{i}"] = self._columns[metric_name][:used]
+            arrays[f"present_{i}"] = self._present[metric_name][:used]
+
+        with open(file_path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+
+    def load_npz(self, file_path: str | Path) -> int:
+        """Load metrics from a NumPy archive written by save_npz.
+
+        Args:
+            file_path: Path to .npz file.
+
+        Returns:
+            Number of proteins loaded.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+            ValueError: If the archive is not a metrics archive.
+        """
+        file_path = Path(file_path)
+        try:
+            archive = np.load(file_path, allow_pickle=False)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+        with archive:
+            try:
+                names = archive["names"].tolist()
+                file_paths = archive["file_paths"].tolist()
+                metric_names = archive["metric_names"].tolist()
+                columns = [
+                    (archive[f"values_{i}"], archive[f"present_{i}"])
+                    for i in range(len(metric_names))
+                ]
+            except KeyError as e:
+                raise ValueError(f"Invalid metrics archive: missing {e}") from None
+
+        # Scatter each column into the per-protein dicts; only rows whose
+        # presence flag is set receive the metric
+        metrics: list[dict[str, float]] = [{} for _ in names]
+        for metric_name, (values, present) in zip(metric_names, columns):
+            metric_name = sys.intern(metric_name)
+            rows = np.flatnonzero(present)
+            for row, value in zip(rows.tolist(), values[rows].tolist()):
+                metrics[row][metric_name] = value
+
+        proteins = [
+            ProteinMetrics(name=name, file_path=path or None, metrics=row_metrics)
+            for name, path, row_metrics in zip(names, file_paths, metrics)
+        ]
+
+        count = self.extend(proteins)
+        logger.info(f"Loaded {count} proteins from NPZ: {file_path}")
+        return count
 
     def get_metric_stats(self, metric_name: str) -> dict[str, float | None]:
         """Get statistics for a metric across all proteins.
@@ -662,18 +1534,26 @@ class MetricsStore:
         Returns:
             Dict with 'min', 'max', 'mean', 'count' keys.
         """
-        values = [
-            p.get_metric(metric_name)
-            for p in self._proteins.values()
-            if p.has_metric(metric_name)
-        ]
-
-        if not values:
+        column = self._metric_column(metric_name)
+        if column is None:
             return {"min": None, "max": None, "mean": None, "count": 0}
 
+        # Count every protein carrying the metric, as has_metric does. The
+        # sum doubles as the NaN check: only when it comes out NaN are stored
+        # NaN values compacted away, so the usual case is three plain (SIMD)
+        # reductions over one gathered array
+        values = column[self._presence_mask(metric_name)]
+        count = int(values.size)
+        total = values.sum()
+        if np.isnan(total):
+            values = values[~np.isnan(values)]
+            total = values.sum()
+        if values.size == 0:
+            return {"min": None, "max": None, "mean": None, "count": count}
+
         return {
-            "min": min(values),
-            "max": max(values),
-            "mean": sum(values) / len(values),
-            "count": len(values),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "mean": float(total / values.size),
+            "count": count,
         }
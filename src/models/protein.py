@@ -1,11 +1,15 @@
 """Protein data model for structure handling."""
 
+import hashlib
+import io
 import logging
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import biotite.structure as struc
-import biotite.structure.io as strucio
 import biotite.structure.io.pdb as pdb
 import biotite.structure.io.pdbx as pdbx
 import numpy as np
@@ -17,19 +21,201 @@ from src.models.metrics import (
     extract_plddt,
     extract_bfactor,
     calculate_metric,
-    get_residue_info,
+    get_residue_arrays,
     calculate_secondary_structure,
     get_available_metrics,
 )
 from src.models.interface import (
-    THREE_TO_ONE,
-    get_interface_residues as calc_interface_residues,
-    get_bidirectional_interface,
-    count_interface_contacts,
+    to_one_letter,
+    get_interface_residues_and_contacts,
 )
 
 logger = logging.getLogger(__name__)
 
+# Parsed structures can be kept as flat NumPy archives between sessions.
+# The disk cache is opt-in: it is off (None) unless the
+# DESIGNCAMPAIGN_STRUCTURE_CACHE environment variable names a directory
+_structure_cache_env = os.environ.get("DESIGNCAMPAIGN_STRUCTURE_CACHE")
+STRUCTURE_CACHE_DIR: Optional[Path] = (
+    Path(_structure_cache_env).expanduser() if _structure_cache_env else None
+)
+
+
+def _disk_cache_path(path: str, mtime_ns: int, size: int) -> Optional[Path]:
+    """Get the disk cache file for one version of a structure file.
+
+    Entries are named "<path hash>_<mtime>_<size>.npz", so the entries for
+    older versions of the same file can be found and removed.
+
+    Args:
+        path: Path to the structure file.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        Path of the cache entry, or None if the disk cache is disabled.
+    """
+    if STRUCTURE_CACHE_DIR is None:
+        return None
+    path_hash = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return STRUCTURE_CACHE_DIR / f"{path_hash}_{mtime_ns}_{size}.npz"
+
+
+def _load_cached_structure(cache_path: Path) -> Optional[struc.AtomArray]:
+    """Rebuild an AtomArray from a disk cache entry.
+
+    Args:
+        cache_path: Cache file written by _save_cached_structure.
+
+    Returns:
+        The cached structure, or None if the entry is missing or unreadable.
+    """
+    try:
+        with np.load(cache_path, allow_pickle=False) as archive:
+            coord = archive["coord"]
+            structure = struc.AtomArray(len(coord))
+            structure.coord = coord
+            for key in archive.files:
+                if key.startswith("annot_"):
+                    structure.set_annotation(key[len("annot_"):], archive[key])
+            if "bonds" in archive.files:
+                structure.bonds = struc.BondList(len(coord), archive["bonds"])
+            if "box" in archive.files:
+                structure.box = archive["box"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable structure cache {cache_path}: {e}")
+        return None
+    return structure
+
+
+def _save_cached_structure(cache_path: Path, structure: struc.AtomArray) -> None:
+    """Write a parsed structure to the disk cache.
+
+    Failures are logged and otherwise ignored: the cache is only a speedup.
+
+    Args:
+        cache_path: Destination cache file.
+        structure: Parsed structure.
+    """
+    arrays = {"coord": structure.coord}
+    for category in structure.get_annotation_categories():
+        arrays[f"annot_{category}"] = structure.get_annotation(category)
+    if structure.bonds is not None:
+        arrays["bonds"] = structure.bonds.as_array()
+    if structure.box is not None:
+        arrays["box"] = structure.box
+
+    tmp_path: Optional[Path] = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written uncompressed so reloading is a plain read of flat arrays;
+        # the rename keeps readers from ever seeing a partial file, and the
+        # unique temp file keeps threads parsing the same file apart
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=f"{cache_path.stem}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = Path(f.name)
+            np.savez(f, **arrays)
+        os.replace(tmp_path, cache_path)
+        # Drop the entries of earlier versions of the same file
+        path_hash = cache_path.name.split("_", 1)[0]
+        for stale_path in cache_path.parent.glob(f"{path_hash}_*.npz"):
+            if stale_path != cache_path:
+                stale_path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not write structure cache {cache_path}: {e}")
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=32)
+def _read_structure(path: str, mtime_ns: int, size: int) -> struc.AtomArray:
+    """Parse a structure file, memoized across Protein instances.
+
+    The modification time and size are part of the cache key so that a file
+    rewritten on disk is parsed again. Besides this in-memory cache, parsed
+    structures are kept in STRUCTURE_CACHE_DIR, when it is set, so later
+    sessions skip the parse. Callers share the returned array and must copy it before
+    modifying it in place.
+
+    Args:
+        path: Path to the structure file.
+        mtime_ns: File modification time in nanoseconds (cache key only).
+        size: File size in bytes (cache key only).
+
+    Returns:
+        The first model of the structure as a biotite AtomArray.
+    """
+    cache_path = _disk_cache_path(path, mtime_ns, size)
+    if cache_path is not None:
+        structure = _load_cached_structure(cache_path)
+        if structure is not None:
+            return structure
+
+    structure = _parse_structure(path)
+    if cache_path is not None:
+        _save_cached_structure(cache_path, structure)
+    return structure
+
+
+def _parse_structure(path: str) -> struc.AtomArray:
+    """Parse the first model of a structure file.
+
+    Args:
+        path: Path to the structure file.
+
+    Returns:
+        The first model of the structure as a biotite AtomArray.
+    """
+    file_format = get_file_format(path)
+
+    # Call the format's own reader (rather than strucio's extension
+    # dispatch) and load with the B-factor field; model=1 already yields
+    # a single AtomArray for multi-model files
+    if file_format == ".pdb":
+        pdb_file = pdb.PDBFile.read(path)
+        structure = pdb_file.get_structure(
+            extra_fields=["b_factor"],
+            model=1
+        )
+    elif file_format == ".cif":
+        # biotite 1.0+ uses CIFFile instead of PDBxFile
+        cif_file = pdbx.CIFFile.read(path)
+        structure = pdbx.get_structure(
+            cif_file,
+            extra_fields=["b_factor"],
+            model=1
+        )
+    elif file_format == ".bcif":
+        # BinaryCIF holds the same categories as pre-encoded binary columns,
+        # so no text tokenizing is needed
+        bcif_file = pdbx.BinaryCIFFile.read(path)
+        structure = pdbx.get_structure(
+            bcif_file,
+            extra_fields=["b_factor"],
+            model=1
+        )
+    else:
+        # get_file_format only lets supported formats through, and each of
+        # those has its own branch above
+        raise ValueError(f"No structure parser for {file_format} files")
+
+    return structure
+
+
+def clear_structure_cache(disk: bool = False) -> None:
+    """Drop all parsed structures held by the shared structure cache.
+
+    Args:
+        disk: Also delete the structures cached in STRUCTURE_CACHE_DIR.
+    """
+    _read_structure.cache_clear()
+    if disk and STRUCTURE_CACHE_DIR is not None and STRUCTURE_CACHE_DIR.is_dir():
+        for cache_path in STRUCTURE_CACHE_DIR.glob("*.npz"):
+            cache_path.unlink(missing_ok=True)
+
 
 class Protein:
     """Represents a protein structure with lazy loading.
@@ -55,12 +241,22 @@ class Protein:
 
         self.name = self.file_path.stem
         self._structure: Optional[struc.AtomArray] = None
+        # Derived from the structure on first use, dropped again by unload()
+        self._chains: Optional[list[str]] = None
+        self._ca_mask: Optional[np.ndarray] = None
+        self._aa_mask: Optional[np.ndarray] = None
+        self._residues: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._chain_sequences: Optional[dict[str, str]] = None
+        self._centroid: Optional[np.ndarray] = None
+        # (binder_chain, target_chains, cutoff) -> (residues, contact counts)
+        self._interface_cache: dict[tuple, tuple[dict[int, str], dict[int, int]]] = {}
 
     def load_structure(self) -> struc.AtomArray:
         """Load the protein structure using biotite.
 
         Uses lazy loading - structure is only loaded on first access.
-        Loads with extra fields (b_factor) when available.
+        Loads with extra fields (b_factor) when available. Parsed structures
+        are shared between Protein instances for the same unchanged file.
 
         Returns:
             The protein structure as a biotite AtomArray.
@@ -70,30 +266,10 @@ class Protein:
             Exception: If parsing fails.
         """
         if self._structure is None:
-            file_format = get_file_format(self.file_path)
-
-            # Load with B-factor field for PDB files
-            if file_format == ".pdb":
-                pdb_file = pdb.PDBFile.read(str(self.file_path))
-                self._structure = pdb_file.get_structure(
-                    extra_fields=["b_factor"],
-                    model=1
-                )
-            elif file_format == ".cif":
-                # biotite 1.0+ uses CIFFile instead of PDBxFile
-                cif_file = pdbx.CIFFile.read(str(self.file_path))
-                self._structure = pdbx.get_structure(
-                    cif_file,
-                    extra_fields=["b_factor"],
-                    model=1
-                )
-            else:
-                # Fallback to generic loader
-                self._structure = strucio.load_structure(str(self.file_path))
-
-            # If multi-model file, take first model
-            if isinstance(self._structure, struc.AtomArrayStack):
-                self._structure = self._structure[0]
+            stat = self.file_path.stat()
+            self._structure = _read_structure(
+                str(self.file_path), stat.st_mtime_ns, stat.st_size
+            )
 
         return self._structure
 
@@ -108,8 +284,19 @@ class Protein:
         return self._structure is not None
 
     def unload(self) -> None:
-        """Unload the structure to free memory."""
+        """Unload the structure to free memory.
+
+        The parsed structure may still be held by the shared structure cache;
+        call clear_structure_cache to release that as well.
+        """
         self._structure = None
+        self._chains = None
+        self._ca_mask = None
+        self._aa_mask = None
+        self._residues = None
+        self._chain_sequences = None
+        self._centroid = None
+        self._interface_cache.clear()
 
     def get_num_atoms(self) -> int:
         """Get the number of atoms in the structure."""
@@ -121,11 +308,31 @@ class Protein:
 
     def get_chains(self) -> list[str]:
         """Get unique chain IDs in the structure."""
-        return list(np.unique(self.structure.chain_id))
+        if self._chains is None:
+            self._chains = self._find_chains()
+        return list(self._chains)
+
+    def _find_chains(self) -> list[str]:
+        """Scan the structure for its sorted unique chain IDs."""
+        # Atoms of a chain are stored contiguously, so the run starts give
+        # every chain in one linear pass; the set/sort only sees those few
+        chain_ids = self.structure.chain_id
+        if chain_ids.size == 0:
+            return []
+        run_starts = np.empty(chain_ids.size, dtype=bool)
+        run_starts[0] = True
+        np.not_equal(chain_ids[1:], chain_ids[:-1], out=run_starts[1:])
+        return sorted(set(chain_ids[run_starts].tolist()))
 
     def get_ca_atoms(self) -> struc.AtomArray:
         """Get only the CA (alpha carbon) atoms."""
-        return self.structure[self.structure.atom_name == "CA"]
+        return self.structure[self._ca_atom_mask()]
+
+    def _ca_atom_mask(self) -> np.ndarray:
+        """Get the mask of CA atoms in the structure, computed once."""
+        if self._ca_mask is None:
+            self._ca_mask = self.structure.atom_name == "CA"
+        return self._ca_mask
 
     def get_coordinates(self) -> np.ndarray:
         """Get atomic coordinates as a NumPy array.
@@ -136,12 +343,29 @@ class Protein:
         return self.structure.coord
 
     def get_center_of_mass(self) -> np.ndarray:
-        """Calculate the center of mass of the structure.
+        """Calculate the center of the structure.
+
+        This is the unweighted mean of all atom coordinates (the centroid),
+        computed once per loaded structure.
 
         Returns:
             Array of shape (3,) containing x, y, z coordinates of center.
         """
-        return np.mean(self.structure.coord, axis=0)
+        if self._centroid is None:
+            self._centroid = self.structure.coord.mean(axis=0)
+        return self._centroid.copy()
+
+    def _amino_acid_mask(self) -> np.ndarray:
+        """Get the filter_amino_acids mask of the structure, computed once."""
+        if self._aa_mask is None:
+            self._aa_mask = struc.filter_amino_acids(self.structure)
+        return self._aa_mask
+
+    def _residue_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get residue ids, names and chains shared by the residue getters."""
+        if self._residues is None:
+            self._residues = get_residue_arrays(self.structure, self._amino_acid_mask())
+        return self._residues
 
     def get_residue_info(self) -> list[dict[str, Any]]:
         """Get information about all residues.
@@ -149,7 +373,13 @@ class Protein:
         Returns:
             List of dicts with residue id, name, and chain.
         """
-        return get_residue_info(self.structure)
+        res_ids, res_names, chain_ids = self._residue_arrays()
+        return [
+            {"id": res_id, "name": res_name, "chain": chain_id}
+            for res_id, res_name, chain_id in zip(
+                res_ids.tolist(), res_names.tolist(), chain_ids.tolist()
+            )
+        ]
 
     def get_secondary_structure(self) -> dict[int, str]:
         """Get secondary structure assignment for each residue.
@@ -213,24 +443,90 @@ class Protein:
             - 'one_letter': Single-letter code (str)
             - 'chain': Chain ID (str)
         """
-        residues = self.get_residue_info()
-        logger.debug(f"Protein.get_sequence: got {len(residues)} residues from get_residue_info()")
-        sequence = []
-
-        for res in residues:
-            one_letter = THREE_TO_ONE.get(res["name"], "X")
-            sequence.append({
-                "id": res["id"],
-                "name": res["name"],
-                "one_letter": one_letter,
-                "chain": res["chain"],
-            })
+        res_ids, res_names, chain_ids = self._residue_arrays()
+        logger.debug(f"Protein.get_sequence: got {len(res_ids)} residues")
+
+        # Map all names in one lookup; dicts are only built at the end
+        one_letters = to_one_letter(res_names)
+        sequence = [
+            {"id": res_id, "name": res_name, "one_letter": one_letter, "chain": chain_id}
+            for res_id, res_name, one_letter, chain_id in zip(
+                res_ids.tolist(),
+                res_names.tolist(),
+                one_letters.tolist(),
+                chain_ids.tolist(),
+            )
+        ]
 
         logger.debug(f"Protein.get_sequence: returning {len(sequence)} sequence entries")
         if sequence:
             logger.debug(f"Protein.get_sequence: first 5 entries: {sequence[:5]}")
         return sequence
 
+    def get_sequence_array(self) -> np.ndarray:
+        """Get the protein sequence as a record array (one field per column).
+
+        Holds the same data as get_sequence without building a dict per
+        residue; columns can be sliced and masked directly, e.g.
+        ``seq.one_letter[seq.chain == "A"]``.
+
+        Returns:
+            Record array with fields 'id', 'name', 'one_letter' and 'chain'.
+        """
+        res_ids, res_names, chain_ids = self._residue_arrays()
+        return np.rec.fromarrays(
+            [res_ids, res_names, to_one_letter(res_names), chain_ids],
+            names="id,name,one_letter,chain",
+        )
+
+    def get_chain_sequences(self) -> dict[str, str]:
+        """Get the one-letter sequence of each chain.
+
+        Returns:
+            Dict mapping chain IDs (in order of appearance) to sequences.
+        """
+        if self._chain_sequences is None:
+            res_ids, res_names, chain_ids = self._residue_arrays()
+            one_letters = to_one_letter(res_names)
+            _, first = np.unique(chain_ids, return_index=True)
+            self._chain_sequences = {
+                chain_id: "".join(one_letters[chain_ids == chain_id].tolist())
+                for chain_id in chain_ids[np.sort(first)].tolist()
+            }
+        return dict(self._chain_sequences)
+
+    def _interface(
+        self,
+        binder_chain: str,
+        target_chains: list[str] | None,
+        distance_cutoff: float,
+    ) -> tuple[dict[int, str], dict[int, int]]:
+        """Get interface residues and contact counts, computed once per query.
+
+        Args:
+            binder_chain: Chain identifier for the binder protein.
+            target_chains: Chain identifiers for the target proteins.
+            distance_cutoff: Maximum distance (Å) for interface contacts.
+
+        Returns:
+            Cached tuple of (residue ID -> code, residue ID -> contact count).
+        """
+        if target_chains is None:
+            target_chains = ["A"]
+
+        key = (binder_chain, tuple(target_chains), distance_cutoff)
+        result = self._interface_cache.get(key)
+        if result is None:
+            result = get_interface_residues_and_contacts(
+                self.structure,
+                binder_chain=binder_chain,
+                target_chains=target_chains,
+                distance_cutoff=distance_cutoff,
+                aa_mask=self._amino_acid_mask(),
+            )
+            self._interface_cache[key] = result
+        return result
+
     def get_interface_residues(
         self,
         binder_chain: str = "B",
@@ -247,15 +543,8 @@ class Protein:
         Returns:
             Dictionary mapping residue IDs to single-letter amino acid codes.
         """
-        if target_chains is None:
-            target_chains = ["A"]
-
-        return calc_interface_residues(
-            self.structure,
-            binder_chain=binder_chain,
-            target_chains=target_chains,
-            distance_cutoff=distance_cutoff,
-        )
+        residues, _ = self._interface(binder_chain, target_chains, distance_cutoff)
+        return dict(residues)
 
     def get_interface_contacts(
         self,
@@ -273,15 +562,23 @@ class Protein:
         Returns:
             Dictionary mapping residue IDs to contact counts.
         """
-        if target_chains is None:
-            target_chains = ["A"]
+        _, contacts = self._interface(binder_chain, target_chains, distance_cutoff)
+        return dict(contacts)
 
-        return count_interface_contacts(
-            self.structure,
-            binder_chain=binder_chain,
-            target_chains=target_chains,
-            distance_cutoff=distance_cutoff,
-        )
+    def get_cif_text(self) -> str:
+        """Get the structure as mmCIF text.
+
+        Used to hand BinaryCIF structures to consumers that only read text
+        formats.
+
+        Returns:
+            mmCIF-format text of the structure.
+        """
+        cif_file = pdbx.CIFFile()
+        pdbx.set_structure(cif_file, self.structure)
+        sio = io.StringIO()
+        cif_file.write(sio)
+        return sio.getvalue()
 
     def get_aligned_pdb_text(
         self,
@@ -301,20 +598,72 @@ class Protein:
             ValueError: If alignment fails (missing chain, length mismatch).
         """
         from src.models.alignment import align_on_target_chain
-        import io
 
+        # The reference is usually aligned against many structures in turn,
+        # so reuse its cached CA mask instead of rescanning atom names
         aligned_structure, rmsd = align_on_target_chain(
-            reference.structure, self.structure, align_chain
+            reference.structure,
+            self.structure,
+            align_chain,
+            fixed_ca_mask=reference._ca_atom_mask(),
+            mobile_ca_mask=self._ca_atom_mask(),
         )
 
-        # Write aligned structure to PDB string
-        pdb_file = pdb.PDBFile()
-        pdb_file.set_structure(aligned_structure)
-        sio = io.StringIO()
-        pdb_file.write(sio)
-        return sio.getvalue(), rmsd
+        return _to_pdb_text(aligned_structure), rmsd
 
     def __repr__(self) -> str:
         """Return string representation of the Protein."""
         loaded = "loaded" if self.is_loaded else "not loaded"
         return f"Protein(name='{self.name}', {loaded})"
+
+
+def _to_pdb_text(structure: struc.AtomArray) -> str:
+    """Write a structure as PDB text."""
+    pdb_file = pdb.PDBFile()
+    pdb_file.set_structure(structure)
+    sio = io.StringIO()
+    pdb_file.write(sio)
+    return sio.getvalue()
+
+
+def get_aligned_pdb_texts(
+    reference: Protein,
+    mobiles: list[Protein],
+    align_chain: str,
+    rmsd_cutoff: Optional[float] = None,
+) -> tuple[list[Optional[str]], np.ndarray, list[Optional[str]]]:
+    """Align several proteins onto a reference in one batch.
+
+    Batched counterpart of Protein.get_aligned_pdb_text: all superpositions
+    and RMSDs are computed together by align_many_on_target_chain.
+
+    Args:
+        reference: Reference protein to align onto.
+        mobiles: Proteins to align.
+        align_chain: Chain ID to use for alignment.
+        rmsd_cutoff: Skip proteins whose RMSD is provably above this value.
+
+    Returns:
+        Tuple of (PDB-format texts, RMSDs, error messages), one entry per
+        mobile protein; proteins that could not be aligned have None, NaN
+        and the reason, respectively. Proteins skipped by rmsd_cutoff have
+        None, their RMSD lower bound and None.
+
+    Raises:
+        ValueError: If the chain is missing from the reference.
+    """
+    from src.models.alignment import align_many_on_target_chain
+
+    aligned, rmsds, errors = align_many_on_target_chain(
+        reference.structure,
+        [mobile.structure for mobile in mobiles],
+        align_chain,
+        fixed_ca_mask=reference._ca_atom_mask(),
+        mobile_ca_masks=[mobile._ca_atom_mask() for mobile in mobiles],
+        rmsd_cutoff=rmsd_cutoff,
+    )
+    pdb_texts = [
+        _to_pdb_text(structure) if structure is not None else None
+        for structure in aligned
+    ]
+    return pdb_texts, rmsds, errors
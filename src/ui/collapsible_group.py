@@ -1,5 +1,7 @@
 """Collapsible group box widget for organizing panel sections."""
 
+from typing import Callable, Optional
+
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget,
@@ -12,6 +14,21 @@ from PyQt6.QtWidgets import (
 )
 
 
+class _Header(QWidget):
+    """Header bar that emits clicked when pressed.
+
+    Signals:
+        clicked: Emitted on a mouse press anywhere on the header.
+    """
+
+    clicked = pyqtSignal()
+
+    def mousePressEvent(self, event):
+        """Emit clicked for a press on the header."""
+        self.clicked.emit()
+        super().mousePressEvent(event)
+
+
 class CollapsibleGroupBox(QWidget):
     """A group box with a clickable header that toggles content visibility.
 
@@ -21,18 +38,33 @@ class CollapsibleGroupBox(QWidget):
 
     collapsed_changed = pyqtSignal(bool)
 
-    def __init__(self, title: str, collapsed: bool = False, parent=None):
+    def __init__(
+        self,
+        title: str,
+        collapsed: bool = False,
+        parent=None,
+        content_builder: Optional[Callable[[QVBoxLayout], None]] = None,
+    ):
         """Initialize the collapsible group box.
 
         Args:
             title: Header text.
             collapsed: Whether to start collapsed.
             parent: Parent widget.
+            content_builder: Optional callable that populates the content
+                layout. When the group starts collapsed it is deferred until
+                the group is first expanded.
         """
         super().__init__(parent)
         self._collapsed = collapsed
         self._title = title
+        self._pending_builder: Optional[Callable[[QVBoxLayout], None]] = None
         self._init_ui(title)
+        if content_builder is not None:
+            if collapsed:
+                self._pending_builder = content_builder
+            else:
+                content_builder(self._content_layout)
         self._set_collapsed_visual(collapsed)
 
     def _init_ui(self, title: str):
@@ -42,7 +74,7 @@ class CollapsibleGroupBox(QWidget):
         layout.setSpacing(0)
 
         # Header bar
-        self._header = QWidget()
+        self._header = _Header()
         self._header.setCursor(Qt.CursorShape.PointingHandCursor)
         self._header.setStyleSheet(
             "QWidget { background-color: palette(midlight); "
@@ -66,7 +98,7 @@ class CollapsibleGroupBox(QWidget):
         header_layout.addWidget(self._title_label)
         header_layout.addStretch()
 
-        self._header.mousePressEvent = lambda e: self.toggle()
+        self._header.clicked.connect(self.toggle)
         layout.addWidget(self._header)
 
         # Content area
@@ -97,6 +129,11 @@ class CollapsibleGroupBox(QWidget):
         """
         self._content_layout.addLayout(layout)
 
+    @property
+    def is_content_built(self) -> bool:
+        """Whether the deferred content builder (if any) has run."""
+        return self._pending_builder is None
+
     @property
     def is_collapsed(self) -> bool:
         """Whether the group is collapsed."""
@@ -125,6 +162,10 @@ class CollapsibleGroupBox(QWidget):
 
     def _set_collapsed_visual(self, collapsed: bool) -> None:
         """Update visual state for collapsed/expanded."""
+        if not collapsed and self._pending_builder is not None:
+            builder = self._pending_builder
+            self._pending_builder = None
+            builder(self._content_layout)
         self._content.setVisible(not collapsed)
         self._arrow.setArrowType(
             Qt.ArrowType.RightArrow if collapsed else Qt.ArrowType.DownArrow
@@ -2,8 +2,9 @@
 
 import logging
 from pathlib import Path
+from typing import Any
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -11,12 +12,13 @@ from PyQt6.QtWidgets import (
     QLabel,
     QPushButton,
     QComboBox,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QDoubleSpinBox,
+    QTreeView,
     QHeaderView,
     QFrame,
     QMessageBox,
     QFileDialog,
+    QInputDialog,
 )
 from PyQt6.QtGui import QColor
 
@@ -25,7 +27,7 @@ from src.config.color_schemes import CHAIN_COLORS
 logger = logging.getLogger(__name__)
 
 # Distinct colors for comparison structures (skip index 0 = primary)
-COMPARISON_COLORS = [
+COMPARISON_COLORS = (
     "#ff7f0e",  # orange
     "#2ca02c",  # green
     "#d62728",  # red
@@ -34,7 +36,143 @@ COMPARISON_COLORS = [
     "#e377c2",  # pink
     "#bcbd22",  # olive
     "#17becf",  # cyan
-]
+)
+
+# Swatch colors for the list, built once instead of per row or paint
+COMPARISON_QCOLORS = tuple(QColor(c) for c in COMPARISON_COLORS)
+
+
+class ComparisonModel(QAbstractTableModel):
+    """Table model for the structures added to a comparison."""
+
+    HEADERS = ["Visible", "Name", "RMSD (A)", "Color"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # [{name, path, color, swatch, visible, rmsd}, ...] in display order
+        self._rows: list[dict[str, Any]] = []
+
+    def add_structures(self, entries: list[tuple[str, str]]) -> None:
+        """Append structures as one batch of rows.
+
+        Args:
+            entries: (name, file path) pairs to add.
+        """
+        if not entries:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(entries) - 1)
+        for i, (name, file_path) in enumerate(entries, start):
+            color_index = i % len(COMPARISON_COLORS)
+            self._rows.append({
+                "name": name,
+                "path": file_path,
+                "color": COMPARISON_COLORS[color_index],
+                "swatch": COMPARISON_QCOLORS[color_index],
+                "visible": True,
+                "rmsd": "—",
+            })
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+    def colors(self) -> list[str]:
+        """Get the assigned color of each row."""
+        return [row["color"] for row in self._rows]
+
+    def set_results(self, results: list[dict]) -> None:
+        """Show alignment results in the RMSD column.
+
+        Args:
+            results: List of dicts with keys: name, rmsd, error, above_cutoff,
+                in row order.
+        """
+        for row, result in zip(self._rows, results):
+            if "error" in result:
+                row["rmsd"] = f"Error: {result['error']}"
+                row["visible"] = False
+            elif result.get("above_cutoff"):
+                # Only a lower bound was computed for these
+                row["rmsd"] = f"≥ {result['rmsd']:.3f}"
+                row["visible"] = False
+            else:
+                row["rmsd"] = f"{result['rmsd']:.3f}"
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, 2)
+            )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 1:
+                return row["name"]
+            if col == 2:
+                return row["rmsd"]
+        elif role == Qt.ItemDataRole.CheckStateRole and col == 0:
+            return Qt.CheckState.Checked if row["visible"] else Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.BackgroundRole and col == 3:
+            return row["swatch"]
+        elif role == Qt.ItemDataRole.UserRole:
+            if col == 1:
+                return row["path"]
+            if col == 3:
+                return row["color"]
+
+        return None
+
+    def setData(
+        self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        if (
+            index.isValid()
+            and index.column() == 0
+            and role == Qt.ItemDataRole.CheckStateRole
+        ):
+            checked = Qt.CheckState(value) == Qt.CheckState.Checked
+            self._rows[index.row()]["visible"] = checked
+            self.dataChanged.emit(index, index, [role])
+            return True
+        return False
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+            and 0 <= section < len(self.HEADERS)
+        ):
+            return self.HEADERS[section]
+        return None
 
 
 class ComparisonDialog(QDialog):
@@ -66,6 +204,9 @@ class ComparisonDialog(QDialog):
         self._grouping_manager = grouping_manager
         self._file_list_paths = file_list_paths or []
         self._comparison_files: list[str] = []  # file paths to compare
+        # Membership index for _comparison_files and stems seen so far
+        self._comparison_set: set[str] = set()
+        self._stem_cache: dict[str, str] = {}
         self._results: list[dict] = []  # [{name, path, rmsd, color, visible}, ...]
 
         self._init_ui()
@@ -89,6 +230,17 @@ class ComparisonDialog(QDialog):
         for chain in self._chains:
             self._chain_combo.addItem(chain)
         chain_layout.addWidget(self._chain_combo)
+
+        chain_layout.addWidget(QLabel("RMSD cutoff (A):"))
+        self._cutoff_spin = QDoubleSpinBox()
+        self._cutoff_spin.setRange(0.0, 100.0)
+        self._cutoff_spin.setDecimals(1)
+        self._cutoff_spin.setSingleStep(0.5)
+        self._cutoff_spin.setSpecialValueText("Off")
+        self._cutoff_spin.setToolTip(
+            "Skip superimposing structures whose RMSD is certain to exceed this"
+        )
+        chain_layout.addWidget(self._cutoff_spin)
         chain_layout.addStretch()
         layout.addLayout(chain_layout)
 
@@ -120,9 +272,12 @@ class ComparisonDialog(QDialog):
         add_layout.addStretch()
         layout.addLayout(add_layout)
 
-        # Results tree
-        self._tree = QTreeWidget()
-        self._tree.setHeaderLabels(["Visible", "Name", "RMSD (A)", "Color"])
+        # Results tree, backed by a model so rows are added in batches
+        self._model = ComparisonModel(self)
+        self._tree = QTreeView()
+        self._tree.setModel(self._model)
+        self._tree.setUniformRowHeights(True)
+        self._tree.setAnimated(False)
         self._tree.header().setSectionResizeMode(
             0, QHeaderView.ResizeMode.ResizeToContents
         )
@@ -136,7 +291,6 @@ class ComparisonDialog(QDialog):
             3, QHeaderView.ResizeMode.ResizeToContents
         )
         self._tree.setRootIsDecorated(False)
-        self._tree.itemChanged.connect(self._on_item_changed)
         layout.addWidget(self._tree, 1)
 
         # Status label
@@ -179,26 +333,19 @@ class ComparisonDialog(QDialog):
             return
 
         # Simple selection via combo dialog
-        from PyQt6.QtWidgets import QInputDialog
-
-        group_names = [g.name for g in groups]
+        groups_by_name = {g.name: g for g in groups}
+        group_names = list(groups_by_name)
         name, ok = QInputDialog.getItem(
             self, "Select Group", "Group:", group_names, 0, False
         )
         if not ok:
             return
 
-        # Find the group
-        selected_group = next((g for g in groups if g.name == name), None)
+        selected_group = groups_by_name.get(name)
         if not selected_group:
             return
 
-        added = 0
-        for member_path in selected_group.members:
-            if member_path not in self._comparison_files:
-                self._comparison_files.append(member_path)
-                self._add_tree_item(Path(member_path).stem, member_path)
-                added += 1
+        added = self._add_structures(selected_group.members)
 
         self._align_btn.setEnabled(len(self._comparison_files) > 0)
         self._status_label.setText(
@@ -211,56 +358,60 @@ class ComparisonDialog(QDialog):
             self,
             "Select Structure Files",
             "",
-            "Protein files (*.pdb *.cif);;All files (*)",
+            "Protein files (*.pdb *.cif *.bcif);;All files (*)",
         )
         if not file_paths:
             return
 
-        added = 0
-        for fp in file_paths:
-            if fp not in self._comparison_files:
-                self._comparison_files.append(fp)
-                self._add_tree_item(Path(fp).stem, fp)
-                added += 1
+        added = self._add_structures(file_paths)
 
         self._align_btn.setEnabled(len(self._comparison_files) > 0)
         self._status_label.setText(
             f"Added {added} file(s) ({len(self._comparison_files)} total)"
         )
 
-    def _add_tree_item(self, name: str, file_path: str) -> None:
-        """Add an item to the tree widget."""
-        idx = self._tree.topLevelItemCount()
-        color = COMPARISON_COLORS[idx % len(COMPARISON_COLORS)]
+    def _add_structures(self, file_paths: list[str]) -> int:
+        """Add the structures not yet in the comparison.
 
-        item = QTreeWidgetItem()
-        item.setCheckState(0, Qt.CheckState.Checked)
-        item.setText(1, name)
-        item.setText(2, "—")
-        item.setData(1, Qt.ItemDataRole.UserRole, file_path)
-        item.setData(3, Qt.ItemDataRole.UserRole, color)
-
-        # Color swatch in text
-        item.setText(3, "")
-        item.setBackground(3, QColor(color))
+        Args:
+            file_paths: Structure file paths to add.
 
-        self._tree.addTopLevelItem(item)
+        Returns:
+            Number of structures added.
+        """
+        # New paths in order, without repeats, then added in one go
+        new_paths = list(dict.fromkeys(
+            fp for fp in file_paths if fp not in self._comparison_set
+        ))
+        self._comparison_files.extend(new_paths)
+        self._comparison_set.update(new_paths)
+
+        entries = []
+        for file_path in new_paths:
+            stem = self._stem_cache.get(file_path)
+            if stem is None:
+                stem = self._stem_cache[file_path] = Path(file_path).stem
+            entries.append((stem, file_path))
+
+        if entries:
+            # One insert batch; with updates off the ResizeToContents columns
+            # and the viewport are measured and painted once afterwards
+            self._tree.setUpdatesEnabled(False)
+            try:
+                self._model.add_structures(entries)
+            finally:
+                self._tree.setUpdatesEnabled(True)
+        return len(entries)
 
     def _on_clear(self) -> None:
         """Clear all comparison structures."""
         self._comparison_files.clear()
+        self._comparison_set.clear()
         self._results.clear()
-        self._tree.clear()
+        self._model.clear()
         self._align_btn.setEnabled(False)
         self._status_label.setText("Add structures to compare")
 
-    def _on_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
-        """Handle checkbox toggle for visibility."""
-        if column != 0:
-            return
-        # This will be connected to viewer visibility in MainWindow
-        pass
-
     def _on_align_all(self) -> None:
         """Signal that alignment should proceed (handled by MainWindow)."""
         self._status_label.setText("Aligning...")
@@ -278,32 +429,29 @@ class ComparisonDialog(QDialog):
         return self._chain_combo.currentText()
 
     @property
-    def comparison_files(self) -> list[str]:
-        """Get list of file paths to compare."""
-        return self._comparison_files.copy()
+    def rmsd_cutoff(self) -> float | None:
+        """Get the RMSD cutoff, or None if no cutoff is set."""
+        value = self._cutoff_spin.value()
+        return value if value > 0 else None
+
+    @property
+    def comparison_files(self) -> tuple[str, ...]:
+        """Get the file paths to compare, in the order they were added."""
+        return tuple(self._comparison_files)
 
     def get_comparison_colors(self) -> list[str]:
         """Get the assigned color for each comparison file."""
-        colors = []
-        for i in range(self._tree.topLevelItemCount()):
-            item = self._tree.item(i) if hasattr(self._tree, 'item') else self._tree.topLevelItem(i)
-            color = item.data(3, Qt.ItemDataRole.UserRole)
-            colors.append(color or COMPARISON_COLORS[i % len(COMPARISON_COLORS)])
-        return colors
+        return self._model.colors()
 
     def set_alignment_results(self, results: list[dict]) -> None:
         """Update the tree with alignment results.
 
         Args:
-            results: List of dicts with keys: name, rmsd, error.
+            results: List of dicts with keys: name, rmsd, error, above_cutoff.
         """
         self._results = results
-        for i, result in enumerate(results):
-            if i >= self._tree.topLevelItemCount():
-                break
-            item = self._tree.topLevelItem(i)
-            if "error" in result:
-                item.setText(2, f"Error: {result['error']}")
-                item.setCheckState(0, Qt.CheckState.Unchecked)
-            else:
-                item.setText(2, f"{result['rmsd']:.3f}")
+        self._tree.setUpdatesEnabled(False)
+        try:
+            self._model.set_results(results)
+        finally:
+            self._tree.setUpdatesEnabled(True)
@@ -12,13 +12,13 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QGroupBox,
     QScrollArea,
-    QWidget,
     QFrame,
+    QMessageBox,
 )
 
 
-class ChainCheckBox(QWidget):
-    """A checkbox widget for a chain with info display."""
+class ChainCheckBox(QCheckBox):
+    """A checkbox for a chain, labelled with its residue count."""
 
     def __init__(
         self,
@@ -35,26 +35,12 @@ class ChainCheckBox(QWidget):
             is_target: Whether this chain is pre-selected as target.
             parent: Parent widget.
         """
-        super().__init__(parent)
+        # One widget per chain; QCheckBox text is plain, so no label styling
+        super().__init__(f"Chain {chain_id}  ({num_residues} residues)", parent)
         self._chain_id = chain_id
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 2, 0, 2)
-        layout.setSpacing(8)
-
-        self._checkbox = QCheckBox()
-        self._checkbox.setChecked(is_target)
-        layout.addWidget(self._checkbox)
-
-        self._label = QLabel(f"Chain {chain_id}")
-        self._label.setStyleSheet("font-weight: bold;")
-        layout.addWidget(self._label)
-
-        self._info = QLabel(f"({num_residues} residues)")
-        self._info.setStyleSheet("color: #666;")
-        layout.addWidget(self._info)
-
-        layout.addStretch()
+        if is_target:
+            # Checkboxes start unchecked, so only presets need a call
+            self.setChecked(True)
 
     @property
     def chain_id(self) -> str:
@@ -64,11 +50,11 @@ class ChainCheckBox(QWidget):
     @property
     def is_checked(self) -> bool:
         """Check if this chain is selected as target."""
-        return self._checkbox.isChecked()
+        return self.isChecked()
 
     def set_checked(self, checked: bool) -> None:
         """Set the checked state."""
-        self._checkbox.setChecked(checked)
+        self.setChecked(checked)
 
 
 class TargetDesignationDialog(QDialog):
@@ -109,6 +95,7 @@ class TargetDesignationDialog(QDialog):
         """
         super().__init__(parent)
         self._file_path = file_path
+        self._file_name = Path(file_path).name
         self._chains = chains
         self._preset_targets = preset_targets or []
         self._preset_binders = preset_binders or []
@@ -127,13 +114,15 @@ class TargetDesignationDialog(QDialog):
         layout.setSpacing(12)
 
         # File info
-        file_name = Path(self._file_path).name
-        file_label = QLabel(f"<b>Structure:</b> {file_name}")
+        file_label = QLabel(f"<b>Structure:</b> {self._file_name}")
         layout.addWidget(file_label)
 
+        # Chains in display order, shared by the summary and both groups
+        sorted_chains = sorted(self._chains.items())
+
         # Chain summary
         chains_str = ", ".join(
-            f"{cid} ({count} res)" for cid, count in sorted(self._chains.items())
+            f"{cid} ({count} res)" for cid, count in sorted_chains
         )
         chains_label = QLabel(f"<b>Chains found:</b> {chains_str}")
         chains_label.setWordWrap(True)
@@ -158,7 +147,7 @@ class TargetDesignationDialog(QDialog):
         target_layout = QVBoxLayout(target_group)
         target_layout.setSpacing(2)
 
-        for chain_id, num_residues in sorted(self._chains.items()):
+        for chain_id, num_residues in sorted_chains:
             is_preset = chain_id in self._preset_targets
             checkbox = ChainCheckBox(chain_id, num_residues, is_preset)
             self._target_checkboxes.append(checkbox)
@@ -171,7 +160,7 @@ class TargetDesignationDialog(QDialog):
         binder_layout = QVBoxLayout(binder_group)
         binder_layout.setSpacing(2)
 
-        for chain_id, num_residues in sorted(self._chains.items()):
+        for chain_id, num_residues in sorted_chains:
             is_preset = chain_id in self._preset_binders
             checkbox = ChainCheckBox(chain_id, num_residues, is_preset)
             self._binder_checkboxes.append(checkbox)
@@ -181,7 +170,6 @@ class TargetDesignationDialog(QDialog):
 
         # Auto-select suggestion if exactly 2 chains and no presets
         if len(self._chains) == 2 and not self._preset_targets and not self._preset_binders:
-            chain_ids = sorted(self._chains.keys())
             # Assume first chain (usually A) is target, second (usually B) is binder
             self._target_checkboxes[0].set_checked(True)
             self._binder_checkboxes[1].set_checked(True)
@@ -218,12 +206,17 @@ class TargetDesignationDialog(QDialog):
 
     def _on_apply(self):
         """Handle apply button click."""
-        targets = self.target_chains
-        binders = self.binder_chains
+        # One walk over both checkbox lists (they hold the same chains)
+        targets = []
+        binders = []
+        for target_cb, binder_cb in zip(self._target_checkboxes, self._binder_checkboxes):
+            if target_cb.is_checked:
+                targets.append(target_cb.chain_id)
+            if binder_cb.is_checked:
+                binders.append(binder_cb.chain_id)
 
         # Validate: at least one target and one binder
         if not targets:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -232,7 +225,6 @@ class TargetDesignationDialog(QDialog):
             return
 
         if not binders:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -241,9 +233,8 @@ class TargetDesignationDialog(QDialog):
             return
 
         # Warn if a chain is both target and binder
-        overlap = set(targets) & set(binders)
+        overlap = set(targets).intersection(binders)
         if overlap:
-            from PyQt6.QtWidgets import QMessageBox
             result = QMessageBox.warning(
                 self,
                 "Overlapping Selection",
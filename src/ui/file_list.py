@@ -1,16 +1,15 @@
 """File list widget for browsing protein structure files with grouping support."""
 
-from pathlib import Path
-from typing import TYPE_CHECKING
+import os
+from typing import TYPE_CHECKING, Any
 
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QAbstractItemModel, QModelIndex
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QFileDialog,
     QLabel,
     QMessageBox,
@@ -23,6 +22,196 @@ if TYPE_CHECKING:
     from src.models.grouping import GroupingManager, StructureGroup
 
 
+class _FileTreeNode:
+    """One row of the file tree: a group header or a structure file."""
+
+    __slots__ = (
+        "text", "tooltip", "file_path", "group_id", "expanded",
+        "parent", "row", "children", "pending",
+    )
+
+    def __init__(
+        self,
+        text: str,
+        tooltip: str = "",
+        file_path: str | None = None,
+        group_id: str | None = None,
+        expanded: bool = False,
+    ):
+        self.text = text
+        self.tooltip = tooltip
+        self.file_path = file_path
+        self.group_id = group_id
+        self.expanded = expanded
+        self.parent: "_FileTreeNode | None" = None
+        self.row = 0
+        self.children: list["_FileTreeNode"] = []
+        # (file path, name) pairs whose nodes are built on first expand
+        self.pending: list[tuple[str, str]] | None = None
+
+    def add_child(self, child: "_FileTreeNode") -> "_FileTreeNode":
+        """Append a child node and return it."""
+        child.parent = self
+        child.row = len(self.children)
+        self.children.append(child)
+        return child
+
+    def add_children(self, children: list["_FileTreeNode"]) -> None:
+        """Append a prebuilt list of child nodes in one step."""
+        start = len(self.children)
+        for row, child in enumerate(children, start):
+            child.parent = self
+            child.row = row
+        self.children.extend(children)
+
+
+class FileTreeModel(QAbstractItemModel):
+    """Tree model of structure files, optionally nested under group headers.
+
+    The whole tree is built as plain nodes and swapped in with one model
+    reset; the view only creates what it draws.
+    """
+
+    # Data roles for file paths and custom group IDs
+    FILE_PATH_ROLE = Qt.ItemDataRole.UserRole
+    GROUP_ID_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = _FileTreeNode("")
+        # File path -> first node showing it, and -> group still holding it
+        # as a pending child
+        self._path_nodes: dict[str, _FileTreeNode] = {}
+        self._pending_paths: dict[str, _FileTreeNode] = {}
+
+    @property
+    def root(self) -> _FileTreeNode:
+        """Get the (invisible) root node."""
+        return self._root
+
+    def set_root(self, root: _FileTreeNode) -> None:
+        """Replace the whole tree.
+
+        Args:
+            root: Root node whose children are the top-level rows.
+        """
+        self.beginResetModel()
+        self._root = root
+        self._path_nodes = {}
+        self._pending_paths = {}
+        self._index_nodes(root)
+        self.endResetModel()
+
+    def _index_nodes(self, node: _FileTreeNode) -> None:
+        """Record the file nodes under node, in display order."""
+        for child in node.children:
+            if child.file_path is not None:
+                self._path_nodes.setdefault(child.file_path, child)
+            if child.pending:
+                for path, _ in child.pending:
+                    self._pending_paths.setdefault(path, child)
+            if child.children:
+                self._index_nodes(child)
+
+    def index_for_path(self, file_path: str) -> QModelIndex:
+        """Get the index of the first row showing a file.
+
+        Lazily filled groups holding the file are fetched first.
+
+        Args:
+            file_path: Path of the structure file.
+
+        Returns:
+            The row's index, or an invalid index if the file is not shown.
+        """
+        node = self._path_nodes.get(file_path)
+        if node is None:
+            group = self._pending_paths.get(file_path)
+            if group is None:
+                return QModelIndex()
+            self.fetchMore(self.node_index(group))
+            node = self._path_nodes.get(file_path)
+            if node is None:
+                return QModelIndex()
+        return self.node_index(node)
+
+    def node_index(self, node: _FileTreeNode) -> QModelIndex:
+        """Get the model index of a node in the current tree."""
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        parent_node = parent.internalPointer() if parent.isValid() else self._root
+        return self.createIndex(row, column, parent_node.children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if node.parent is None or node.parent is self._root:
+            return QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        node = parent.internalPointer() if parent.isValid() else self._root
+        return len(node.children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.column() > 0:
+            return False
+        node = parent.internalPointer() if parent.isValid() else self._root
+        return bool(node.children or node.pending)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return parent.isValid() and bool(parent.internalPointer().pending)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Build the file nodes of a lazily filled group."""
+        if not parent.isValid():
+            return
+        node = parent.internalPointer()
+        pending = node.pending
+        if not pending:
+            return
+        node.pending = None
+        start = len(node.children)
+        self.beginInsertRows(parent, start, start + len(pending) - 1)
+        children = [_file_node(path, name) for path, name in pending]
+        node.add_children(children)
+        for child in children:
+            self._pending_paths.pop(child.file_path, None)
+            self._path_nodes.setdefault(child.file_path, child)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.text
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return node.tooltip or None
+        if role == self.FILE_PATH_ROLE:
+            return node.file_path
+        if role == self.GROUP_ID_ROLE:
+            return node.group_id
+        return None
+
+
+def _file_node(file_path: str, name: str) -> _FileTreeNode:
+    """Create the tree node for one structure file."""
+    return _FileTreeNode(name, tooltip=file_path, file_path=file_path)
+
+
 class FileListWidget(QWidget):
     """Widget for selecting and listing protein structure files with grouping.
 
@@ -40,9 +229,9 @@ class FileListWidget(QWidget):
     file_selected = pyqtSignal(str)  # Emits the file path
     folder_changed = pyqtSignal(str)  # Emits the folder path
 
-    # Data roles for storing data in tree items
-    FILE_PATH_ROLE = Qt.ItemDataRole.UserRole
-    GROUP_ID_ROLE = Qt.ItemDataRole.UserRole + 1
+    # Data roles for the tree model
+    FILE_PATH_ROLE = FileTreeModel.FILE_PATH_ROLE
+    GROUP_ID_ROLE = FileTreeModel.GROUP_ID_ROLE
 
     def __init__(self, parent=None):
         """Initialize the file list widget.
@@ -52,7 +241,15 @@ class FileListWidget(QWidget):
         """
         super().__init__(parent)
         self._current_folder: str | None = None
-        self._files: list[Path] = []
+        # Folder contents as parallel lists of path strings and file names,
+        # converted once per load rather than per tree rebuild
+        self._file_paths: list[str] = []
+        self._file_names: list[str] = []
+        # Path -> position in the lists above
+        self._file_index: dict[str, int] = {}
+        # Snapshot of the files and groups the current tree was built from
+        self._files_key: tuple[str, ...] = ()
+        self._tree_key: tuple | None = None
         self._grouping_manager: "GroupingManager | None" = None
         self._init_ui()
 
@@ -90,12 +287,15 @@ class FileListWidget(QWidget):
         self._count_label.setStyleSheet("QLabel { color: #666; font-size: 11px; }")
         layout.addWidget(self._count_label)
 
-        # Tree widget for files
-        self._file_tree = QTreeWidget()
+        # Tree view for files
+        self._model = FileTreeModel(self)
+        self._file_tree = QTreeView()
+        self._file_tree.setModel(self._model)
         self._file_tree.setHeaderHidden(True)
+        self._file_tree.setUniformRowHeights(True)
         self._file_tree.setToolTip("Click to select a file, double-click to load")
-        self._file_tree.itemClicked.connect(self._on_item_clicked)
-        self._file_tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self._file_tree.clicked.connect(self._on_item_clicked)
+        self._file_tree.doubleClicked.connect(self._on_item_double_clicked)
         self._file_tree.setIndentation(16)
         self._file_tree.setAnimated(True)
         layout.addWidget(self._file_tree, 1)  # Stretch factor 1 to fill space
@@ -121,7 +321,7 @@ class FileListWidget(QWidget):
         dialog.setFileMode(QFileDialog.FileMode.Directory)
         dialog.setOption(QFileDialog.Option.ShowDirsOnly, False)
         dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
-        dialog.setNameFilters(["Protein files (*.pdb *.cif)", "JSON files (*.json)", "All files (*)"])
+        dialog.setNameFilters(["Protein files (*.pdb *.cif *.bcif)", "JSON files (*.json)", "All files (*)"])
 
         if dialog.exec() == QFileDialog.DialogCode.Accepted:
             folder = dialog.selectedFiles()[0]
@@ -134,7 +334,11 @@ class FileListWidget(QWidget):
             folder_path: Path to the folder to load.
         """
         try:
-            self._files = get_protein_files(folder_path)
+            files = get_protein_files(folder_path)
+            self._file_paths = [str(f) for f in files]
+            self._file_names = [f.name for f in files]
+            self._file_index = {path: i for i, path in enumerate(self._file_paths)}
+            self._files_key = tuple(self._file_paths)
             self._current_folder = folder_path
             self._refresh_button.setEnabled(True)
 
@@ -163,88 +367,155 @@ class FileListWidget(QWidget):
             self.load_folder(self._current_folder)
 
     def _populate_tree(self):
-        """Populate the tree widget based on available groups.
+        """Populate the tree based on available groups.
 
         Shows a 2-level hierarchy if target groups exist, otherwise a flat list.
-        Custom groups are shown as separate sections.
+        Custom groups are shown as separate sections. The tree is left as is
+        when the files and groups are unchanged since it was last built.
         """
-        self._file_tree.clear()
+        manager = self._grouping_manager
+        target_groups = manager.get_target_groups() if manager else []
+        custom_groups = manager.get_custom_groups() if manager else []
+        binder_subgroups = [
+            manager.compute_binder_subgroups(group) for group in target_groups
+        ]
+
+        tree_key = self._make_tree_key(target_groups, binder_subgroups, custom_groups)
+        if tree_key == self._tree_key:
+            return
+        self._tree_key = tree_key
 
-        if not self._files:
+        root = _FileTreeNode("")
+
+        if not self._file_paths:
+            self._model.set_root(root)
             self._count_label.setText("0 files found")
             return
 
-        has_target_groups = (
-            self._grouping_manager is not None
-            and bool(self._grouping_manager.get_target_groups())
-        )
-        has_custom_groups = (
-            self._grouping_manager is not None
-            and bool(self._grouping_manager.get_custom_groups())
+        if target_groups or custom_groups:
+            self._populate_grouped(root, target_groups, binder_subgroups, custom_groups)
+        else:
+            self._populate_flat(root)
+
+        # Swap the tree in and expand its groups as one repaint
+        self._file_tree.setUpdatesEnabled(False)
+        try:
+            self._model.set_root(root)
+            self._apply_expansion(root)
+        finally:
+            self._file_tree.setUpdatesEnabled(True)
+
+    def _make_tree_key(
+        self,
+        target_groups: list["StructureGroup"],
+        binder_subgroups: list[list["StructureGroup"]],
+        custom_groups: list["StructureGroup"],
+    ) -> tuple:
+        """Snapshot everything the tree's nodes are built from.
+
+        Groups are edited in place, so the snapshot copies their members and
+        the metadata shown in tooltips instead of holding the group objects.
+
+        Args:
+            target_groups: Target groups to show.
+            binder_subgroups: Binder sub-groups of each target group.
+            custom_groups: Custom groups to show.
+
+        Returns:
+            Tuple that compares equal for trees that would be identical.
+        """
+        return (
+            self._files_key,
+            tuple(
+                (
+                    group.name,
+                    tuple(group.metadata.get("target_chains", [])),
+                    tuple(
+                        (
+                            subgroup.name,
+                            subgroup.metadata.get("binder_preview", ""),
+                            tuple(subgroup.members),
+                        )
+                        for subgroup in subgroups
+                    ),
+                )
+                for group, subgroups in zip(target_groups, binder_subgroups)
+            ),
+            tuple(
+                (
+                    group.id,
+                    group.name,
+                    tuple(group.members),
+                    group.metadata.get("source_chain"),
+                    group.metadata.get("chain_length"),
+                    group.metadata.get("sequence_preview"),
+                )
+                for group in custom_groups
+            ),
         )
 
-        if has_target_groups or has_custom_groups:
-            self._populate_grouped()
-        else:
-            self._populate_flat()
+    def _apply_expansion(self, root: _FileTreeNode) -> None:
+        """Expand the group nodes built as expanded."""
+        for group_node in root.children:
+            if group_node.expanded:
+                self._file_tree.setExpanded(self._model.node_index(group_node), True)
+            for child in group_node.children:
+                if child.expanded:
+                    self._file_tree.setExpanded(self._model.node_index(child), True)
 
-    def _populate_flat(self):
+    def _populate_flat(self, root: _FileTreeNode):
         """Populate tree as flat list (no grouping)."""
-        for file_path in self._files:
-            item = QTreeWidgetItem([file_path.name])
-            item.setData(0, self.FILE_PATH_ROLE, str(file_path))
-            item.setToolTip(0, str(file_path))
-            self._file_tree.addTopLevelItem(item)
+        root.add_children([
+            _file_node(file_path, name)
+            for file_path, name in zip(self._file_paths, self._file_names)
+        ])
 
         # Update count label
-        count = len(self._files)
+        count = len(self._file_paths)
         self._count_label.setText(f"{count} file{'s' if count != 1 else ''} found")
 
-    def _populate_grouped(self):
+    def _populate_grouped(
+        self,
+        root: _FileTreeNode,
+        target_groups: list["StructureGroup"],
+        binder_subgroups: list[list["StructureGroup"]],
+        custom_groups: list["StructureGroup"],
+    ):
         """Populate tree with 2-level target/binder hierarchy and custom groups."""
         grouped_paths: set[str] = set()
 
         # --- Target groups (with binder sub-groups) ---
-        target_groups = self._grouping_manager.get_target_groups() if self._grouping_manager else []
-
-        for group in target_groups:
+        for group, subgroups in zip(target_groups, binder_subgroups):
             target_chains = group.metadata.get("target_chains", [])
-            group_item = QTreeWidgetItem([f"{group.name}"])
-            group_item.setExpanded(True)
-            group_item.setToolTip(0, f"Target chains: {', '.join(target_chains)}")
-
-            # Compute binder sub-groups
-            subgroups = self._grouping_manager.compute_binder_subgroups(group)
+            group_item = root.add_child(_FileTreeNode(
+                f"{group.name}",
+                tooltip=f"Target chains: {', '.join(target_chains)}",
+                expanded=True,
+            ))
 
             for subgroup in subgroups:
                 if subgroup.count > 1:
                     # Multiple structures with same binder → create sub-group node
-                    sub_item = QTreeWidgetItem([subgroup.name])
-                    sub_item.setExpanded(True)
-                    sub_item.setToolTip(0, f"Binder sequence: {subgroup.metadata.get('binder_preview', '')}")
-
-                    for file_path in subgroup.members:
-                        grouped_paths.add(file_path)
-                        file_item = QTreeWidgetItem([Path(file_path).name])
-                        file_item.setData(0, self.FILE_PATH_ROLE, file_path)
-                        file_item.setToolTip(0, file_path)
-                        sub_item.addChild(file_item)
-
-                    group_item.addChild(sub_item)
+                    sub_item = group_item.add_child(_FileTreeNode(
+                        subgroup.name,
+                        tooltip=f"Binder sequence: {subgroup.metadata.get('binder_preview', '')}",
+                        expanded=True,
+                    ))
+
+                    grouped_paths.update(subgroup.members)
+                    sub_item.add_children([
+                        _file_node(file_path, os.path.basename(file_path))
+                        for file_path in subgroup.members
+                    ])
                 else:
                     # Single structure → add directly under target group
-                    for file_path in subgroup.members:
-                        grouped_paths.add(file_path)
-                        file_item = QTreeWidgetItem([Path(file_path).name])
-                        file_item.setData(0, self.FILE_PATH_ROLE, file_path)
-                        file_item.setToolTip(0, file_path)
-                        group_item.addChild(file_item)
-
-            self._file_tree.addTopLevelItem(group_item)
+                    grouped_paths.update(subgroup.members)
+                    group_item.add_children([
+                        _file_node(file_path, os.path.basename(file_path))
+                        for file_path in subgroup.members
+                    ])
 
         # --- Custom groups (from binder/chain search) ---
-        custom_groups = self._grouping_manager.get_custom_groups() if self._grouping_manager else []
-
         for group in custom_groups:
             tooltip_parts = [f"Group: {group.name}"]
             if "source_chain" in group.metadata:
@@ -254,51 +525,53 @@ class FileListWidget(QWidget):
             if "sequence_preview" in group.metadata:
                 tooltip_parts.append(f"Sequence: {group.metadata['sequence_preview']}")
 
-            group_item = QTreeWidgetItem([f"{group.name} ({group.count} structures)"])
-            group_item.setExpanded(True)
-            group_item.setData(0, self.GROUP_ID_ROLE, group.id)
-            group_item.setToolTip(0, "\n".join(tooltip_parts))
+            group_item = root.add_child(_FileTreeNode(
+                f"{group.name} ({group.count} structures)",
+                tooltip="\n".join(tooltip_parts),
+                group_id=group.id,
+                expanded=True,
+            ))
 
-            for file_path in group.members:
-                grouped_paths.add(file_path)
-                file_item = QTreeWidgetItem([Path(file_path).name])
-                file_item.setData(0, self.FILE_PATH_ROLE, file_path)
-                file_item.setToolTip(0, file_path)
-                group_item.addChild(file_item)
-
-            self._file_tree.addTopLevelItem(group_item)
+            grouped_paths.update(group.members)
+            group_item.add_children([
+                _file_node(file_path, os.path.basename(file_path))
+                for file_path in group.members
+            ])
 
         # --- Ungrouped files ---
-        ungrouped = [f for f in self._files if str(f) not in grouped_paths]
+        # Set difference against the folder's paths, then back into folder order
+        ungrouped_indices = sorted(
+            self._file_index[file_path]
+            for file_path in self._file_index.keys() - grouped_paths
+        )
+        ungrouped = [
+            (self._file_paths[i], self._file_names[i]) for i in ungrouped_indices
+        ]
         if ungrouped:
-            ungrouped_item = QTreeWidgetItem([f"Ungrouped ({len(ungrouped)} structures)"])
-            ungrouped_item.setExpanded(False)
-
-            for file_path in ungrouped:
-                file_item = QTreeWidgetItem([file_path.name])
-                file_item.setData(0, self.FILE_PATH_ROLE, str(file_path))
-                file_item.setToolTip(0, str(file_path))
-                ungrouped_item.addChild(file_item)
-
-            self._file_tree.addTopLevelItem(ungrouped_item)
+            # Starts collapsed, so its file nodes are only built when the
+            # view expands it (FileTreeModel.fetchMore)
+            ungrouped_item = root.add_child(
+                _FileTreeNode(f"Ungrouped ({len(ungrouped)} structures)")
+            )
+            ungrouped_item.pending = ungrouped
 
         # Update count
         total_groups = len(target_groups) + len(custom_groups)
         designated_count = len(grouped_paths)
-        file_count = len(self._files)
+        file_count = len(self._file_paths)
         self._count_label.setText(
             f"{file_count} file{'s' if file_count != 1 else ''}, "
             f"{designated_count} grouped in {total_groups} group{'s' if total_groups != 1 else ''}"
         )
 
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_clicked(self, index: QModelIndex):
         """Handle single click on a tree item."""
         # Single click just selects, doesn't load
         pass
 
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_double_clicked(self, index: QModelIndex):
         """Handle double click on a tree item."""
-        file_path = item.data(0, self.FILE_PATH_ROLE)
+        file_path = index.data(self.FILE_PATH_ROLE)
         if file_path:
             self.file_selected.emit(file_path)
 
@@ -308,9 +581,9 @@ class FileListWidget(QWidget):
         Returns:
             The selected file path, or None if nothing is selected.
         """
-        current_item = self._file_tree.currentItem()
-        if current_item:
-            return current_item.data(0, self.FILE_PATH_ROLE)
+        current = self._file_tree.currentIndex()
+        if current.isValid():
+            return current.data(self.FILE_PATH_ROLE)
         return None
 
     def select_file(self, file_path: str) -> None:
@@ -319,33 +592,10 @@ class FileListWidget(QWidget):
         Args:
             file_path: Path to the file to select.
         """
-        # Search recursively through tree
-        def find_item(parent_item: QTreeWidgetItem | None = None) -> QTreeWidgetItem | None:
-            if parent_item is None:
-                # Search top-level items
-                for i in range(self._file_tree.topLevelItemCount()):
-                    item = self._file_tree.topLevelItem(i)
-                    if item.data(0, self.FILE_PATH_ROLE) == file_path:
-                        return item
-                    # Check children
-                    result = find_item(item)
-                    if result:
-                        return result
-            else:
-                # Search children
-                for i in range(parent_item.childCount()):
-                    child = parent_item.child(i)
-                    if child.data(0, self.FILE_PATH_ROLE) == file_path:
-                        return child
-                    result = find_item(child)
-                    if result:
-                        return result
-            return None
-
-        item = find_item()
-        if item:
-            self._file_tree.setCurrentItem(item)
-            self._file_tree.scrollToItem(item)
+        index = self._model.index_for_path(file_path)
+        if index.isValid():
+            self._file_tree.setCurrentIndex(index)
+            self._file_tree.scrollTo(index)
 
     @property
     def current_folder(self) -> str | None:
@@ -355,7 +605,7 @@ class FileListWidget(QWidget):
     @property
     def file_count(self) -> int:
         """Get the number of files in the current folder."""
-        return len(self._files)
+        return len(self._file_paths)
 
     def get_all_file_paths(self) -> list[str]:
         """Get all file paths in the current folder.
@@ -363,7 +613,7 @@ class FileListWidget(QWidget):
         Returns:
             List of file path strings.
         """
-        return [str(f) for f in self._files]
+        return list(self._file_paths)
 
     def refresh_groups(self) -> None:
         """Refresh the tree display (call after groups are computed)."""
@@ -27,6 +27,7 @@ from src.config.settings import (
     DEFAULT_WINDOW_WIDTH,
     DEFAULT_WINDOW_HEIGHT,
     LEFT_PANEL_RATIO,
+    SUPPORTED_FORMATS,
 )
 from src.config.theme_manager import get_theme_manager
 from src.config.user_config import load_config, save_config, UserConfig
@@ -37,7 +38,7 @@ from src.ui.selection_panel import SelectionPanel
 from src.ui.metrics_table import MetricsTableWidget
 from src.ui.plot_panel import PlotPanel
 from src.ui.dialogs.target_dialog import TargetDesignationDialog
-from src.models.protein import Protein
+from src.models.protein import Protein, get_aligned_pdb_texts
 from src.models.metrics import MetricResult
 from src.models.metrics_store import MetricsStore, ProteinMetrics
 from src.models.grouping import GroupingManager
@@ -92,6 +93,51 @@ class BatchMetricWorker(QThread):
         self.finished.emit()
 
 
+class MetricsLoadWorker(QThread):
+    """Worker thread for parsing a folder's metrics JSON files."""
+
+    parsed = pyqtSignal(str, object)  # folder path, list[ProteinMetrics]
+
+    def __init__(
+        self,
+        store: MetricsStore,
+        folder_path: str,
+        json_files: list[Path],
+        pdb_file_paths: dict[str, str],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._store = store
+        self._folder_path = folder_path
+        self._json_files = json_files
+        self._pdb_file_paths = pdb_file_paths
+
+    def run(self):
+        proteins = self._store.parse_single_protein_jsons(
+            self._json_files, pdb_file_paths=self._pdb_file_paths
+        )
+        self.parsed.emit(self._folder_path, proteins)
+
+
+class StructureLoadWorker(QThread):
+    """Worker thread for parsing a structure file without blocking UI."""
+
+    loaded = pyqtSignal(str, object)  # file path, Protein
+    error = pyqtSignal(str, str)  # file path, error message
+
+    def __init__(self, file_path: str, parent=None):
+        super().__init__(parent)
+        self._file_path = file_path
+
+    def run(self):
+        try:
+            protein = Protein(self._file_path)
+            protein.load_structure()
+            self.loaded.emit(self._file_path, protein)
+        except Exception as e:
+            self.error.emit(self._file_path, str(e))
+
+
 class MainWindow(QMainWindow):
     """Main application window with file list, metrics table, protein viewer, and selection panel."""
 
@@ -102,6 +148,9 @@ class MainWindow(QMainWindow):
         self._current_folder: str | None = None
         self._metric_worker: MetricCalculationWorker | None = None
         self._batch_worker: BatchMetricWorker | None = None
+        self._metrics_load_worker: MetricsLoadWorker | None = None
+        self._structure_load_worker: StructureLoadWorker | None = None
+        self._loading_file_path: str | None = None
         self._metrics_store = MetricsStore()
         self._grouping_manager = GroupingManager()
         self._user_config = load_config()
@@ -203,6 +252,11 @@ class MainWindow(QMainWindow):
         import_json_action.triggered.connect(self._on_import_json)
         import_menu.addAction(import_json_action)
 
+        import_npz_action = QAction("From &NumPy Archive...", self)
+        import_npz_action.setStatusTip("Import metrics saved as a NumPy archive")
+        import_npz_action.triggered.connect(self._on_import_npz)
+        import_menu.addAction(import_npz_action)
+
         # Export submenu
         export_menu = file_menu.addMenu("&Export Metrics")
 
@@ -216,6 +270,11 @@ class MainWindow(QMainWindow):
         export_json_action.triggered.connect(self._on_export_json)
         export_menu.addAction(export_json_action)
 
+        export_npz_action = QAction("To &NumPy Archive...", self)
+        export_npz_action.setStatusTip("Export metrics to a NumPy archive for fast re-opening")
+        export_npz_action.triggered.connect(self._on_export_npz)
+        export_menu.addAction(export_npz_action)
+
         export_menu.addSeparator()
 
         export_filtered_fasta_action = QAction("Filtered Sequences to &FASTA...", self)
@@ -432,7 +491,7 @@ class MainWindow(QMainWindow):
         dialog.setFileMode(QFileDialog.FileMode.Directory)
         dialog.setOption(QFileDialog.Option.ShowDirsOnly, False)
         dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
-        dialog.setNameFilters(["Protein files (*.pdb *.cif)", "JSON files (*.json)", "All files (*)"])
+        dialog.setNameFilters(["Protein files (*.pdb *.cif *.bcif)", "JSON files (*.json)", "All files (*)"])
 
         if dialog.exec() == QFileDialog.DialogCode.Accepted:
             folder = dialog.selectedFiles()[0]
@@ -448,6 +507,7 @@ class MainWindow(QMainWindow):
         """Handle clear viewer action."""
         self._viewer.clear()
         self._current_protein = None
+        self._loading_file_path = None
         self._selection_panel.clear_state()
 
     def _on_file_selected(self, file_path: str):
@@ -466,23 +526,52 @@ class MainWindow(QMainWindow):
         """
         logger.debug(f"MainWindow._load_protein: loading {file_path}")
         self._statusbar.showMessage(f"Loading: {file_path}")
+        self._loading_file_path = file_path
 
-        # Load protein model FIRST (before viewer emits structure_loaded signal)
-        # This fixes race condition where signal fires before _current_protein is set
-        try:
-            self._current_protein = Protein(file_path)
-            # Pre-load structure for faster metric calculation
-            _ = self._current_protein.structure
-            logger.debug(f"MainWindow._load_protein: Protein model created successfully")
-        except Exception as e:
-            logger.error(f"MainWindow._load_protein: failed to create Protein model: {e}")
-            self._statusbar.showMessage(f"Warning: Could not load structure model: {e}")
-            self._current_protein = None
+        # Parse the structure off the UI thread; the viewer is only loaded
+        # once the Protein model is ready, so its structure_loaded signal
+        # always finds a valid _current_protein
+        worker = StructureLoadWorker(file_path, parent=self)
+        worker.loaded.connect(self._on_protein_loaded)
+        worker.error.connect(self._on_protein_load_error)
+        worker.finished.connect(worker.deleteLater)
+        self._structure_load_worker = worker
+        worker.start()
+
+    def _on_protein_loaded(self, file_path: str, protein: Protein) -> None:
+        """Show a structure parsed by the structure load worker.
+
+        Args:
+            file_path: Path to the structure file.
+            protein: Protein with its structure loaded.
+        """
+        if file_path != self._loading_file_path:
+            # Another file was selected while this one was parsed
+            return
+        self._loading_file_path = None
+        self._current_protein = protein
+        logger.debug(f"MainWindow._load_protein: Protein model created successfully")
 
-        # Now load in viewer (structure_loaded signal will have valid _current_protein)
         logger.debug(f"MainWindow._load_protein: calling viewer.load_structure()")
         self._viewer.load_structure(file_path)
 
+    def _on_protein_load_error(self, file_path: str, message: str) -> None:
+        """Show a structure whose Protein model could not be loaded.
+
+        Args:
+            file_path: Path to the structure file.
+            message: Error message from the worker.
+        """
+        if file_path != self._loading_file_path:
+            return
+        self._loading_file_path = None
+        logger.error(f"MainWindow._load_protein: failed to create Protein model: {message}")
+        self._statusbar.showMessage(f"Warning: Could not load structure model: {message}")
+        self._current_protein = None
+
+        # The viewer may still be able to display the file
+        self._viewer.load_structure(file_path)
+
     def _on_folder_changed(self, folder_path: str):
         """Handle folder change.
 
@@ -527,20 +616,30 @@ class MainWindow(QMainWindow):
             stem = Path(file_path).stem
             protein_stems[stem] = file_path
 
-        # Try to load metrics from each JSON file
-        loaded_count = 0
-        for json_file in json_files:
-            json_stem = json_file.stem
-            # Try to find matching PDB/CIF file
-            pdb_file_path = protein_stems.get(json_stem)
+        # Parse the JSON files in parallel off the UI thread, naming each by
+        # its matching structure file when there is one
+        worker = MetricsLoadWorker(
+            self._metrics_store, folder_path, json_files, protein_stems, parent=self
+        )
+        worker.parsed.connect(self._on_auto_load_finished)
+        worker.finished.connect(worker.deleteLater)
+        self._metrics_load_worker = worker
+        worker.start()
+        self._statusbar.showMessage(f"Reading metrics from {len(json_files)} JSON file(s)...")
 
-            if self._metrics_store.load_single_protein_json(str(json_file), pdb_file_path):
-                loaded_count += 1
+    def _on_auto_load_finished(self, folder_path: str, proteins: list[ProteinMetrics]) -> None:
+        """Add the metrics parsed by the auto-load worker to the store.
 
-        logger.info(
-            f"Auto-load metrics: {loaded_count} of {len(json_files)} JSON files "
-            f"matched protein files ({len(protein_stems)} proteins in folder)"
-        )
+        Args:
+            folder_path: Folder the JSON files were found in.
+            proteins: Parsed proteins.
+        """
+        if folder_path != self._current_folder:
+            # The user moved on to another folder while the files were parsed
+            return
+
+        loaded_count = self._metrics_store.extend(proteins)
+        logger.info(f"Auto-load metrics: {loaded_count} JSON files in {folder_path} held metrics")
 
         if loaded_count > 0:
             self._metrics_table.set_store(self._metrics_store)
@@ -549,6 +648,10 @@ class MainWindow(QMainWindow):
                 f"Loaded {self._file_list.file_count} file(s), "
                 f"auto-imported {loaded_count} metrics from JSON"
             )
+        else:
+            self._statusbar.showMessage(
+                f"Loaded {self._file_list.file_count} file(s) from {folder_path}"
+            )
 
     def _load_proteins_with_progress(
         self, file_paths: list[str], label: str = "Loading structures..."
@@ -608,11 +711,10 @@ class MainWindow(QMainWindow):
             logger.debug(f"MainWindow._on_structure_loaded: chains = {chains}")
 
             # Get chain lengths from sequence
-            sequence = self._current_protein.get_sequence()
-            chain_lengths: dict[str, int] = {}
-            for res in sequence:
-                chain = res.get("chain", "")
-                chain_lengths[chain] = chain_lengths.get(chain, 0) + 1
+            chain_lengths = {
+                chain: len(seq)
+                for chain, seq in self._current_protein.get_chain_sequences().items()
+            }
 
             self._selection_panel.set_chains(chains, chain_lengths)
 
@@ -770,14 +872,14 @@ class MainWindow(QMainWindow):
         """Find and load a protein structure file by name.
 
         Looks up the file path from the metrics store first, then falls back
-        to searching the current folder for matching .pdb/.cif files.
+        to searching the current folder for matching .pdb/.cif/.bcif files.
         """
         protein_data = self._metrics_store.get_protein(name)
         if protein_data and protein_data.file_path:
             self._load_protein(protein_data.file_path)
             return
         if self._current_folder:
-            for ext in [".pdb", ".cif"]:
+            for ext in SUPPORTED_FORMATS:
                 file_path = Path(self._current_folder) / f"{name}{ext}"
                 if file_path.exists():
                     self._load_protein(str(file_path))
@@ -830,6 +932,24 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Import Error", f"Failed to import JSON: {e}")
 
+    def _on_import_npz(self):
+        """Handle Import > NumPy Archive action."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Import Metrics from NumPy Archive",
+            "",
+            "NumPy Archives (*.npz);;All Files (*)",
+        )
+        if file_path:
+            try:
+                count = self._metrics_store.load_npz(file_path)
+                self._metrics_table.set_store(self._metrics_store)
+                self._plot_panel.set_store(self._metrics_store)
+                self._left_tabs.setCurrentWidget(self._metrics_table)
+                self._statusbar.showMessage(f"Imported {count} proteins from NumPy archive")
+            except Exception as e:
+                QMessageBox.critical(self, "Import Error", f"Failed to import archive: {e}")
+
     def _on_export_csv(self):
         """Handle Export > CSV action."""
         if self._metrics_store.count == 0:
@@ -868,6 +988,25 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Export Error", f"Failed to export JSON: {e}")
 
+    def _on_export_npz(self):
+        """Handle Export > NumPy Archive action."""
+        if self._metrics_store.count == 0:
+            QMessageBox.warning(self, "Export", "No metrics data to export")
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Metrics to NumPy Archive",
+            "",
+            "NumPy Archives (*.npz);;All Files (*)",
+        )
+        if file_path:
+            try:
+                self._metrics_store.save_npz(file_path)
+                self._statusbar.showMessage(f"Exported metrics to {file_path}")
+            except Exception as e:
+                QMessageBox.critical(self, "Export Error", f"Failed to export archive: {e}")
+
     def _on_export_filtered_fasta(self):
         """Handle Export > Filtered Sequences to FASTA."""
         filtered_names = self._metrics_table.get_filtered_protein_names()
@@ -894,16 +1033,10 @@ class MainWindow(QMainWindow):
                         continue
                     try:
                         protein = Protein(protein_path)
-                        sequence = protein.get_sequence()
-                        if not sequence:
+                        chain_seqs = protein.get_chain_sequences()
+                        if not chain_seqs:
                             continue
-                        # Group by chain
-                        chains: dict[str, list[str]] = {}
-                        for res in sequence:
-                            chain = res.get("chain", "")
-                            chains.setdefault(chain, []).append(res.get("one_letter", "X"))
-                        for chain_id, letters in chains.items():
-                            seq_str = "".join(letters)
+                        for chain_id, seq_str in chain_seqs.items():
                             f.write(f">{name}|chain_{chain_id}\n")
                             for i in range(0, len(seq_str), 60):
                                 f.write(f"{seq_str[i:i+60]}\n")
@@ -933,19 +1066,7 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            # Build filtered store and save
-            metric_names = self._metrics_store.metric_names
-            with open(file_path, "w") as f:
-                f.write("name," + ",".join(metric_names) + "\n")
-                for name in filtered_names:
-                    protein = self._metrics_store.get_protein(name)
-                    if not protein:
-                        continue
-                    values = [
-                        f"{protein.get_metric(m):.4f}" if protein.has_metric(m) else ""
-                        for m in metric_names
-                    ]
-                    f.write(f"{name},{','.join(values)}\n")
+            self._metrics_store.save_csv(file_path, names=filtered_names)
             self._statusbar.showMessage(
                 f"Exported {len(filtered_names)} filtered proteins to {file_path}"
             )
@@ -969,7 +1090,7 @@ class MainWindow(QMainWindow):
 
         # Search current folder
         if self._current_folder:
-            for ext in [".pdb", ".cif"]:
+            for ext in SUPPORTED_FORMATS:
                 path = Path(self._current_folder) / f"{name}{ext}"
                 if path.exists():
                     return str(path)
@@ -1040,7 +1161,7 @@ class MainWindow(QMainWindow):
             # Find the file path
             file_path = None
             if self._current_folder:
-                for ext in [".pdb", ".cif"]:
+                for ext in SUPPORTED_FORMATS:
                     path = Path(self._current_folder) / f"{name}{ext}"
                     if path.exists():
                         file_path = str(path)
@@ -1536,6 +1657,7 @@ class MainWindow(QMainWindow):
             dialog: The comparison dialog with user selections.
         """
         align_chain = dialog.align_chain
+        rmsd_cutoff = dialog.rmsd_cutoff
         comparison_files = dialog.comparison_files
         colors = dialog.get_comparison_colors()
 
@@ -1545,28 +1667,62 @@ class MainWindow(QMainWindow):
         # Clear previous comparison models
         self._viewer.clear_comparison_models()
 
+        # Load every structure first, then superimpose them all in one batch
+        errors: dict[int, str] = {}
+        mobiles: list[Protein] = []
+        mobile_indices: list[int] = []
+        for i, file_path in enumerate(comparison_files):
+            try:
+                mobile = Protein(file_path)
+                mobile.load_structure()
+            except Exception as e:
+                errors[i] = str(e)
+                continue
+            mobiles.append(mobile)
+            mobile_indices.append(i)
+
+        try:
+            pdb_texts, rmsds, align_errors = get_aligned_pdb_texts(
+                self._current_protein, mobiles, align_chain, rmsd_cutoff=rmsd_cutoff
+            )
+        except ValueError as e:
+            pdb_texts = [None] * len(mobiles)
+            rmsds = [float("nan")] * len(mobiles)
+            align_errors = [str(e)] * len(mobiles)
+        for k, i in enumerate(mobile_indices):
+            if align_errors[k] is not None:
+                errors[i] = align_errors[k]
+
         results = []
+        aligned = dict(zip(mobile_indices, zip(pdb_texts, rmsds)))
         for i, file_path in enumerate(comparison_files):
             name = Path(file_path).stem
             color = colors[i] if i < len(colors) else "#808080"
 
-            try:
-                mobile = Protein(file_path)
-                pdb_text, rmsd = mobile.get_aligned_pdb_text(
-                    self._current_protein, align_chain
-                )
-                self._viewer.add_comparison_structure(name, color, pdb_text)
-                results.append({"name": name, "rmsd": rmsd})
-                logger.info(f"Aligned {name} on chain {align_chain}: RMSD={rmsd:.3f}")
-            except Exception as e:
-                results.append({"name": name, "error": str(e)})
-                logger.warning(f"Failed to align {name}: {e}")
+            if i in errors:
+                results.append({"name": name, "error": errors[i]})
+                logger.warning(f"Failed to align {name}: {errors[i]}")
+                continue
+
+            pdb_text, rmsd = aligned[i]
+            rmsd = float(rmsd)
+            if pdb_text is None:
+                # Skipped: the RMSD lower bound is already above the cutoff
+                results.append({"name": name, "rmsd": rmsd, "above_cutoff": True})
+                logger.info(f"Skipped {name}: RMSD >= {rmsd:.3f} exceeds cutoff")
+                continue
+            self._viewer.add_comparison_structure(name, color, pdb_text)
+            results.append({"name": name, "rmsd": rmsd})
+            logger.info(f"Aligned {name} on chain {align_chain}: RMSD={rmsd:.3f}")
 
         # Show results summary
-        successful = [r for r in results if "rmsd" in r]
+        successful = [r for r in results if "rmsd" in r and not r.get("above_cutoff")]
+        skipped = [r for r in results if r.get("above_cutoff")]
         failed = [r for r in results if "error" in r]
 
         msg = f"Aligned {len(successful)} of {len(results)} structures on chain {align_chain}"
+        if skipped:
+            msg += f" ({len(skipped)} above RMSD cutoff)"
         if failed:
             msg += f" ({len(failed)} failed)"
         self._statusbar.showMessage(msg)
@@ -1704,13 +1860,12 @@ class MainWindow(QMainWindow):
             return False
 
         chains = self._current_protein.get_chains()
-        sequence = self._current_protein.get_sequence()
 
         # Get chain lengths
-        chain_lengths: dict[str, int] = {}
-        for res in sequence:
-            chain = res.get("chain", "")
-            chain_lengths[chain] = chain_lengths.get(chain, 0) + 1
+        chain_lengths = {
+            chain: len(seq)
+            for chain, seq in self._current_protein.get_chain_sequences().items()
+        }
 
         # Check for existing designation
         existing = self._grouping_manager.get_target_designation(file_path)
@@ -38,8 +38,15 @@ class MetricsTableModel(QAbstractTableModel):
         super().__init__(parent)
         self._store: MetricsStore = MetricsStore()
         self._proteins: list[ProteinMetrics] = []
+        # Lowercased names per row, reused by sorting and name filtering
+        self._names_lower: list[str] = []
         self._metric_columns: list[str] = []
 
+    @property
+    def store(self) -> MetricsStore:
+        """Get the metrics store backing the model."""
+        return self._store
+
     def set_store(self, store: MetricsStore) -> None:
         """Set the metrics store and refresh the model.
 
@@ -49,6 +56,7 @@ class MetricsTableModel(QAbstractTableModel):
         self.beginResetModel()
         self._store = store
         self._proteins = list(store)
+        self._names_lower = [p.name.lower() for p in self._proteins]
         self._metric_columns = store.metric_names
         self.endResetModel()
 
@@ -56,6 +64,7 @@ class MetricsTableModel(QAbstractTableModel):
         """Refresh data from the store."""
         self.beginResetModel()
         self._proteins = list(self._store)
+        self._names_lower = [p.name.lower() for p in self._proteins]
         self._metric_columns = self._store.metric_names
         self.endResetModel()
 
@@ -100,7 +109,7 @@ class MetricsTableModel(QAbstractTableModel):
         elif role == Qt.ItemDataRole.UserRole:
             # Return raw value for sorting
             if col == 0:
-                return protein.name.lower()
+                return self._names_lower[row]
             else:
                 metric_name = self._metric_columns[col - 1]
                 value = protein.get_metric(metric_name)
@@ -144,6 +153,17 @@ class MetricsTableModel(QAbstractTableModel):
             return self._proteins[row]
         return None
 
+    def get_name_lower_at_row(self, row: int) -> str:
+        """Get the cached lowercase protein name at a specific row.
+
+        Args:
+            row: Row index (must be valid).
+
+        Returns:
+            Lowercased protein name.
+        """
+        return self._names_lower[row]
+
     def get_column_name(self, col: int) -> str | None:
         """Get the column name.
 
@@ -167,6 +187,23 @@ class MetricsSortFilterModel(QSortFilterProxyModel):
         super().__init__(parent)
         self._name_filter: str = ""
         self._metric_filters: dict[str, tuple[float | None, float | None]] = {}
+        # Names passing all metric filters, computed in one vectorized store
+        # query on first use; None means stale
+        self._metric_matches: set[str] | None = None
+
+    def setSourceModel(self, source_model) -> None:
+        """Set the source model, dropping cached matches whenever it resets."""
+        old_model = self.sourceModel()
+        if old_model is not None:
+            old_model.modelAboutToBeReset.disconnect(self._invalidate_metric_matches)
+        super().setSourceModel(source_model)
+        if source_model is not None:
+            source_model.modelAboutToBeReset.connect(self._invalidate_metric_matches)
+        self._metric_matches = None
+
+    def _invalidate_metric_matches(self) -> None:
+        """Mark the cached metric-filter matches as stale."""
+        self._metric_matches = None
 
     def set_name_filter(self, pattern: str) -> None:
         """Set the name filter pattern.
@@ -194,12 +231,14 @@ class MetricsSortFilterModel(QSortFilterProxyModel):
             self._metric_filters.pop(metric_name, None)
         else:
             self._metric_filters[metric_name] = (min_val, max_val)
+        self._metric_matches = None
         self.invalidateFilter()
 
     def clear_filters(self) -> None:
         """Clear all filters."""
         self._name_filter = ""
         self._metric_filters.clear()
+        self._metric_matches = None
         self.invalidateFilter()
 
     def filterAcceptsRow(
@@ -216,17 +255,18 @@ class MetricsSortFilterModel(QSortFilterProxyModel):
             return False
 
         # Check name filter
-        if self._name_filter and self._name_filter not in protein.name.lower():
+        if (
+            self._name_filter
+            and self._name_filter not in source_model.get_name_lower_at_row(source_row)
+        ):
             return False
 
-        # Check metric filters
-        for metric_name, (min_val, max_val) in self._metric_filters.items():
-            value = protein.get_metric(metric_name)
-            if value is None:
-                return False
-            if min_val is not None and value < min_val:
-                return False
-            if max_val is not None and value > max_val:
+        # Check metric filters against one vectorized store query
+        if self._metric_filters:
+            if self._metric_matches is None:
+                matches = source_model.store.filter_by_metrics(self._metric_filters)
+                self._metric_matches = {p.name for p in matches}
+            if protein.name not in self._metric_matches:
                 return False
 
         return True
@@ -313,6 +353,11 @@ class FilterWidget(QWidget):
         else:
             self.filter_changed.emit(self._metric_name, None, None)
 
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the filter is enabled."""
+        return self._enabled
+
     def set_range(self, min_val: float, max_val: float) -> None:
         """Set the suggested range for this filter.
 
@@ -473,31 +518,49 @@ class MetricsTableWidget(QWidget):
         self._update_status()
 
     def _update_metric_filters(self) -> None:
-        """Update metric filter widgets based on available metrics."""
-        # Clear existing filters
-        for widget in self._filter_widgets.values():
-            self._metric_filters_layout.removeWidget(widget)
-            widget.deleteLater()
-        self._filter_widgets.clear()
-
-        # Add filters for each metric
-        for metric_name in self._store.metric_names:
-            widget = FilterWidget(metric_name, self)
-            widget.filter_changed.connect(self._on_metric_filter_changed)
-
-            # Set suggested range from data
-            stats = self._store.get_metric_stats(metric_name)
-            if stats["min"] is not None and stats["max"] is not None:
-                widget.set_range(stats["min"], stats["max"])
-
-            self._filter_widgets[metric_name] = widget
-            self._metric_filters_layout.addWidget(widget)
-
-        # Calculate max label width and apply to all widgets for alignment
-        if self._filter_widgets:
-            max_width = max(w.get_label_width_hint() for w in self._filter_widgets.values())
-            for widget in self._filter_widgets.values():
-                widget.set_label_width(max_width)
+        """Update metric filter widgets based on available metrics.
+
+        Widgets of metrics that are still present are kept, so a refresh
+        only constructs widgets for new metrics and an enabled filter keeps
+        the range the user entered.
+        """
+        metric_names = self._store.metric_names
+        self._filters_container.setUpdatesEnabled(False)
+        try:
+            # Drop widgets of metrics that are gone
+            for metric_name in set(self._filter_widgets) - set(metric_names):
+                widget = self._filter_widgets.pop(metric_name)
+                self._metric_filters_layout.removeWidget(widget)
+                widget.deleteLater()
+
+            for metric_name in metric_names:
+                widget = self._filter_widgets.get(metric_name)
+                if widget is None:
+                    widget = FilterWidget(metric_name, self)
+                    widget.filter_changed.connect(self._on_metric_filter_changed)
+                    self._filter_widgets[metric_name] = widget
+                elif widget.is_enabled:
+                    continue
+
+                # Set suggested range from data
+                stats = self._store.get_metric_stats(metric_name)
+                if stats["min"] is not None and stats["max"] is not None:
+                    widget.set_range(stats["min"], stats["max"])
+
+            # Re-add in metric order; moving existing widgets is cheap
+            # compared to constructing them again
+            for metric_name in metric_names:
+                widget = self._filter_widgets[metric_name]
+                self._metric_filters_layout.removeWidget(widget)
+                self._metric_filters_layout.addWidget(widget)
+
+            # Calculate max label width and apply to all widgets for alignment
+            if self._filter_widgets:
+                max_width = max(w.get_label_width_hint() for w in self._filter_widgets.values())
+                for widget in self._filter_widgets.values():
+                    widget.set_label_width(max_width)
+        finally:
+            self._filters_container.setUpdatesEnabled(True)
 
     def _update_status(self) -> None:
         """Update the status label."""
@@ -20,10 +20,34 @@ from src.config.color_schemes import (
     get_available_schemes,
 )
 from src.utils.file_utils import read_protein_file, get_file_format
+from src.models.protein import Protein
+
+try:
+    import orjson
+except ImportError:  # optional: faster escaping of structure text
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _js_literal(value: Any) -> str:
+    """Encode a value as a JavaScript literal for runJavaScript.
+
+    Structure files are passed to the page as string literals, so this runs
+    over the full text of every structure shown; orjson does it much faster
+    than json.dumps when installed.
+
+    Args:
+        value: JSON-serializable value.
+
+    Returns:
+        JSON text usable as a JavaScript expression.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
 # HTML template for the 3Dmol.js viewer with selection and coloring support
 VIEWER_HTML = """
 <!DOCTYPE html>
@@ -609,16 +633,21 @@ class ProteinViewer(QWidget):
             file_path: Path to the protein structure file.
         """
         try:
-            # Read the file contents
-            pdb_data = read_protein_file(file_path)
             file_format = get_file_format(file_path)
-
-            # Determine format string for 3Dmol
-            format_map = {".pdb": "pdb", ".cif": "cif"}
-            mol_format = format_map.get(file_format, "pdb")
+            if file_format == ".bcif":
+                # Binary file: pass the parsed structure on as mmCIF text
+                pdb_data = Protein(file_path).get_cif_text()
+                mol_format = "cif"
+            else:
+                # Read the file contents
+                pdb_data = read_protein_file(file_path)
+
+                # Determine format string for 3Dmol
+                format_map = {".pdb": "pdb", ".cif": "cif"}
+                mol_format = format_map.get(file_format, "pdb")
 
             # Escape the data for JavaScript
-            pdb_data_escaped = json.dumps(pdb_data)
+            pdb_data_escaped = _js_literal(pdb_data)
 
             # Load structure in the viewer
             js_code = f"loadStructure({pdb_data_escaped}, '{mol_format}');"
@@ -949,7 +978,7 @@ class ProteinViewer(QWidget):
             color: Hex color for the structure.
             pdb_text: PDB-format text of the aligned structure.
         """
-        pdb_escaped = json.dumps(pdb_text)
+        pdb_escaped = _js_literal(pdb_text)
         name_escaped = json.dumps(name)
         self._web_view.page().runJavaScript(
             f"addAlignedModel({pdb_escaped}, 'pdb', {name_escaped}, '{color}');"
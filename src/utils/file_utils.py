@@ -1,6 +1,7 @@
 """File handling utilities for protein structure files."""
 
 import logging
+import os
 from pathlib import Path
 
 from src.config.settings import SUPPORTED_FORMATS, MAX_FILE_SIZE_WARNING
@@ -29,10 +30,15 @@ def get_protein_files(directory: str | Path) -> list[Path]:
     if not directory.is_dir():
         raise NotADirectoryError(f"Path is not a directory: {directory}")
 
-    protein_files = []
-    for file_path in directory.iterdir():
-        if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_FORMATS:
-            protein_files.append(file_path)
+    # Same single lazy scandir pass as get_json_files: the extension check
+    # runs on the entry name, and only matching entries are stat'ed
+    with os.scandir(directory) as entries:
+        protein_files = [
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS
+            and entry.is_file()
+        ]
 
     result = sorted(protein_files, key=lambda p: p.name.lower())
     logger.info(f"Found {len(result)} protein files in {directory}")
@@ -60,10 +66,14 @@ def get_json_files(directory: str | Path) -> list[Path]:
     if not directory.is_dir():
         raise NotADirectoryError(f"Path is not a directory: {directory}")
 
-    json_files = []
-    for file_path in directory.iterdir():
-        if file_path.is_file() and file_path.suffix.lower() == ".json":
-            json_files.append(file_path)
+    # os.scandir exposes the entry name and type without building a Path per
+    # entry, which matters for prediction folders with many unrelated files
+    with os.scandir(directory) as entries:
+        json_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".json") and entry.is_file()
+        ]
 
     result = sorted(json_files, key=lambda p: p.name.lower())
     logger.info(f"Found {len(result)} JSON files in {directory}")
@@ -0,0 +1,11 @@
+"""Shared test fixtures."""
+
+import pytest
+
+import src.models.protein as protein_module
+
+
+@pytest.fixture(autouse=True)
+def no_structure_disk_cache(monkeypatch):
+    """Keep tests from writing to a structure disk cache outside tmp_path."""
+    monkeypatch.setattr(protein_module, "STRUCTURE_CACHE_DIR", None)
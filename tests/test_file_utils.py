@@ -7,6 +7,7 @@ import pytest
 
 from src.utils.file_utils import (
     get_protein_files,
+    get_json_files,
     validate_file_path,
     get_file_format,
     read_protein_file,
@@ -67,6 +68,15 @@ class TestGetProteinFiles:
 
         assert len(files) == 2
 
+    def test_ignores_directories_with_supported_suffix(self, tmp_path: Path):
+        """Test that directories named like structure files are skipped."""
+        (tmp_path / "protein.pdb").write_text("ATOM...")
+        (tmp_path / "outputs.cif").mkdir()
+
+        files = get_protein_files(tmp_path)
+
+        assert [f.name for f in files] == ["protein.pdb"]
+
     def test_empty_directory(self, tmp_path: Path):
         """Test that empty directory returns empty list."""
         files = get_protein_files(tmp_path)
@@ -87,6 +97,27 @@ class TestGetProteinFiles:
             get_protein_files(file_path)
 
 
+class TestGetJsonFiles:
+    """Tests for get_json_files function."""
+
+    def test_finds_json_files_only(self, tmp_path: Path):
+        """Test that only JSON files are returned, sorted by name."""
+        (tmp_path / "b_scores.json").write_text("{}")
+        (tmp_path / "A_scores.JSON").write_text("{}")
+        (tmp_path / "protein.pdb").write_text("ATOM...")
+        (tmp_path / "subdir.json").mkdir()
+
+        files = get_json_files(tmp_path)
+
+        assert [f.name for f in files] == ["A_scores.JSON", "b_scores.json"]
+        assert all(isinstance(f, Path) for f in files)
+
+    def test_raises_for_nonexistent_directory(self):
+        """Test that FileNotFoundError is raised for nonexistent directory."""
+        with pytest.raises(FileNotFoundError):
+            get_json_files("/nonexistent/path")
+
+
 class TestValidateFilePath:
     """Tests for validate_file_path function."""
 
@@ -125,6 +156,13 @@ class TestGetFileFormat:
 
         assert get_file_format(file_path) == ".cif"
 
+    def test_bcif_format(self, tmp_path: Path):
+        """Test BinaryCIF format detection."""
+        file_path = tmp_path / "protein.bcif"
+        file_path.write_bytes(b"\x80")
+
+        assert get_file_format(file_path) == ".bcif"
+
     def test_uppercase_extension(self, tmp_path: Path):
         """Test that uppercase extensions are normalized."""
         file_path = tmp_path / "protein.PDB"
@@ -10,6 +10,7 @@ from src.models.interface import (
     get_interface_residues,
     get_bidirectional_interface,
     count_interface_contacts,
+    to_one_letter,
 )
 from src.models.protein import Protein
 
@@ -79,6 +80,14 @@ class TestThreeToOneMapping:
             assert aa in THREE_TO_ONE
 
 
+    def test_to_one_letter_matches_dict(self):
+        """Test the vectorized mapping agrees with THREE_TO_ONE lookups."""
+        names = np.array(list(THREE_TO_ONE) + ["HOH", "UNK", "AAA", "ZZZ", ""])
+        expected = [THREE_TO_ONE.get(name, "X") for name in names]
+        assert to_one_letter(names).tolist() == expected
+        assert to_one_letter(np.array([], dtype="U3")).size == 0
+
+
 class TestGetInterfaceResidues:
     """Tests for interface residue identification."""
 
@@ -190,6 +199,16 @@ class TestInterfaceContacts:
             assert isinstance(count, int)
             assert count > 0
 
+    def test_contacts_cover_interface_residues(self, protein):
+        """Test contact counts are reported for exactly the interface residues."""
+        for cutoff in (3.5, 4.0, 10.0):
+            residues = get_interface_residues(protein.structure, "B", ["A"], cutoff)
+            contacts = count_interface_contacts(protein.structure, "B", ["A"], cutoff)
+            assert list(contacts) == list(residues)
+
+        contacts = count_interface_contacts(protein.structure, "B", ["A"], 100.0)
+        assert contacts == {1: 5 * 14, 2: 5 * 14}
+
 
 class TestProteinInterfaceMethods:
     """Tests for Protein class interface methods."""
@@ -231,3 +250,58 @@ class TestProteinInterfaceMethods:
 
         assert "A" in chains
         assert "B" in chains
+
+    def test_protein_methods_match_module_functions(self, protein):
+        """Test the cached amino acid mask gives the uncached results."""
+        for cutoff in (4.0, 10.0):
+            assert protein.get_interface_residues("B", ["A"], cutoff) == (
+                get_interface_residues(protein.structure, "B", ["A"], cutoff)
+            )
+            assert protein.get_interface_contacts("B", ["A"], cutoff) == (
+                count_interface_contacts(protein.structure, "B", ["A"], cutoff)
+            )
+
+    def test_residue_info_copies_are_independent(self, protein):
+        """Test callers cannot modify the cached residue list."""
+        info = protein.get_residue_info()
+        info[0]["name"] = "XXX"
+        info.clear()
+
+        assert protein.get_residue_info()[0]["name"] == "ALA"
+        protein.unload()
+        assert protein._residues is None and protein._aa_mask is None
+
+    def test_interface_search_shared_and_cached(self, protein):
+        """Test residues and contacts come from one cached search per query."""
+        residues = protein.get_interface_residues("B", ["A"], 10.0)
+        assert len(protein._interface_cache) == 1
+        contacts = protein.get_interface_contacts("B", ["A"], 10.0)
+        assert len(protein._interface_cache) == 1
+        assert list(contacts) == list(residues)
+
+        residues[999] = "X"
+        assert 999 not in protein.get_interface_residues("B", ["A"], 10.0)
+
+        protein.get_interface_contacts("B", ["A"], 4.0)
+        assert len(protein._interface_cache) == 2
+        protein.unload()
+        assert protein._interface_cache == {}
+
+    def test_sequence_array_matches_sequence(self, protein):
+        """Test the record array holds the same columns as get_sequence."""
+        sequence = protein.get_sequence()
+        array = protein.get_sequence_array()
+
+        assert array.id.tolist() == [r["id"] for r in sequence]
+        assert array.name.tolist() == [r["name"] for r in sequence]
+        assert array.one_letter.tolist() == [r["one_letter"] for r in sequence]
+        assert array.chain.tolist() == [r["chain"] for r in sequence]
+
+    def test_chain_sequences(self, protein):
+        """Test per-chain one-letter sequences in order of appearance."""
+        chain_seqs = protein.get_chain_sequences()
+        assert chain_seqs == {"A": "AGL", "B": "VS"}
+        assert list(chain_seqs) == ["A", "B"]
+
+        chain_seqs["A"] = ""
+        assert protein.get_chain_sequences()["A"] == "AGL"
@@ -4,6 +4,8 @@ import json
 import pytest
 from pathlib import Path
 
+from biotite.structure import filter_amino_acids
+
 from src.models.protein import Protein
 from src.models.metrics import (
     MetricResult,
@@ -114,6 +116,17 @@ class TestPLDDTExtraction:
         # 1UBQ has B-factors (not AlphaFold pLDDT, but still extracted)
         assert len(result.values) > 0
 
+    def test_plddt_matches_ca_bfactors_exactly(self, protein):
+        """Test that pLDDT values are the CA B-factors without rounding."""
+        result = protein.get_plddt()
+        structure = protein.structure[filter_amino_acids(protein.structure)]
+        ca_atoms = structure[structure.atom_name == "CA"]
+
+        assert result.values == {
+            int(res_id): float(b_factor)
+            for res_id, b_factor in zip(ca_atoms.res_id, ca_atoms.b_factor)
+        }
+
 
 class TestBFactorExtraction:
     """Tests for B-factor extraction."""
@@ -124,6 +137,17 @@ class TestBFactorExtraction:
         assert isinstance(result, MetricResult)
         assert result.name == "B-factor"
 
+    def test_bfactor_is_per_residue_mean(self, protein):
+        """Test that B-factor values average the atoms of each residue."""
+        result = protein.get_bfactor()
+        structure = protein.structure[filter_amino_acids(protein.structure)]
+        expected_ids = list(dict.fromkeys(structure.res_id.tolist()))
+
+        assert list(result.values) == expected_ids
+        for res_id in expected_ids[:10]:
+            expected = structure.b_factor[structure.res_id == res_id].mean()
+            assert result.values[res_id] == pytest.approx(expected)
+
     def test_bfactor_values_positive(self, protein):
         """Test that B-factor values are non-negative."""
         result = protein.get_bfactor()
@@ -181,6 +205,16 @@ class TestGetResidueInfo:
             assert isinstance(res_info["name"], str)
             assert isinstance(res_info["chain"], str)
 
+    def test_one_entry_per_residue(self, protein):
+        """Test each (id, chain) pair appears exactly once, in file order."""
+        info = get_residue_info(protein.structure)
+        keys = [(r["id"], r["chain"]) for r in info]
+        aa_structure = protein.structure[filter_amino_acids(protein.structure)]
+        expected = list(dict.fromkeys(
+            zip(aa_structure.res_id.tolist(), aa_structure.chain_id.tolist())
+        ))
+        assert keys == expected
+
 
 class TestAvailableMetrics:
     """Tests for available metrics registry."""
@@ -2,8 +2,10 @@
 
 import json
 import os
+import sys
 import tempfile
 
+import numpy as np
 import pytest
 from pathlib import Path
 
@@ -75,6 +77,13 @@ class TestProteinMetrics:
         assert pm.file_path == "/path/test.pdb"
         assert pm.metrics["rasa"] == 0.5
 
+    def test_uses_slots(self):
+        """Test that instances carry no per-instance __dict__."""
+        pm = ProteinMetrics(name="test")
+        assert not hasattr(pm, "__dict__")
+        with pytest.raises(AttributeError):
+            pm.extra = 1
+
 
 class TestMetricsStore:
     """Tests for MetricsStore class."""
@@ -117,6 +126,16 @@ class TestMetricsStore:
         assert "test" in store
         assert "rasa" in store.metric_names
 
+    def test_extend(self, store):
+        """Test bulk-adding proteins."""
+        added = store.extend([
+            ProteinMetrics(name="a", metrics={"rasa": 0.1}),
+            ProteinMetrics(name="b", metrics={"plddt": 90.0}),
+        ])
+        assert added == 2
+        assert store.count == 2
+        assert store.metric_names == ["plddt", "rasa"]
+
     def test_get_protein(self, store):
         """Test getting a protein."""
         pm = ProteinMetrics(name="test", metrics={"rasa": 0.5})
@@ -154,6 +173,39 @@ class TestMetricsStore:
         assert "rasa" in names
         assert "plddt" in names
 
+    def test_metric_names_follow_add_and_remove(self, populated_store):
+        """Test that metric names disappear once no protein carries them."""
+        populated_store.add_protein(ProteinMetrics(name="extra", metrics={"ptm": 0.5}))
+        populated_store.get_protein("protein1").set_metric("ptm", 0.7)
+        assert "ptm" in populated_store.metric_names
+
+        populated_store.remove_protein("extra")
+        assert "ptm" in populated_store.metric_names
+
+        # Re-adding protein1 without ptm releases its last reference
+        populated_store.add_protein(ProteinMetrics(name="protein1", metrics={"rasa": 0.1}))
+        assert populated_store.metric_names == ["plddt", "rasa"]
+
+        for name in ("protein1", "protein2", "protein3"):
+            populated_store.remove_protein(name)
+        assert populated_store.metric_names == []
+
+    def test_names_stay_sorted(self, populated_store):
+        """Test that name properties stay sorted through adds and removes."""
+        populated_store.extend([
+            ProteinMetrics(name="b_design", metrics={"zeta": 1.0}),
+            ProteinMetrics(name="a_design", metrics={"alpha": 1.0}),
+        ])
+        populated_store.add_protein(ProteinMetrics(name="c_design", metrics={}))
+        populated_store.remove_protein("protein2")
+        assert populated_store.protein_names == sorted(
+            ["a_design", "b_design", "c_design", "protein1", "protein3"]
+        )
+        assert populated_store.metric_names == ["alpha", "plddt", "rasa", "zeta"]
+
+        populated_store.remove_protein("a_design")
+        assert populated_store.metric_names == ["plddt", "rasa", "zeta"]
+
     def test_iteration(self, populated_store):
         """Test iterating over proteins."""
         proteins = list(populated_store)
@@ -205,6 +257,16 @@ class TestMetricsStore:
         results = populated_store.filter_by_metrics(filters)
         assert len(results) == 2
 
+    def test_filter_skips_missing_and_unknown_metrics(self, populated_store):
+        """Test that proteins without the metric never pass a filter."""
+        populated_store.add_protein(ProteinMetrics(name="protein4", metrics={"rasa": 0.7}))
+
+        results = populated_store.filter_by_metrics({"rasa": (0.5, None), "plddt": (None, None)})
+        assert sorted(p.name for p in results) == ["protein2", "protein3"]
+
+        assert populated_store.filter_by_metric_range("unknown", min_val=0.0) == []
+        assert populated_store.filter_by_metrics({"unknown": (None, None)}) == []
+
     # Sorting tests
 
     def test_get_sorted_by_name(self, populated_store):
@@ -225,6 +287,50 @@ class TestMetricsStore:
         results = populated_store.get_sorted("rasa", ascending=False)
         assert results[0].name == "protein3"  # rasa=0.9
 
+    def test_get_sorted_missing_metric_last(self, populated_store):
+        """Test that proteins without the metric sort last in both directions."""
+        populated_store.add_protein(ProteinMetrics(name="protein0", metrics={}))
+
+        results = populated_store.get_sorted("rasa", ascending=True)
+        assert results[-1].name == "protein0"
+
+        results = populated_store.get_sorted("rasa", ascending=False)
+        assert results[0].name == "protein3"
+        assert results[-1].name == "protein0"
+
+    def test_filter_by_name_after_remove(self, populated_store):
+        """Test that name filtering tracks added and removed proteins."""
+        populated_store.add_protein(ProteinMetrics(name="Design_A", metrics={}))
+        populated_store.remove_protein("protein1")
+
+        assert {p.name for p in populated_store.filter_by_name("PROTEIN")} == {
+            "protein2", "protein3"
+        }
+        assert [p.name for p in populated_store.filter_by_name("design")] == ["Design_A"]
+        assert len(populated_store.filter_by_name("")) == 3
+
+    def test_get_sorted_ties_and_removal(self, populated_store):
+        """Test that ties keep insertion order and removed rows disappear."""
+        populated_store.add_protein(ProteinMetrics(name="Protein0", metrics={"rasa": 0.6}))
+
+        results = populated_store.get_sorted("rasa", ascending=False)
+        assert [p.name for p in results] == ["protein3", "protein2", "Protein0", "protein1"]
+
+        populated_store.remove_protein("protein1")
+
+        results = populated_store.get_sorted("name")
+        assert [p.name for p in results] == ["Protein0", "protein2", "protein3"]
+
+        # Ties, filters and unknown metrics still follow insertion order
+        insertion_order = [p.name for p in populated_store]
+        assert insertion_order == ["protein2", "protein3", "Protein0"]
+        results = populated_store.get_sorted("rasa", ascending=False)
+        assert [p.name for p in results] == ["protein3", "protein2", "Protein0"]
+        results = populated_store.filter_by_metric_range("rasa", 0.5, 1.0)
+        assert [p.name for p in results] == insertion_order
+        results = populated_store.get_sorted("nonexistent")
+        assert [p.name for p in results] == insertion_order
+
     # I/O tests
 
     def test_load_csv(self, store):
@@ -246,11 +352,64 @@ class TestMetricsStore:
         finally:
             os.unlink(temp_path)
 
+    def test_load_csv_skips_empty_and_non_numeric(self, store):
+        """Test that empty and non-numeric cells are skipped per protein."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("name,rasa,plddt,label,dg\n")
+            f.write("protein1, 0.3 ,NA,good,-1.5e2\n")
+            f.write("protein2,,85.0,bad,n/a\n")
+            f.write(",0.9,90.0,x,1\n")
+            temp_path = f.name
+
+        try:
+            assert store.load_csv(temp_path) == 2
+            assert store.get_protein("protein1").metrics == {"rasa": 0.3, "dg": -150.0}
+            assert store.get_protein("protein2").metrics == {"plddt": 85.0}
+            assert "label" not in store.metric_names
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_csv_quoted_fields(self, store):
+        """Test that quoted names with commas go through the CSV parser."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write('\r\nname,rasa\r\n')
+            f.write('"design, v2",0.4\r\n')
+            f.write('\r\n')
+            f.write('protein2,"0.6",extra\r\n')
+            f.write('protein3\r\n')
+            temp_path = f.name
+
+        try:
+            assert store.load_csv(temp_path) == 3
+            assert store.get_protein("design, v2").get_metric("rasa") == 0.4
+            assert store.get_protein("protein2").get_metric("rasa") == 0.6
+            assert store.get_protein("protein3").metrics == {}
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_csv_empty_file(self, store):
+        """Test that a CSV without a header row is rejected."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("\n")
+            temp_path = f.name
+
+        try:
+            with pytest.raises(ValueError):
+                store.load_csv(temp_path)
+        finally:
+            os.unlink(temp_path)
+
     def test_load_csv_nonexistent(self, store):
         """Test loading from nonexistent CSV."""
         with pytest.raises(FileNotFoundError):
             store.load_csv("/nonexistent/path.csv")
 
+    def test_load_json_nonexistent(self, store):
+        """Test loading from nonexistent JSON files."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            store.load_json("/nonexistent/path.json")
+        assert store.load_single_protein_json("/nonexistent/path.json") is False
+
     def test_load_json(self, store):
         """Test loading from JSON."""
         data = {
@@ -286,6 +445,174 @@ class TestMetricsStore:
         finally:
             os.unlink(temp_path)
 
+    def test_load_json_skips_non_numeric_metrics(self, store):
+        """Test that strings and bools in metrics are not loaded."""
+        data = [
+            {"name": "protein1", "metrics": {"rasa": 1, "label": "x", "ok": True}},
+        ]
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(data, f)
+            temp_path = f.name
+
+        try:
+            store.load_json(temp_path)
+            p1 = store.get_protein("protein1")
+            assert p1.metrics == {"rasa": 1.0}
+            assert isinstance(p1.get_metric("rasa"), float)
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_json_with_nan(self, store, tmp_path):
+        """Test that NaN/Infinity tokens written by json.dump still load."""
+        single = tmp_path / "design.json"
+        single.write_text('{"plddt": NaN, "ptm": 0.8}')
+        assert store.load_single_protein_json(single) is True
+        metrics = store.get_protein("design").metrics
+        assert np.isnan(metrics["plddt"])
+        assert metrics["ptm"] == 0.8
+
+        path = tmp_path / "proteins.json"
+        path.write_text(
+            '[{"name": "p1", "metrics": {"rasa": NaN, "pae": Infinity}}]'
+        )
+        assert store.load_json(path) == 1
+        assert store.get_protein("p1").get_metric("pae") == float("inf")
+
+    def test_roundtrip_json_with_nan(self, store, tmp_path):
+        """Test that NaN metrics survive a JSON save and load."""
+        store.add_protein(ProteinMetrics(name="p1", metrics={"rasa": float("nan")}))
+        path = tmp_path / "out.json"
+        store.save_json(path)
+
+        loaded = MetricsStore()
+        assert loaded.load_json(path) == 1
+        assert np.isnan(loaded.get_protein("p1").get_metric("rasa"))
+
+    def test_roundtrip_csv_with_nan(self, store, tmp_path):
+        """Test that NaN metrics survive a CSV save and load."""
+        store.add_protein(ProteinMetrics(
+            name="p1", metrics={"plddt": 80.0, "rasa": float("nan")}
+        ))
+        store.add_protein(ProteinMetrics(name="p2", metrics={"plddt": 70.0}))
+        path = tmp_path / "out.csv"
+        store.save_csv(path)
+
+        loaded = MetricsStore()
+        assert loaded.load_csv(path) == 2
+        assert np.isnan(loaded.get_protein("p1").get_metric("rasa"))
+        assert loaded.get_protein("p2").metrics == {"plddt": 70.0}
+        assert loaded.get_metric_stats("rasa")["count"] == 1
+
+    def test_load_csv_nan_cell_among_text(self, store, tmp_path):
+        """Test that a "nan" cell is kept in a column with non-numeric text."""
+        path = tmp_path / "in.csv"
+        path.write_text("name,rasa\np1,nan\np2,NA\n")
+
+        assert store.load_csv(path) == 2
+        assert np.isnan(store.get_protein("p1").get_metric("rasa"))
+        assert store.get_protein("p2").metrics == {}
+
+    def test_load_single_protein_json_invalid(self, store):
+        """Test that malformed or non-object JSON files are rejected."""
+        for content in ("{not json", "[1, 2, 3]", '{"name": "x", "tag": "y"}'):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+                f.write(content)
+                temp_path = f.name
+
+            try:
+                assert store.load_single_protein_json(temp_path) is False
+            finally:
+                os.unlink(temp_path)
+        assert store.count == 0
+
+    def test_load_single_protein_json(self, store):
+        """Test loading a single-protein metrics file with leading whitespace."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('\n  {"name": "design_1", "ptm": 0.8, "iptm": 0.7}')
+            temp_path = f.name
+
+        try:
+            assert store.load_single_protein_json(temp_path) is True
+            assert store.get_protein("design_1").metrics == {"ptm": 0.8, "iptm": 0.7}
+            key = next(iter(store.get_protein("design_1").metrics))
+            assert key is sys.intern("ptm")
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_single_protein_jsons(self, store):
+        """Test loading a folder of single-protein JSON files in parallel."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for i in range(5):
+                path = Path(tmpdir) / f"design_{i}.json"
+                path.write_text(json.dumps({"ptm": i / 10}))
+                paths.append(path)
+            invalid = Path(tmpdir) / "notes.json"
+            invalid.write_text('{"comment": "none"}')
+            paths.append(invalid)
+
+            loaded = store.load_single_protein_jsons(
+                paths, pdb_file_paths={"design_0": "/data/model_0.pdb"}, max_workers=3
+            )
+
+        assert loaded == 5
+        assert store.protein_names == [
+            "design_1", "design_2", "design_3", "design_4", "model_0"
+        ]
+        assert store.get_protein("model_0").file_path == "/data/model_0.pdb"
+        assert store.get_protein("design_3").get_metric("ptm") == 0.3
+
+    def test_parse_single_protein_jsons_leaves_store(self, store):
+        """Test that parsing returns proteins in order without storing them."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for name in ["b", "skip", "a"]:
+                path = Path(tmpdir) / f"{name}.json"
+                payload = {"note": "x"} if name == "skip" else {"ptm": 0.5}
+                path.write_text(json.dumps(payload))
+                paths.append(path)
+
+            proteins = store.parse_single_protein_jsons(paths)
+
+        assert [p.name for p in proteins] == ["b", "a"]
+        assert store.count == 0
+
+    def test_single_protein_json_parse_reused(self, store, tmp_path):
+        """Test that unchanged files are not re-parsed and changed ones are."""
+        path = tmp_path / "design.json"
+        path.write_text(json.dumps({"ptm": 0.5}))
+
+        first = store._parse_single_protein_json(path)
+        first.set_metric("ptm", 0.9)
+        second = store._parse_single_protein_json(path)
+        assert second is not first
+        assert second.get_metric("ptm") == 0.5
+
+        path.write_text(json.dumps({"ptm": 0.75, "iptm": 0.6}))
+        assert store._parse_single_protein_json(path).metrics == {
+            "ptm": 0.75, "iptm": 0.6
+        }
+
+    def test_single_protein_json_cache_evicts_least_recent(self, tmp_path, monkeypatch):
+        """Test that the parse cache drops the least recently used file."""
+        monkeypatch.setattr(MetricsStore, "_JSON_CACHE_SIZE", 2)
+        store = MetricsStore()
+        paths = []
+        for name in ["a", "b", "c"]:
+            path = tmp_path / f"{name}.json"
+            path.write_text(json.dumps({"ptm": 0.5}))
+            paths.append(path)
+
+        store._parse_single_protein_json(paths[0])
+        store._parse_single_protein_json(paths[1])
+        store._parse_single_protein_json(paths[0])
+        store._parse_single_protein_json(paths[2])
+        assert list(store._parsed_json) == [str(paths[0]), str(paths[2])]
+
+        # A batch larger than the cache grows it to hold the whole batch
+        store.parse_single_protein_jsons(paths)
+        assert len(store._parsed_json) == 3
+
     def test_save_csv(self, populated_store):
         """Test saving to CSV."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
@@ -303,6 +630,43 @@ class TestMetricsStore:
         finally:
             os.unlink(temp_path)
 
+    def test_save_csv_contents(self, populated_store):
+        """Test that saved rows are name-sorted with blanks for missing metrics."""
+        populated_store.add_protein(ProteinMetrics(name="Alpha", metrics={"rasa": 1.23456}))
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            populated_store.save_csv(temp_path)
+            with open(temp_path, 'r') as f:
+                lines = f.read().splitlines()
+            assert lines[0] == "name,plddt,rasa"
+            assert lines[1] == "Alpha,,1.2346"
+            assert lines[2] == "protein1,70.0000,0.3000"
+        finally:
+            os.unlink(temp_path)
+
+    def test_save_csv_subset(self, populated_store):
+        """Test exporting selected proteins in the given order."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            populated_store.save_csv(temp_path, names=["protein3", "missing", "protein1"])
+            with open(temp_path, 'r') as f:
+                lines = f.read().splitlines()
+            assert lines == [
+                "name,plddt,rasa",
+                "protein3,95.0000,0.9000",
+                "protein1,70.0000,0.3000",
+            ]
+
+            populated_store.save_csv(temp_path, names=[])
+            with open(temp_path, 'r') as f:
+                assert f.read().splitlines() == ["name,plddt,rasa"]
+        finally:
+            os.unlink(temp_path)
+
     def test_save_json(self, populated_store):
         """Test saving to JSON."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -376,6 +740,201 @@ class TestMetricsStore:
         finally:
             os.unlink(temp_path)
 
+    def test_roundtrip_npz(self, populated_store):
+        """Test saving and loading NPZ preserves data, gaps and file paths."""
+        populated_store.add_protein(ProteinMetrics(
+            name="protein4",
+            file_path="/data/protein4.pdb",
+            metrics={"rasa": float("nan"), "ipTM": 0.8},
+        ))
+        populated_store.remove_protein("protein2")
+
+        with tempfile.NamedTemporaryFile(suffix='.npz', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            populated_store.save_npz(temp_path)
+
+            new_store = MetricsStore()
+            assert new_store.load_npz(temp_path) == 3
+
+            assert new_store.protein_names == populated_store.protein_names
+            assert new_store.metric_names == populated_store.metric_names
+            for name in populated_store.protein_names:
+                original = populated_store.get_protein(name)
+                loaded = new_store.get_protein(name)
+                assert loaded.file_path == original.file_path
+                assert loaded.metrics.keys() == original.metrics.keys()
+                for metric, value in original.metrics.items():
+                    assert loaded.get_metric(metric) == pytest.approx(value, nan_ok=True)
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_npz_errors(self, store):
+        """Test loading a missing or foreign NPZ file."""
+        with pytest.raises(FileNotFoundError):
+            store.load_npz("/nonexistent/metrics.npz")
+
+        with tempfile.NamedTemporaryFile(suffix='.npz', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            np.savez(temp_path, other=np.arange(3))
+            with pytest.raises(ValueError):
+                store.load_npz(temp_path)
+        finally:
+            os.unlink(temp_path)
+
+
+class TestColumnarStorage:
+    """Tests for the columnar metric storage kept in sync by MetricsStore."""
+
+    @pytest.fixture
+    def store(self):
+        store = MetricsStore()
+        store.extend(
+            ProteinMetrics(name=f"p{i}", metrics={"score": float(i)})
+            for i in range(100)
+        )
+        return store
+
+    def _column_values(self, store, metric):
+        column = store._metric_column(metric)
+        return {
+            store._row_proteins[i].name: column[i]
+            for i in range(len(column))
+            if not np.isnan(column[i])
+        }
+
+    def test_columns_match_proteins(self, store):
+        """Test that columns hold the same values as the protein dicts."""
+        assert self._column_values(store, "score") == {
+            p.name: p.get_metric("score") for p in store
+        }
+
+    def test_float32_columns(self):
+        """Test a float32 store filters, sorts and grows like the default."""
+        store = MetricsStore(dtype=np.float32)
+        assert store.dtype == np.float32
+        store.extend(
+            ProteinMetrics(name=f"p{i}", metrics={"rasa": i / 100})
+            for i in range(100)
+        )
+        store.add_protein(ProteinMetrics(name="extra", metrics={"plddt": 80.0}))
+
+        assert store._metric_column("rasa").dtype == np.float32
+        assert store._metric_column("plddt").dtype == np.float32
+        # Bounds are compared at column precision, so stored values still
+        # match the thresholds they were written as
+        names = {p.name for p in store.filter_by_metric_range("rasa", 0.3, 0.35)}
+        assert names == {f"p{i}" for i in range(30, 36)}
+        assert store.get_protein("p30").get_metric("rasa") == 0.3
+        assert store.get_sorted("rasa", ascending=False)[0].name == "p99"
+
+    def test_non_float_dtype_rejected(self):
+        """Test that columns cannot use a dtype without NaN."""
+        with pytest.raises(ValueError):
+            MetricsStore(dtype=np.int32)
+
+    def test_remove_keeps_columns_consistent(self, store):
+        """Test that removing a protein moves rows without losing values."""
+        store.remove_protein("p3")
+        store.remove_protein("p99")
+        values = self._column_values(store, "score")
+        assert len(values) == 98
+        assert "p3" not in values
+        assert values["p98"] == 98.0
+
+    def test_readd_replaces_row(self, store):
+        """Test that re-adding a protein clears its previous values."""
+        store.add_protein(ProteinMetrics(name="p5", metrics={"other": 1.0}))
+        assert "p5" not in self._column_values(store, "score")
+        assert self._column_values(store, "other") == {"p5": 1.0}
+
+    def test_set_metric_updates_columns(self, store):
+        """Test that set_metric on a stored protein updates the columns."""
+        store.get_protein("p7").set_metric("score", -1.0)
+        store.get_protein("p7").set_metric("new_metric", 2.0)
+        assert self._column_values(store, "score")["p7"] == -1.0
+        assert self._column_values(store, "new_metric") == {"p7": 2.0}
+        assert "new_metric" in store.metric_names
+
+    def test_extend_mixes_new_and_existing(self, store):
+        """Test that extend replaces stored rows and dedupes within a batch."""
+        added = store.extend([
+            ProteinMetrics(name="p1", metrics={"other": 5.0}),
+            ProteinMetrics(name="new", metrics={"score": 1.0}),
+            ProteinMetrics(name="new", metrics={"score": 2.0, "other": 3.0}),
+        ])
+        assert added == 3
+        assert store.count == 101
+        assert self._column_values(store, "score")["new"] == 2.0
+        assert "p1" not in self._column_values(store, "score")
+        assert self._column_values(store, "other") == {"p1": 5.0, "new": 3.0}
+        assert store._metric_counts["score"] == 100
+
+    def test_presence_mask_tracks_rows(self, store):
+        """Test that presence masks follow re-adds and swap-removes."""
+        store.add_protein(ProteinMetrics(name="p5", metrics={"other": 1.0}))
+        store.remove_protein("p0")
+        present = store._presence_mask("score")
+        assert int(present.sum()) == 98
+        assert not present[store._rows["p5"]]
+        both = {"score": (None, None), "other": (None, None)}
+        assert store.filter_by_metrics(both) == []
+        assert [p.name for p in store.filter_by_metric_range("other")] == ["p5"]
+
+    def test_stats_count_present_rows(self, store):
+        """Test that stats count proteins carrying the metric, even as NaN."""
+        store.add_protein(ProteinMetrics(name="nan_score", metrics={"score": float("nan")}))
+        stats = store.get_metric_stats("score")
+        assert stats["count"] == 101
+        assert stats["min"] == 0.0
+        assert stats["max"] == 99.0
+
+    def test_filter_by_metrics_narrows_in_order(self, store):
+        """Test chained range filters over a shrinking candidate set."""
+        for i in range(0, 100, 2):
+            store.get_protein(f"p{i}").set_metric("even", 1.0)
+        results = store.filter_by_metrics({
+            "score": (10.0, 60.0),
+            "even": (None, None),
+        })
+        assert [p.name for p in results] == [f"p{i}" for i in range(10, 61, 2)]
+        assert store.filter_by_metrics({"score": (50.0, None), "even": (2.0, None)}) == []
+
+    def test_unused_metric_column_dropped(self, store):
+        """Test that a metric's column goes away with its last carrier."""
+        store.add_protein(ProteinMetrics(name="solo", metrics={"rare": 1.0}))
+        store.remove_protein("solo")
+        assert store._metric_column("rare") is None
+        assert "rare" not in store.metric_names
+        assert store.filter_by_metric_range("rare") == []
+
+        store.get_protein("p1").set_metric("rare", 2.0)
+        assert self._column_values(store, "rare") == {"p1": 2.0}
+
+    def test_filter_by_metrics_selectivity_order(self):
+        """Test that selective filters run first without changing results."""
+        store = MetricsStore()
+        store.extend(
+            ProteinMetrics(name=f"p{i}", metrics={"wide": float(i), "narrow": float(i % 100)})
+            for i in range(2000)
+        )
+        filters = {"wide": (10.0, None), "narrow": (None, 1.0)}
+
+        bounded = [(name, lo, hi) for name, (lo, hi) in filters.items()]
+        rows = np.arange(2000)
+        assert store._order_by_selectivity(bounded, rows)[0][0] == "narrow"
+
+        expected = [f"p{i}" for i in range(10, 2000) if i % 100 <= 1]
+        assert [p.name for p in store.filter_by_metrics(filters)] == expected
+
+    def test_clear_resets_columns(self, store):
+        """Test that clear drops all columns."""
+        store.clear()
+        assert store._metric_column("score") is None
+
 
 class TestDictListScanning:
     """Tests for _scan_dict_list_for_metrics and related helpers."""
@@ -488,3 +1047,34 @@ class TestDictListScanning:
         metrics: dict[str, float] = {}
         store._scan_dict_list_for_metrics(items, "test", metrics, max_depth=0)
         assert metrics == {}
+
+    def test_numeric_list_summaries(self, store):
+        """Test mean/min/max summaries for numeric lists, per-residue or not."""
+        data = {
+            "plddt": [80, 90.0, 100],
+            "pae": [1.0, 3.0],
+            "mixed": [1.0, "x"],
+            "flags": [True, False],
+        }
+        metrics: dict[str, float] = {}
+        store._scan_json_for_metrics(data, "", metrics, num_residues=3)
+        assert metrics["plddt(per_res)_mean"] == 90.0
+        assert metrics["plddt(per_res)_min"] == 80.0
+        assert metrics["plddt(per_res)_max"] == 100.0
+        assert metrics["pae_mean"] == 2.0
+        assert not any(k.startswith(("mixed", "flags")) for k in metrics)
+
+    def test_scan_order_and_depth(self, store):
+        """Test that nested metrics keep document order and respect max_depth."""
+        data = {
+            "a": 1,
+            "nested": {"b": 2, "name": 5, "deeper": {"c": 3}},
+            "d": 4,
+        }
+        metrics: dict[str, float] = {}
+        store._scan_json_for_metrics(data, "", metrics)
+        assert list(metrics) == ["a", "nested.b", "nested.deeper.c", "d"]
+
+        metrics = {}
+        store._scan_json_for_metrics(data, "", metrics, max_depth=3)
+        assert list(metrics) == ["a", "nested.b", "d"]
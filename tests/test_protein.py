@@ -1,11 +1,14 @@
 """Tests for Protein model."""
 
+import os
 from pathlib import Path
 
 import numpy as np
 import pytest
 
-from src.models.protein import Protein
+import src.models.protein as protein_module
+from src.models.alignment import align_many_on_target_chain
+from src.models.protein import Protein, clear_structure_cache, get_aligned_pdb_texts
 
 
 # Path to sample protein file
@@ -80,6 +83,66 @@ class TestProteinStructure:
 
         assert protein.is_loaded is False
 
+    def test_structure_shared_between_instances(self):
+        """Test that two Proteins for the same file share one parsed structure."""
+        clear_structure_cache()
+        first = Protein(SAMPLE_PDB).structure
+        assert Protein(SAMPLE_PDB).structure is first
+
+        clear_structure_cache()
+        assert Protein(SAMPLE_PDB).structure is not first
+
+    def test_disk_cache_roundtrip(self, tmp_path, monkeypatch):
+        """Test that a structure reloaded from the disk cache is identical."""
+        monkeypatch.setattr(protein_module, "STRUCTURE_CACHE_DIR", tmp_path)
+        clear_structure_cache()
+        parsed = Protein(SAMPLE_PDB).structure
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+
+        clear_structure_cache()
+        cached = Protein(SAMPLE_PDB).structure
+        assert cached is not parsed
+        assert cached == parsed
+        np.testing.assert_array_equal(cached.box, parsed.box)
+
+        clear_structure_cache(disk=True)
+        assert list(tmp_path.glob("*.npz")) == []
+
+    def test_disk_cache_replaces_stale_entry(self, tmp_path, monkeypatch):
+        """Test that rewriting a file replaces its old disk cache entry."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(protein_module, "STRUCTURE_CACHE_DIR", cache_dir)
+        pdb_path = tmp_path / "copy.pdb"
+        pdb_path.write_bytes(Path(SAMPLE_PDB).read_bytes())
+        clear_structure_cache()
+        Protein(pdb_path).structure
+        first_entries = list(cache_dir.glob("*.npz"))
+        assert len(first_entries) == 1
+
+        stat = pdb_path.stat()
+        os.utime(pdb_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        clear_structure_cache()
+        Protein(pdb_path).structure
+        entries = list(cache_dir.glob("*.npz"))
+        assert len(entries) == 1
+        assert entries != first_entries
+
+    def test_load_bcif(self, tmp_path):
+        """Test that BinaryCIF files load the same atoms as the source PDB."""
+        import biotite.structure.io.pdbx as pdbx
+
+        reference = Protein(SAMPLE_PDB).structure
+        bcif_file = pdbx.BinaryCIFFile()
+        pdbx.set_structure(bcif_file, reference)
+        bcif_path = tmp_path / "1UBQ.bcif"
+        bcif_file.write(bcif_path)
+
+        protein = Protein(bcif_path)
+        assert protein.get_num_atoms() == len(reference)
+        np.testing.assert_allclose(protein.get_coordinates(), reference.coord, atol=1e-3)
+        np.testing.assert_allclose(protein.structure.b_factor, reference.b_factor, atol=1e-2)
+        assert "_atom_site" in protein.get_cif_text()
+
     def test_get_num_atoms(self):
         """Test get_num_atoms returns positive integer."""
         protein = Protein(SAMPLE_PDB)
@@ -108,6 +171,26 @@ class TestProteinStructure:
         assert len(chains) > 0
         assert all(isinstance(c, str) for c in chains)
 
+    def test_get_chains_cached_until_unload(self):
+        """Test chain IDs are computed once and dropped on unload."""
+        protein = Protein(SAMPLE_PDB)
+        chains = protein.get_chains()
+        chains.append("not-a-chain")
+
+        assert protein.get_chains() == chains[:-1]
+        protein.unload()
+        assert protein._chains is None
+        assert protein._ca_mask is None
+        assert protein.get_chains() == chains[:-1]
+
+    def test_get_chains_matches_unique(self):
+        """Test get_chains returns the sorted unique chain IDs."""
+        protein = Protein(SAMPLE_PDB)
+
+        assert protein.get_chains() == sorted(
+            np.unique(protein.structure.chain_id).tolist()
+        )
+
     def test_get_ca_atoms(self):
         """Test get_ca_atoms returns only CA atoms."""
         protein = Protein(SAMPLE_PDB)
@@ -126,6 +209,78 @@ class TestProteinStructure:
         assert coords.ndim == 2
         assert coords.shape[1] == 3  # x, y, z
 
+    def test_get_aligned_pdb_text_onto_self(self):
+        """Test aligning a structure onto itself gives zero RMSD."""
+        reference = Protein(SAMPLE_PDB)
+        mobile = Protein(SAMPLE_PDB)
+        chain = reference.get_chains()[0]
+
+        pdb_text, rmsd = mobile.get_aligned_pdb_text(reference, chain)
+
+        assert rmsd == pytest.approx(0.0, abs=1e-3)
+        assert "ATOM" in pdb_text
+
+    def test_get_aligned_pdb_texts_matches_single(self):
+        """Test batched alignment matches aligning one structure at a time."""
+        reference = Protein(SAMPLE_PDB)
+        mobile = Protein(SAMPLE_PDB)
+        chain = reference.get_chains()[0]
+
+        pdb_texts, rmsds, errors = get_aligned_pdb_texts(
+            reference, [mobile], chain
+        )
+        _, rmsd = mobile.get_aligned_pdb_text(reference, chain)
+
+        assert errors == [None]
+        assert "ATOM" in pdb_texts[0]
+        assert rmsds[0] == pytest.approx(rmsd, abs=1e-3)
+
+    def test_align_many_reports_unalignable(self):
+        """Test structures that cannot be aligned get an error, not an RMSD."""
+        reference = Protein(SAMPLE_PDB)
+        chain = reference.get_chains()[0]
+        structure = reference.structure
+        rotated = structure.copy()
+        angle = np.pi / 3
+        rotation = np.array([
+            [np.cos(angle), -np.sin(angle), 0.0],
+            [np.sin(angle), np.cos(angle), 0.0],
+            [0.0, 0.0, 1.0],
+        ])
+        rotated.coord = (structure.coord @ rotation + 5.0).astype(np.float32)
+        truncated = structure[structure.res_id > structure.res_id.min()]
+
+        aligned, rmsds, errors = align_many_on_target_chain(
+            structure, [rotated, truncated], chain
+        )
+
+        assert errors[0] is None
+        assert rmsds[0] == pytest.approx(0.0, abs=1e-3)
+        np.testing.assert_allclose(aligned[0].coord, structure.coord, atol=1e-3)
+        assert aligned[1] is None
+        assert np.isnan(rmsds[1])
+        assert "mismatch" in errors[1]
+
+    def test_align_many_skips_above_cutoff(self):
+        """Test structures provably above the RMSD cutoff are not superimposed."""
+        structure = Protein(SAMPLE_PDB).structure
+        chain = structure.chain_id[0]
+        scaled = structure.copy()
+        scaled.coord = scaled.coord * 1.5
+        shifted = structure.copy()
+        shifted.coord = shifted.coord + 3.0
+
+        aligned, rmsds, errors = align_many_on_target_chain(
+            structure, [scaled, shifted], chain, rmsd_cutoff=1.0
+        )
+        _, exact_rmsds, _ = align_many_on_target_chain(structure, [scaled], chain)
+
+        assert errors == [None, None]
+        assert aligned[0] is None
+        assert 1.0 < rmsds[0] <= exact_rmsds[0] + 1e-3
+        assert aligned[1] is not None
+        assert rmsds[1] == pytest.approx(0.0, abs=1e-3)
+
     def test_get_center_of_mass_shape(self):
         """Test get_center_of_mass returns 3D point."""
         protein = Protein(SAMPLE_PDB)
@@ -134,6 +289,17 @@ class TestProteinStructure:
         assert isinstance(center, np.ndarray)
         assert center.shape == (3,)
 
+    def test_get_center_of_mass_cached_copy(self):
+        """Test get_center_of_mass matches the coordinate mean and returns copies."""
+        protein = Protein(SAMPLE_PDB)
+        center = protein.get_center_of_mass()
+        np.testing.assert_allclose(center, protein.structure.coord.mean(axis=0))
+
+        center[:] = 0.0
+        np.testing.assert_allclose(
+            protein.get_center_of_mass(), protein.structure.coord.mean(axis=0)
+        )
+
 
 class TestProteinRepr:
     """Tests for Protein string representation."""